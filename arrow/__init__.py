@@ -1,5 +1,17 @@
+from typing import TYPE_CHECKING, Any
+
+from . import caches, instrumentation
 from ._version import __version__
-from .api import get, now, utcnow
+from .api import (
+    convert_many,
+    find_gaps,
+    get,
+    humanize_many,
+    now,
+    resample,
+    utcnow,
+    warmup,
+)
 from .arrow import Arrow
 from .factory import ArrowFactory
 from .formatter import (
@@ -15,15 +27,24 @@ from .formatter import (
     FORMAT_RSS,
     FORMAT_W3C,
 )
-from .parser import ParserError
+
+if TYPE_CHECKING:
+    from .parser import ParserError
 
 # https://mypy.readthedocs.io/en/stable/command_line.html#cmdoption-mypy-no-implicit-reexport
 # Mypy with --strict or --no-implicit-reexport requires an explicit reexport.
 __all__ = [
     "__version__",
+    "caches",
+    "instrumentation",
     "get",
     "now",
     "utcnow",
+    "resample",
+    "find_gaps",
+    "convert_many",
+    "humanize_many",
+    "warmup",
     "Arrow",
     "ArrowFactory",
     "FORMAT_ATOM",
@@ -39,3 +60,13 @@ __all__ = [
     "FORMAT_W3C",
     "ParserError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # the parser is only imported once it is needed, see arrow._lazy
+    if name == "ParserError":
+        from .parser import ParserError
+
+        return ParserError
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,78 @@
+"""Defers running a module's code until one of its attributes is first used."""
+
+import sys
+from _thread import RLock
+from importlib.machinery import ModuleSpec
+from importlib.util import find_spec, module_from_spec
+from types import ModuleType
+from typing import Any, cast
+
+
+class _LazyModule(ModuleType):
+    """A module that is executed the first time an attribute it does not have yet
+    is looked up, after which it becomes a plain module again."""
+
+    def __getattr__(self, name: str) -> Any:
+        spec = cast(ModuleSpec, self.__spec__)
+        state = spec.loader_state
+
+        with state["lock"]:
+            if state["loading"]:
+                # the module's own code, or a circular import, ran into it mid-load
+                raise AttributeError(
+                    f"partially initialized module {spec.name!r} has no attribute {name!r}"
+                )
+
+            if type(self) is _LazyModule:
+                state["loading"] = True
+                try:
+                    spec.loader.exec_module(self)  # type: ignore[union-attr]
+                finally:
+                    state["loading"] = False
+                self.__class__ = ModuleType  # type: ignore[assignment]
+
+        return getattr(self, name)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Returns the module ``name``, which is only executed once one of its
+    attributes is used.
+
+    The module is registered in ``sys.modules`` and on its parent package like a
+    regular import, so ``import`` statements and ``mock.patch`` targets resolve to
+    it.  Loading is thread-safe: other threads looking up an attribute wait until
+    the module has finished executing.
+
+    :param name: the absolute name of the module.
+
+    """
+
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    spec.loader_state = {"lock": RLock(), "loading": False}
+    module = module_from_spec(spec)
+    module.__class__ = _LazyModule
+    sys.modules[name] = module
+
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+
+    return module
+
+
+def load(module: ModuleType) -> None:
+    """Executes a module returned by :func:`lazy_import` now, unless it already has been.
+
+    :param module: the module.
+
+    """
+
+    if isinstance(module, _LazyModule):
+        module.__getattr__("__name__")
@@ -0,0 +1 @@
+"""The built-in locales, imported on demand by :mod:`arrow.locales`."""
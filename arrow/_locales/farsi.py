@@ -0,0 +1,89 @@
+"""The Farsi locale."""
+
+from arrow.locales import Locale
+
+
+class FarsiLocale(Locale):
+    names = ["fa", "fa-ir"]
+
+    past = "{0} قبل"
+    future = "در {0}"
+
+    timeframes = {
+        "now": "اکنون",
+        "second": "یک لحظه",
+        "seconds": "{0} ثانیه",
+        "minute": "یک دقیقه",
+        "minutes": "{0} دقیقه",
+        "hour": "یک ساعت",
+        "hours": "{0} ساعت",
+        "day": "یک روز",
+        "days": "{0} روز",
+        "week": "یک هفته",
+        "weeks": "{0} هفته",
+        "quarter": "یک فصل",
+        "quarters": "{0} فصل",
+        "month": "یک ماه",
+        "months": "{0} ماه",
+        "year": "یک سال",
+        "years": "{0} سال",
+    }
+
+    meridians = {
+        "am": "قبل از ظهر",
+        "pm": "بعد از ظهر",
+        "AM": "قبل از ظهر",
+        "PM": "بعد از ظهر",
+    }
+
+    month_names = [
+        "",
+        "ژانویه",
+        "فوریه",
+        "مارس",
+        "آوریل",
+        "مه",
+        "ژوئن",
+        "ژوئیه",
+        "اوت",
+        "سپتامبر",
+        "اکتبر",
+        "نوامبر",
+        "دسامبر",
+    ]
+    month_abbreviations = [
+        "",
+        "ژانویه",
+        "فوریه",
+        "مارس",
+        "آوریل",
+        "مه",
+        "ژوئن",
+        "ژوئیه",
+        "اوت",
+        "سپتامبر",
+        "اکتبر",
+        "نوامبر",
+        "دسامبر",
+    ]
+
+    day_names = [
+        "",
+        "دو شنبه",
+        "سه شنبه",
+        "چهارشنبه",
+        "پنجشنبه",
+        "جمعه",
+        "شنبه",
+        "یکشنبه",
+    ]
+    day_abbreviations = [
+        "",
+        "دو شنبه",
+        "سه شنبه",
+        "چهارشنبه",
+        "پنجشنبه",
+        "جمعه",
+        "شنبه",
+        "یکشنبه",
+    ]
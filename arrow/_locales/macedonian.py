@@ -0,0 +1,204 @@
+"""The Macedonian locales."""
+
+from typing import ClassVar, Mapping, Union
+
+from arrow._locales.slavic import SlavicBaseLocale
+from arrow.locales import TimeFrameLiteral
+
+
+class MacedonianLocale(SlavicBaseLocale):
+    names = ["mk", "mk-mk"]
+
+    past = "пред {0}"
+    future = "за {0}"
+
+    timeframes: ClassVar[Mapping[TimeFrameLiteral, Union[str, Mapping[str, str]]]] = {
+        "now": "сега",
+        "second": "една секунда",
+        "seconds": {
+            "singular": "{0} секунда",
+            "dual": "{0} секунди",
+            "plural": "{0} секунди",
+        },
+        "minute": "една минута",
+        "minutes": {
+            "singular": "{0} минута",
+            "dual": "{0} минути",
+            "plural": "{0} минути",
+        },
+        "hour": "еден саат",
+        "hours": {"singular": "{0} саат", "dual": "{0} саати", "plural": "{0} саати"},
+        "day": "еден ден",
+        "days": {"singular": "{0} ден", "dual": "{0} дена", "plural": "{0} дена"},
+        "week": "една недела",
+        "weeks": {
+            "singular": "{0} недела",
+            "dual": "{0} недели",
+            "plural": "{0} недели",
+        },
+        "month": "еден месец",
+        "months": {
+            "singular": "{0} месец",
+            "dual": "{0} месеци",
+            "plural": "{0} месеци",
+        },
+        "year": "една година",
+        "years": {
+            "singular": "{0} година",
+            "dual": "{0} години",
+            "plural": "{0} години",
+        },
+    }
+
+    meridians = {"am": "дп", "pm": "пп", "AM": "претпладне", "PM": "попладне"}
+
+    month_names = [
+        "",
+        "Јануари",
+        "Февруари",
+        "Март",
+        "Април",
+        "Мај",
+        "Јуни",
+        "Јули",
+        "Август",
+        "Септември",
+        "Октомври",
+        "Ноември",
+        "Декември",
+    ]
+    month_abbreviations = [
+        "",
+        "Јан",
+        "Фев",
+        "Мар",
+        "Апр",
+        "Мај",
+        "Јун",
+        "Јул",
+        "Авг",
+        "Септ",
+        "Окт",
+        "Ноем",
+        "Декем",
+    ]
+
+    day_names = [
+        "",
+        "Понеделник",
+        "Вторник",
+        "Среда",
+        "Четврток",
+        "Петок",
+        "Сабота",
+        "Недела",
+    ]
+    day_abbreviations = [
+        "",
+        "Пон",
+        "Вт",
+        "Сре",
+        "Чет",
+        "Пет",
+        "Саб",
+        "Нед",
+    ]
+
+
+class MacedonianLatinLocale(SlavicBaseLocale):
+    names = ["mk-latn", "mk-mk-latn"]
+
+    past = "pred {0}"
+    future = "za {0}"
+
+    timeframes: ClassVar[Mapping[TimeFrameLiteral, Union[str, Mapping[str, str]]]] = {
+        "now": "sega",
+        "second": "edna sekunda",
+        "seconds": {
+            "singular": "{0} sekunda",
+            "dual": "{0} sekundi",
+            "plural": "{0} sekundi",
+        },
+        "minute": "edna minuta",
+        "minutes": {
+            "singular": "{0} minuta",
+            "dual": "{0} minuti",
+            "plural": "{0} minuti",
+        },
+        "hour": "eden saat",
+        "hours": {"singular": "{0} saat", "dual": "{0} saati", "plural": "{0} saati"},
+        "day": "eden den",
+        "days": {"singular": "{0} den", "dual": "{0} dena", "plural": "{0} dena"},
+        "week": "edna nedela",
+        "weeks": {
+            "singular": "{0} nedela",
+            "dual": "{0} nedeli",
+            "plural": "{0} nedeli",
+        },
+        "month": "eden mesec",
+        "months": {
+            "singular": "{0} mesec",
+            "dual": "{0} meseci",
+            "plural": "{0} meseci",
+        },
+        "year": "edna godina",
+        "years": {
+            "singular": "{0} godina",
+            "dual": "{0} godini",
+            "plural": "{0} godini",
+        },
+    }
+
+    meridians = {"am": "dp", "pm": "pp", "AM": "pretpladne", "PM": "popladne"}
+
+    month_names = [
+        "",
+        "Januari",
+        "Fevruari",
+        "Mart",
+        "April",
+        "Maj",
+        "Juni",
+        "Juli",
+        "Avgust",
+        "Septemvri",
+        "Oktomvri",
+        "Noemvri",
+        "Dekemvri",
+    ]
+    month_abbreviations = [
+        "",
+        "Jan",
+        "Fev",
+        "Mar",
+        "Apr",
+        "Maj",
+        "Jun",
+        "Jul",
+        "Avg",
+        "Sep",
+        "Okt",
+        "Noe",
+        "Dek",
+    ]
+
+    day_names = [
+        "",
+        "Ponedelnik",
+        "Vtornik",
+        "Sreda",
+        "Chetvrtok",
+        "Petok",
+        "Sabota",
+        "Nedela",
+    ]
+    day_abbreviations = [
+        "",
+        "Pon",
+        "Vt",
+        "Sre",
+        "Chet",
+        "Pet",
+        "Sab",
+        "Ned",
+    ]
@@ -0,0 +1,71 @@
+"""The Marathi locale."""
+
+from arrow.locales import Locale
+
+
+class MarathiLocale(Locale):
+    names = ["mr"]
+
+    past = "{0} आधी"
+    future = "{0} नंतर"
+
+    timeframes = {
+        "now": "सद्य",
+        "second": "एक सेकंद",
+        "seconds": "{0} सेकंद",
+        "minute": "एक मिनिट ",
+        "minutes": "{0} मिनिट ",
+        "hour": "एक तास",
+        "hours": "{0} तास",
+        "day": "एक दिवस",
+        "days": "{0} दिवस",
+        "month": "एक महिना ",
+        "months": "{0} महिने ",
+        "year": "एक वर्ष ",
+        "years": "{0} वर्ष ",
+    }
+
+    meridians = {"am": "सकाळ", "pm": "संध्याकाळ", "AM": "सकाळ", "PM": "संध्याकाळ"}
+
+    month_names = [
+        "",
+        "जानेवारी",
+        "फेब्रुवारी",
+        "मार्च",
+        "एप्रिल",
+        "मे",
+        "जून",
+        "जुलै",
+        "अॉगस्ट",
+        "सप्टेंबर",
+        "अॉक्टोबर",
+        "नोव्हेंबर",
+        "डिसेंबर",
+    ]
+    month_abbreviations = [
+        "",
+        "जान",
+        "फेब्रु",
+        "मार्च",
+        "एप्रि",
+        "मे",
+        "जून",
+        "जुलै",
+        "अॉग",
+        "सप्टें",
+        "अॉक्टो",
+        "नोव्हें",
+        "डिसें",
+    ]
+
+    day_names = [
+        "",
+        "सोमवार",
+        "मंगळवार",
+        "बुधवार",
+        "गुरुवार",
+        "शुक्रवार",
+        "शनिवार",
+        "रविवार",
+    ]
+    day_abbreviations = ["", "सोम", "मंगळ", "बुध", "गुरु", "शुक्र", "शनि", "रवि"]
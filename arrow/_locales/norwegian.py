@@ -0,0 +1,145 @@
+"""The Norwegian locales."""
+
+from arrow.locales import Locale
+
+
+class NorwegianLocale(Locale):
+    names = ["nb", "nb-no"]
+
+    past = "for {0} siden"
+    future = "om {0}"
+
+    timeframes = {
+        "now": "nå nettopp",
+        "second": "ett sekund",
+        "seconds": "{0} sekunder",
+        "minute": "ett minutt",
+        "minutes": "{0} minutter",
+        "hour": "en time",
+        "hours": "{0} timer",
+        "day": "en dag",
+        "days": "{0} dager",
+        "week": "en uke",
+        "weeks": "{0} uker",
+        "month": "en måned",
+        "months": "{0} måneder",
+        "year": "ett år",
+        "years": "{0} år",
+    }
+
+    month_names = [
+        "",
+        "januar",
+        "februar",
+        "mars",
+        "april",
+        "mai",
+        "juni",
+        "juli",
+        "august",
+        "september",
+        "oktober",
+        "november",
+        "desember",
+    ]
+    month_abbreviations = [
+        "",
+        "jan",
+        "feb",
+        "mar",
+        "apr",
+        "mai",
+        "jun",
+        "jul",
+        "aug",
+        "sep",
+        "okt",
+        "nov",
+        "des",
+    ]
+
+    day_names = [
+        "",
+        "mandag",
+        "tirsdag",
+        "onsdag",
+        "torsdag",
+        "fredag",
+        "lørdag",
+        "søndag",
+    ]
+    day_abbreviations = ["", "ma", "ti", "on", "to", "fr", "lø", "sø"]
+
+    def _ordinal_number(self, n: int) -> str:
+        return f"{n}."
+
+
+class NewNorwegianLocale(Locale):
+    names = ["nn", "nn-no"]
+
+    past = "for {0} sidan"
+    future = "om {0}"
+
+    timeframes = {
+        "now": "no nettopp",
+        "second": "eitt sekund",
+        "seconds": "{0} sekund",
+        "minute": "eitt minutt",
+        "minutes": "{0} minutt",
+        "hour": "ein time",
+        "hours": "{0} timar",
+        "day": "ein dag",
+        "days": "{0} dagar",
+        "week": "ei veke",
+        "weeks": "{0} veker",
+        "month": "ein månad",
+        "months": "{0} månader",
+        "year": "eitt år",
+        "years": "{0} år",
+    }
+
+    month_names = [
+        "",
+        "januar",
+        "februar",
+        "mars",
+        "april",
+        "mai",
+        "juni",
+        "juli",
+        "august",
+        "september",
+        "oktober",
+        "november",
+        "desember",
+    ]
+    month_abbreviations = [
+        "",
+        "jan",
+        "feb",
+        "mar",
+        "apr",
+        "mai",
+        "jun",
+        "jul",
+        "aug",
+        "sep",
+        "okt",
+        "nov",
+        "des",
+    ]
+
+    day_names = [
+        "",
+        "måndag",
+        "tysdag",
+        "onsdag",
+        "torsdag",
+        "fredag",
+        "laurdag",
+        "sundag",
+    ]
+    day_abbreviations = ["", "må", "ty", "on", "to", "fr", "la", "su"]
+
+    def _ordinal_number(self, n: int) -> str:
+        return f"{n}."
@@ -7,9 +7,28 @@ methods for use as a module API.
 from datetime import date, datetime
 from datetime import tzinfo as dt_tzinfo
 from time import struct_time
-from typing import Any, List, Optional, Tuple, Type, Union, overload
-
-from arrow.arrow import TZ_EXPR, Arrow
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+
+from arrow.arrow import (
+    _AGGREGATES,
+    _BOUNDS,
+    _CONVERT_OUTPUT,
+    _GRANULARITY,
+    _T_FRAMES,
+    TZ_EXPR,
+    Arrow,
+)
 from arrow.constants import DEFAULT_LOCALE
 from arrow.factory import ArrowFactory
 
@@ -107,6 +126,81 @@ def now(tz: Optional[TZ_EXPR] = None) -> Arrow:
 now.__doc__ = _factory.now.__doc__
 
 
+def resample(
+    stream: Iterable[Tuple[Union[Arrow, datetime, int, float, str], Any]],
+    frame: _T_FRAMES,
+    tz: Optional[TZ_EXPR] = None,
+    agg: Union[_AGGREGATES, Callable[[List[Any]], Any]] = "count",
+    bounds: _BOUNDS = "[)",
+    week_start: int = 1,
+    fill: bool = False,
+) -> Iterator[Tuple[Tuple[Arrow, Arrow], Any]]:
+    """Calls the default :class:`ArrowFactory <arrow.factory.ArrowFactory>` ``resample`` method."""
+
+    return _factory.resample(stream, frame, tz, agg, bounds, week_start, fill)
+
+
+resample.__doc__ = _factory.resample.__doc__
+
+
+def find_gaps(
+    values: Iterable[Union[Arrow, datetime, int, float, str]],
+    frame: _T_FRAMES,
+    start: Optional[Union[Arrow, datetime, int, float]] = None,
+    end: Optional[Union[Arrow, datetime, int, float]] = None,
+    tz: Optional[TZ_EXPR] = None,
+    bounds: _BOUNDS = "[)",
+    week_start: int = 1,
+) -> Iterator[Tuple[Arrow, Arrow]]:
+    """Calls the default :class:`ArrowFactory <arrow.factory.ArrowFactory>` ``find_gaps`` method."""
+
+    return _factory.find_gaps(values, frame, start, end, tz, bounds, week_start)
+
+
+find_gaps.__doc__ = _factory.find_gaps.__doc__
+
+
+def convert_many(
+    values: Iterable[Union[Arrow, datetime, int, float, str]],
+    tz: TZ_EXPR,
+    output: _CONVERT_OUTPUT = "arrow",
+) -> List[Union[Arrow, datetime, Tuple[float, int]]]:
+    """Calls the default :class:`ArrowFactory <arrow.factory.ArrowFactory>` ``convert_many`` method."""
+
+    return _factory.convert_many(values, tz, output)
+
+
+convert_many.__doc__ = _factory.convert_many.__doc__
+
+
+def humanize_many(
+    values: Iterable[Union[Arrow, datetime, int, float, str]],
+    other: Union[Arrow, datetime, None] = None,
+    locale: str = DEFAULT_LOCALE,
+    only_distance: bool = False,
+    granularity: Union[_GRANULARITY, List[_GRANULARITY]] = "auto",
+) -> List[str]:
+    """Calls the default :class:`ArrowFactory <arrow.factory.ArrowFactory>` ``humanize_many`` method."""
+
+    return _factory.humanize_many(values, other, locale, only_distance, granularity)
+
+
+humanize_many.__doc__ = _factory.humanize_many.__doc__
+
+
+def warmup(
+    formats: Iterable[str] = (),
+    locales: Iterable[str] = (DEFAULT_LOCALE,),
+    timezones: Iterable[TZ_EXPR] = (),
+) -> None:
+    """Calls the default :class:`ArrowFactory <arrow.factory.ArrowFactory>` ``warmup`` method."""
+
+    _factory.warmup(formats, locales, timezones)
+
+
+warmup.__doc__ = _factory.warmup.__doc__
+
+
 def factory(type: Type[Arrow]) -> ArrowFactory:
     """Returns an :class:`.ArrowFactory` for the specified :class:`Arrow <arrow.arrow.Arrow>`
     or derived type.
@@ -118,4 +212,14 @@ def factory(type: Type[Arrow]) -> ArrowFactory:
     return ArrowFactory(type)
 
 
-__all__ = ["get", "utcnow", "now", "factory"]
+__all__ = [
+    "get",
+    "utcnow",
+    "now",
+    "resample",
+    "find_gaps",
+    "convert_many",
+    "humanize_many",
+    "warmup",
+    "factory",
+]
@@ -7,35 +7,79 @@ replacement.
 import calendar
 import re
 import sys
+from bisect import bisect_left, bisect_right
+from datetime import MAXYEAR, MINYEAR
 from datetime import date as dt_date
 from datetime import datetime as dt_datetime
 from datetime import time as dt_time
 from datetime import timedelta, timezone
 from datetime import tzinfo as dt_tzinfo
+from importlib import import_module
+from itertools import chain, tee
 from math import trunc
 from time import struct_time
+from types import ModuleType
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
+    Dict,
     Final,
     Generator,
     Iterable,
     List,
     Literal,
     Mapping,
+    NamedTuple,
     Optional,
+    Pattern,
+    Sequence,
     Tuple,
     Union,
     cast,
     overload,
 )
 
-from dateutil import tz as dateutil_tz
-from dateutil.relativedelta import relativedelta
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    from backports.zoneinfo import ZoneInfo  # type: ignore[import-not-found, no-redef]
 
-from arrow import formatter, locales, parser, util
+from arrow import caches, instrumentation, util
+from arrow._lazy import lazy_import, load
 from arrow.constants import DEFAULT_LOCALE, DEHUMANIZE_LOCALES
-from arrow.locales import TimeFrameLiteral
+
+if TYPE_CHECKING:
+    from dateutil import relativedelta as dateutil_relativedelta
+
+    from arrow import formatter, locales, parser
+    from arrow.locales import TimeFrameLiteral
+else:
+    # not needed to import arrow, so only loaded once they are first used
+    formatter = lazy_import("arrow.formatter")
+    locales = lazy_import("arrow.locales")
+    parser = lazy_import("arrow.parser")
+
+# loaded ahead of their first use by Arrow.warmup
+_DEFERRED_MODULES = (formatter, locales, parser)
+
+# imported by the functions using them, and ahead of that by Arrow.warmup
+_DATEUTIL_MODULES = ("dateutil.relativedelta", "dateutil.rrule", "dateutil.tz")
+
+
+def _imported(name: str) -> Optional[ModuleType]:
+    """Returns a module if it was imported, else None.  Checking whether an object is an
+    instance of a class of dateutil does not import it, as no object is before it is."""
+    return sys.modules.get(name)
+
+
+def _is_relativedelta(value: Any) -> bool:
+    dateutil_relativedelta = _imported("dateutil.relativedelta")
+    return dateutil_relativedelta is not None and isinstance(
+        value, dateutil_relativedelta.relativedelta
+    )
+
 
 TZ_EXPR = Union[dt_tzinfo, str]
 
@@ -62,6 +106,10 @@ _T_FRAMES = Literal[
 
 _BOUNDS = Literal["[)", "()", "(]", "[]"]
 
+_AGGREGATES = Literal["count", "sum", "min", "max", "mean", "first", "last"]
+
+_CONVERT_OUTPUT = Literal["arrow", "datetime", "epoch"]
+
 _GRANULARITY = Literal[
     "auto",
     "second",
@@ -75,6 +123,21 @@ _GRANULARITY = Literal[
 ]
 
 
+class _Dehumanizer(NamedTuple):
+    """The patterns used by :meth:`Arrow.dehumanize <arrow.arrow.Arrow.dehumanize>` for a
+    locale, compiled once.
+
+    ``units`` holds, for each string of the locale's timeframes in order, the plural time
+    unit it sets (or "now"), the value it sets when the match holds no number, and the
+    pattern searched for.
+
+    """
+
+    units: List[Tuple[str, int, Pattern[str]]]
+    future: Pattern[str]
+    past: Pattern[str]
+
+
 class Arrow:
     """An :class:`Arrow <arrow.arrow.Arrow>` object.
 
@@ -122,6 +185,14 @@ class Arrow:
         "microsecond",
     ]
     _ATTRS_PLURAL: Final[List[str]] = [f"{a}s" for a in _ATTRS]
+    _ATTRS_FIXED_LENGTH: Final[List[str]] = [
+        "weeks",
+        "days",
+        "hours",
+        "minutes",
+        "seconds",
+        "microseconds",
+    ]
     _MONTHS_PER_QUARTER: Final[int] = 3
     _MONTHS_PER_YEAR: Final[int] = 12
     _SECS_PER_MINUTE: Final[int] = 60
@@ -132,7 +203,37 @@ class Arrow:
     _SECS_PER_QUARTER: Final[float] = 60 * 60 * 24 * 30.5 * 3
     _SECS_PER_YEAR: Final[int] = 60 * 60 * 24 * 365
 
-    _SECS_MAP: Final[Mapping[TimeFrameLiteral, float]] = {
+    # the timeframe used by automatic humanization below each bound, with the seconds
+    # per counted unit or 0 for a single unit
+    _HUMANIZE_BOUNDS: Final[List[float]] = [
+        10,
+        _SECS_PER_MINUTE,
+        _SECS_PER_MINUTE * 2,
+        _SECS_PER_HOUR,
+        _SECS_PER_HOUR * 2,
+        _SECS_PER_DAY,
+        _SECS_PER_DAY * 2,
+        _SECS_PER_WEEK,
+        _SECS_PER_WEEK * 2,
+        _SECS_PER_MONTH,
+        _SECS_PER_YEAR * 2,
+    ]
+    _HUMANIZE_FRAMES: Final[List[Tuple["TimeFrameLiteral", int]]] = [
+        ("now", 0),
+        ("seconds", 1),
+        ("minute", 0),
+        ("minutes", _SECS_PER_MINUTE),
+        ("hour", 0),
+        ("hours", _SECS_PER_HOUR),
+        ("day", 0),
+        ("days", _SECS_PER_DAY),
+        ("week", 0),
+        ("weeks", _SECS_PER_WEEK),
+        ("year", 0),
+        ("years", _SECS_PER_YEAR),
+    ]
+
+    _SECS_MAP: Final[Mapping["TimeFrameLiteral", float]] = {
         "second": 1.0,
         "minute": _SECS_PER_MINUTE,
         "hour": _SECS_PER_HOUR,
@@ -143,6 +244,82 @@ class Arrow:
         "year": _SECS_PER_YEAR,
     }
 
+    _FLOOR_RESETS: Final[Mapping[str, Dict[str, Any]]] = {
+        "year": dict(month=1, day=1, hour=0, minute=0, second=0, microsecond=0, fold=0),
+        "quarter": dict(day=1, hour=0, minute=0, second=0, microsecond=0, fold=0),
+        "month": dict(day=1, hour=0, minute=0, second=0, microsecond=0, fold=0),
+        "week": dict(hour=0, minute=0, second=0, microsecond=0, fold=0),
+        "day": dict(hour=0, minute=0, second=0, microsecond=0, fold=0),
+        "hour": dict(minute=0, second=0, microsecond=0, fold=0),
+        "minute": dict(second=0, microsecond=0, fold=0),
+        "second": dict(microsecond=0, fold=0),
+        "microsecond": dict(fold=0),
+    }
+    _FLOOR_PARENTS: Final[Mapping[str, str]] = {
+        "quarter": "year",
+        "month": "year",
+        "day": "month",
+        "hour": "day",
+        "minute": "hour",
+        "second": "minute",
+        "microsecond": "second",
+    }
+    _SUBDAY_FRAMES: Final[List[str]] = [
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "microsecond",
+    ]
+
+    # the initial state, step and result functions of each aggregate of resample
+    _AGGREGATORS: Final[
+        Mapping[
+            str,
+            Tuple[Callable[[], Any], Callable[[Any, Any], Any], Callable[[Any], Any]],
+        ]
+    ] = {
+        "count": (int, lambda count, value: count + 1, int),
+        "sum": (int, lambda total, value: total + value, lambda total: total),
+        "min": (
+            lambda: None,
+            lambda least, value: value if least is None or value < least else least,
+            lambda least: least,
+        ),
+        "max": (
+            lambda: None,
+            lambda most, value: value if most is None or value > most else most,
+            lambda most: most,
+        ),
+        "mean": (
+            lambda: (0, 0),
+            lambda mean, value: (mean[0] + value, mean[1] + 1),
+            lambda mean: mean[0] / mean[1] if mean[1] else None,
+        ),
+        "first": (
+            tuple,
+            lambda first, value: first or (value,),
+            lambda first: first[0] if first else None,
+        ),
+        "last": (lambda: None, lambda last, value: value, lambda last: last),
+    }
+
+    _DEFAULT_FORMAT: Final[str] = "YYYY-MM-DD HH:mm:ssZZ"
+    # the shapes of ISO 8601 strings compiled by warmup
+    _WARMUP_ISO_STRINGS: Final[Tuple[str, ...]] = (
+        "1970-01-01",
+        "1970-01-01T00:00:00",
+        "1970-01-01T00:00:00Z",
+        "1970-01-01T00:00:00+00:00",
+        "1970-01-01T00:00:00.000000+00:00",
+        "1970-01-01 00:00:00",
+    )
+
+    _DIGITS_RE: ClassVar[Pattern[str]] = re.compile(r"\d+")
+    _dehumanizers: ClassVar[caches.Cache] = caches.get_cache("dehumanizers")
+    _transition_tables: ClassVar[caches.Cache] = caches.get_cache("transitions")
+    _span_memo: ClassVar[caches.Cache] = caches.get_cache("spans")
+
     _datetime: dt_datetime
 
     def __init__(
@@ -159,16 +336,10 @@ class Arrow:
     ) -> None:
         if tzinfo is None:
             tzinfo = timezone.utc
-        # detect that tzinfo is a pytz object (issue #626)
-        elif (
-            isinstance(tzinfo, dt_tzinfo)
-            and hasattr(tzinfo, "localize")
-            and hasattr(tzinfo, "zone")
-            and tzinfo.zone
-        ):
-            tzinfo = parser.TzinfoParser.parse(tzinfo.zone)
         elif isinstance(tzinfo, str):
             tzinfo = parser.TzinfoParser.parse(tzinfo)
+        else:
+            tzinfo = self._normalize_tzinfo(tzinfo)
 
         fold = kwargs.get("fold", 0)
 
@@ -473,6 +644,24 @@ class Arrow:
 
         """
 
+        if instrumentation._hooks and instrumentation._outermost():
+            return instrumentation._observe_generator(
+                "range", cls._range, frame, start, end, tz, limit
+            )
+        return cls._range(frame, start, end, tz, limit)
+
+    @classmethod
+    def _range(
+        cls,
+        frame: _T_FRAMES,
+        start: Union["Arrow", dt_datetime],
+        end: Union["Arrow", dt_datetime, None] = None,
+        tz: Optional[TZ_EXPR] = None,
+        limit: Optional[int] = None,
+    ) -> Generator["Arrow", None, None]:
+        """Yields the points of :meth:`range`, as a generator so that its arguments are
+        only checked once iteration starts."""
+
         _, frame_relative, relative_steps = cls._get_frames(frame)
 
         tzinfo = cls._get_tzinfo(start.tzinfo if tz is None else tz)
@@ -482,24 +671,146 @@ class Arrow:
         end = cls._get_datetime(end).replace(tzinfo=tzinfo)
 
         current = cls.fromdatetime(start)
-        original_day = start.day
-        day_is_clipped = False
-        i = 0
 
-        while current <= end and i < limit:
-            i += 1
-            yield current
+        for dt in cls._iter_range(
+            frame, frame_relative, relative_steps, current._datetime, end, limit
+        ):
+            yield cls.fromdatetime(dt)
+
+    @classmethod
+    def count(
+        cls,
+        frame: _T_FRAMES,
+        start: Union["Arrow", dt_datetime],
+        end: Union["Arrow", dt_datetime],
+        tz: Optional[TZ_EXPR] = None,
+    ) -> int:
+        """Returns the number of :class:`Arrow <arrow.arrow.Arrow>` objects that
+        :func:`range <arrow.arrow.Arrow.range>` returns between two inputs, without
+        iterating the range.
+
+        :param frame: The timeframe.  Can be any ``datetime`` property (day, hour, minute...).
+        :param start: A datetime expression, the start of the range.
+        :param end: A datetime expression, the end of the range.
+        :param tz: (optional) A :ref:`timezone expression <tz-expr>`.  Defaults to
+            ``start``'s timezone, or UTC if ``start`` is naive.
+
+        The result is always ``len(list(Arrow.range(frame, start, end, tz)))``, including
+        the end of the range and the days clipped to the end of a month.  It is computed in
+        closed form for timezones with a fixed UTC offset.  In other timezones DST gaps shift
+        the points of the range, and the count is computed in closed form between the gaps,
+        or for frames of a month or longer from the number of months and the last point.
+        Timezones other than ``ZoneInfo`` and dateutil's ``tzfile`` and ``tzrange``, and
+        plural monthly frames clipping the day of the month, step through the range instead.
+
+        Usage::
+
+            >>> start = datetime(2013, 1, 31)
+            >>> end = datetime(2013, 12, 31)
+            >>> arrow.Arrow.count('month', start, end)
+            12
+
+        """
+
+        _, frame_relative, relative_steps = cls._get_frames(frame)
+
+        tzinfo = cls._get_tzinfo(start.tzinfo if tz is None else tz)
+
+        first = cls.fromdatetime(
+            cls._get_datetime(start).replace(tzinfo=tzinfo)
+        )._datetime
+        last = cls._get_datetime(end).replace(tzinfo=tzinfo)
 
-            values = [getattr(current, f) for f in cls._ATTRS]
-            current = cls(*values, tzinfo=tzinfo).shift(  # type: ignore[misc]
-                check_imaginary=True, **{frame_relative: relative_steps}
+        if cls._is_closed_form_range(frame, frame_relative, first, last):
+            return cls._count_range(
+                frame_relative, relative_steps, first, last, sys.maxsize
             )
 
-            if frame in ["month", "quarter", "year"] and current.day < original_day:
-                day_is_clipped = True
+        if frame_relative in ["years", "months"]:
+            if frame in ["month", "quarter", "year"] or first.day <= 28:
+                months = relative_steps
+                if frame_relative == "years":
+                    months *= cls._MONTHS_PER_YEAR
 
-            if day_is_clipped and not cls._is_last_day_of_month(current):
-                current = current.replace(day=original_day)
+                time = cls._range_wall_time(months, first, last)
+                if time is not None:
+                    return cls._count_range(
+                        frame_relative, relative_steps, first, last, sys.maxsize, time
+                    )
+
+        else:
+            segments = cls._range_segments(frame_relative, relative_steps, first, last)
+            if segments is not None:
+                return sum(length for _, length in segments)
+
+        return sum(
+            1
+            for _ in cls._iter_range(
+                frame, frame_relative, relative_steps, first, last, sys.maxsize
+            )
+        )
+
+    @classmethod
+    def range_chunks(
+        cls,
+        frame: _T_FRAMES,
+        start: Union["Arrow", dt_datetime],
+        end: Union["Arrow", dt_datetime],
+        n: int,
+        tz: Optional[TZ_EXPR] = None,
+    ) -> List[Tuple["Arrow", "Arrow"]]:
+        """Returns a list of tuples, each the first and last :class:`Arrow <arrow.arrow.Arrow>`
+        objects of a chunk of :func:`range <arrow.arrow.Arrow.range>` between two inputs, which
+        is split into ``n`` chunks of nearly equal length.
+
+        :param frame: The timeframe.  Can be any ``datetime`` property (day, hour, minute...).
+        :param start: A datetime expression, the start of the range.
+        :param end: A datetime expression, the end of the range.
+        :param n: The number of chunks.
+        :param tz: (optional) A :ref:`timezone expression <tz-expr>`.  Defaults to
+            ``start``'s timezone, or UTC if ``start`` is naive.
+
+        ``Arrow.range(frame, first, last)`` returns the points of a chunk, so that the chunks
+        can be iterated separately, for instance by worker processes.  The chunks are computed
+        without iterating the range, except for frames of a month or longer in timezones
+        without a fixed UTC offset, and for the timezones that
+        :func:`count <arrow.arrow.Arrow.count>` steps through.
+
+        Fewer than ``n`` chunks are returned when the range has fewer than ``n`` points.  When
+        the day of the month is clipped, as in a monthly range starting on the 31st, a chunk
+        only starts on a point that is not clipped.  There are then ``n`` chunks, or one for
+        each such point if there are fewer, and the chunks may be less even.
+
+        Usage::
+
+            >>> start = datetime(2013, 5, 5, 12, 30)
+            >>> end = datetime(2013, 5, 5, 17, 15)
+            >>> for r in arrow.Arrow.range_chunks('hour', start, end, 2):
+            ...     print(r)
+            ...
+            (<Arrow [2013-05-05T12:30:00+00:00]>, <Arrow [2013-05-05T14:30:00+00:00]>)
+            (<Arrow [2013-05-05T15:30:00+00:00]>, <Arrow [2013-05-05T16:30:00+00:00]>)
+
+        """
+
+        if n < 1:
+            raise ValueError("n has to be a positive integer")
+
+        _, frame_relative, relative_steps = cls._get_frames(frame)
+
+        tzinfo = cls._get_tzinfo(start.tzinfo if tz is None else tz)
+
+        first = cls.fromdatetime(
+            cls._get_datetime(start).replace(tzinfo=tzinfo)
+        )._datetime
+        last = cls._get_datetime(end).replace(tzinfo=tzinfo)
+
+        return [
+            (cls.fromdatetime(head), cls.fromdatetime(tail))
+            for head, tail in cls._chunk_range(
+                frame, frame_relative, relative_steps, first, last, n
+            )
+        ]
 
     def span(
         self,
@@ -551,49 +862,51 @@ class Arrow:
 
         """
 
+        if instrumentation._hooks and instrumentation._outermost():
+            return instrumentation._observe(
+                "span", Arrow._span, self, frame, count, bounds, exact, week_start
+            )
+        return self._span(frame, count, bounds, exact, week_start)
+
+    def _span(
+        self,
+        frame: _T_FRAMES,
+        count: int = 1,
+        bounds: _BOUNDS = "[)",
+        exact: bool = False,
+        week_start: int = 1,
+    ) -> Tuple["Arrow", "Arrow"]:
+        """Returns the result of :meth:`span`, which floor, ceil and the other methods
+        call without it being reported to the hooks of :mod:`arrow.instrumentation`."""
+
         util.validate_bounds(bounds)
 
         frame_absolute, frame_relative, relative_steps = self._get_frames(frame)
 
-        if frame_absolute == "week":
-            if not 1 <= week_start <= 7:
-                raise ValueError("week_start argument must be between 1 and 7.")
-            attr = "day"
-        elif frame_absolute == "quarter":
-            attr = "month"
+        if frame_absolute == "week" and not 1 <= week_start <= 7:
+            raise ValueError("week_start argument must be between 1 and 7.")
+
+        if exact or frame_absolute == "microsecond" or self._span_memo.maxsize <= 0:
+            floor, ceil = self._span_datetime(
+                self._datetime,
+                frame_absolute,
+                frame_relative,
+                count * relative_steps,
+                bounds,
+                exact,
+                week_start,
+            )
         else:
-            attr = frame_absolute
-
-        floor = self
-        if not exact:
-            index = self._ATTRS.index(attr)
-            frames = self._ATTRS[: index + 1]
-
-            values = [getattr(self, f) for f in frames]
-
-            for _ in range(3 - len(values)):
-                values.append(1)
-
-            floor = self.__class__(*values, tzinfo=self.tzinfo)  # type: ignore[misc]
-
-            if frame_absolute == "week":
-                # if week_start is greater than self.isoweekday() go back one week by setting delta = 7
-                delta = 7 if week_start > self.isoweekday() else 0
-                floor = floor.shift(days=-(self.isoweekday() - week_start) - delta)
-            elif frame_absolute == "quarter":
-                floor = floor.shift(months=-((self.month - 1) % 3))
-
-        ceil = floor.shift(
-            check_imaginary=True, **{frame_relative: count * relative_steps}
-        )
-
-        if bounds[0] == "(":
-            floor = floor.shift(microseconds=+1)
-
-        if bounds[1] == ")":
-            ceil = ceil.shift(microseconds=-1)
+            floor, ceil = self._span_memoized(
+                frame_absolute,
+                frame_relative,
+                relative_steps,
+                count,
+                bounds,
+                week_start,
+            )
 
-        return floor, ceil
+        return self._wrap_datetime(floor), self._wrap_datetime(ceil)
 
     def floor(self, frame: _T_FRAMES, **kwargs: Any) -> "Arrow":
         """Returns a new :class:`Arrow <arrow.arrow.Arrow>` object, representing the "floor"
@@ -615,7 +928,7 @@ class Arrow:
 
         """
 
-        return self.span(frame, **kwargs)[0]
+        return self._span(frame, **kwargs)[0]
 
     def ceil(self, frame: _T_FRAMES, **kwargs: Any) -> "Arrow":
         """Returns a new :class:`Arrow <arrow.arrow.Arrow>` object, representing the "ceiling"
@@ -637,7 +950,7 @@ class Arrow:
 
         """
 
-        return self.span(frame, **kwargs)[1]
+        return self._span(frame, **kwargs)[1]
 
     @classmethod
     def span_range(
@@ -701,25 +1014,7 @@ class Arrow:
 
         """
 
-        tzinfo = cls._get_tzinfo(start.tzinfo if tz is None else tz)
-        start = cls.fromdatetime(start, tzinfo).span(frame, exact=exact)[0]
-        end = cls.fromdatetime(end, tzinfo)
-        _range = cls.range(frame, start, end, tz, limit)
-        if not exact:
-            for r in _range:
-                yield r.span(frame, bounds=bounds, exact=exact)
-
-        for r in _range:
-            floor, ceil = r.span(frame, bounds=bounds, exact=exact)
-            if ceil > end:
-                ceil = end
-                if bounds[1] == ")":
-                    ceil += relativedelta(microseconds=-1)
-            if floor == end:
-                break
-            elif floor + relativedelta(microseconds=-1) == end:
-                break
-            yield floor, ceil
+        yield from cls._iter_spans(frame, start, end, tz, limit, bounds, exact, 1)
 
     @classmethod
     def interval(
@@ -776,117 +1071,652 @@ class Arrow:
         if interval < 1:
             raise ValueError("interval has to be a positive integer")
 
-        spanRange = iter(
-            cls.span_range(frame, start, end, tz, bounds=bounds, exact=exact)
-        )
-        while True:
-            try:
-                intvlStart, intvlEnd = next(spanRange)
-                for _ in range(interval - 1):
-                    try:
-                        _, intvlEnd = next(spanRange)
-                    except StopIteration:
-                        continue
-                yield intvlStart, intvlEnd
-            except StopIteration:
-                return
-
-    # representations
-
-    def __repr__(self) -> str:
-        return f"<{self.__class__.__name__} [{self.__str__()}]>"
+        yield from cls._iter_spans(frame, start, end, tz, None, bounds, exact, interval)
 
-    def __str__(self) -> str:
-        return self._datetime.isoformat()
+    @classmethod
+    def span_range_chunks(
+        cls,
+        frame: _T_FRAMES,
+        start: dt_datetime,
+        end: dt_datetime,
+        n: int,
+        tz: Optional[TZ_EXPR] = None,
+    ) -> List[Tuple["Arrow", "Arrow"]]:
+        """Returns a list of tuples, each the start of the first and the end of the last
+        timespan of a chunk of :func:`span_range <arrow.arrow.Arrow.span_range>` between two
+        inputs, which is split into ``n`` chunks of nearly equal length.
 
-    def __format__(self, formatstr: str) -> str:
-        if len(formatstr) > 0:
-            return self.format(formatstr)
+        :param frame: The timeframe.  Can be any ``datetime`` property (day, hour, minute...).
+        :param start: A datetime expression, the start of the range.
+        :param end: A datetime expression, the end of the range.
+        :param n: The number of chunks.
+        :param tz: (optional) A :ref:`timezone expression <tz-expr>`.  Defaults to
+            ``start``'s timezone, or UTC if ``start`` is naive.
 
-        return str(self)
+        ``Arrow.span_range(frame, floor, ceil)`` returns the timespans of a chunk, and the
+        chunks are computed as in :func:`range_chunks <arrow.arrow.Arrow.range_chunks>`.
 
-    def __hash__(self) -> int:
-        return self._datetime.__hash__()
+        Usage::
 
-    # attributes and properties
+            >>> start = datetime(2013, 5, 5, 12, 30)
+            >>> end = datetime(2013, 5, 5, 17, 15)
+            >>> for r in arrow.Arrow.span_range_chunks('hour', start, end, 2):
+            ...     print(r)
+            ...
+            (<Arrow [2013-05-05T12:00:00+00:00]>, <Arrow [2013-05-05T14:59:59.999999+00:00]>)
+            (<Arrow [2013-05-05T15:00:00+00:00]>, <Arrow [2013-05-05T17:59:59.999999+00:00]>)
 
-    def __getattr__(self, name: str) -> Any:
-        if name == "week":
-            return self.isocalendar()[1]
+        """
 
-        if name == "quarter":
-            return int((self.month - 1) / self._MONTHS_PER_QUARTER) + 1
+        if n < 1:
+            raise ValueError("n has to be a positive integer")
 
-        if not name.startswith("_"):
-            value: Optional[Any] = getattr(self._datetime, name, None)
+        frame_absolute, frame_relative, relative_steps = cls._get_frames(frame)
 
-            if value is not None:
-                return value
+        tzinfo = cls._get_tzinfo(start.tzinfo if tz is None else tz)
+        range_start = cls.fromdatetime(start, tzinfo)._span(frame)[0]
+
+        # the timespans start at the points of Arrow.range, as in span_range
+        range_tzinfo = cls._get_tzinfo(range_start.tzinfo if tz is None else tz)
+        first = cls.fromdatetime(
+            range_start._datetime.replace(tzinfo=range_tzinfo)
+        )._datetime
+        last = cls.fromdatetime(end, tzinfo)._datetime.replace(tzinfo=range_tzinfo)
+
+        chunks = cls._chunk_range(frame, frame_relative, relative_steps, first, last, n)
+        if not chunks:
+            return []
+
+        tail = cls._span_datetime(
+            chunks[-1][1],
+            frame_absolute,
+            frame_relative,
+            relative_steps,
+            "[)",
+            False,
+            1,
+        )[0]
+        floors = [
+            cls._span_datetime(
+                point, frame_absolute, frame_relative, relative_steps, "[)", False, 1
+            )[0]
+            for point in [head for head, _ in chunks]
+            + [cls._shift_datetime(tail, frame_relative, relative_steps)]
+        ]
+        # each chunk ends where the timespan after it starts, which is not always the end
+        # of the timespan of its last point across a DST gap
+        ceils = [floor - timedelta(microseconds=1) for floor in floors[1:]]
+
+        return [
+            (cls._wrap_datetime(floor), cls._wrap_datetime(ceil))
+            for floor, ceil in zip(floors, ceils)
+        ]
 
-        return cast(int, object.__getattribute__(self, name))
+    @classmethod
+    def floor_many(
+        cls,
+        values: Iterable[Union["Arrow", dt_datetime, int, float, str]],
+        frame: _T_FRAMES,
+        tz: Optional[TZ_EXPR] = None,
+        week_start: int = 1,
+        multiple: int = 1,
+        timestamps: bool = False,
+    ) -> List[Union["Arrow", float]]:
+        """Returns a list with the floor of each value in a given timeframe, as returned by
+        :func:`floor <arrow.arrow.Arrow.floor>`.
+
+        :param values: an iterable of :class:`Arrow <arrow.arrow.Arrow>` objects, ``datetime``
+            objects or timestamps.
+        :param frame: the timeframe.  Can be any ``datetime`` property (day, hour, minute...).
+        :param tz: (optional) A :ref:`timezone expression <tz-expr>` to convert the values to
+            before taking their floor.  Defaults to the timezone of each value, UTC for
+            timestamps and naive ``datetime`` objects.
+        :param week_start: (optional) only used in combination with the week timeframe. Follows isoweekday() where
+            Monday is 1 and Sunday is 7.
+        :param multiple: (optional) the number of frames in each bucket.  Buckets are aligned
+            on multiples of the frame within the next larger timeframe, so that 15 minute buckets
+            start at 0, 15, 30 and 45 minutes past each hour.  Day buckets restart on the first of
+            each month, and week buckets are counted from 0001-01-01.  Defaults to 1.
+        :param timestamps: (optional) whether to return the floors as ``float`` timestamps
+            instead of :class:`Arrow <arrow.arrow.Arrow>` objects.  Defaults to False.
 
-    @property
-    def tzinfo(self) -> dt_tzinfo:
-        """Gets the ``tzinfo`` of the :class:`Arrow <arrow.arrow.Arrow>` object.
+        Values falling in the same bucket as the value before them reuse its floor, so sorted
+        input is bucketed without recomputing each floor.  In that case the returned
+        :class:`Arrow <arrow.arrow.Arrow>` objects are shared.
 
         Usage::
 
-            >>> arw=arrow.utcnow()
-            >>> arw.tzinfo
-            tzutc()
+            >>> values = [1368082800, 1368083400, 1368084600]
+            >>> arrow.Arrow.floor_many(values, 'minute', multiple=15)
+            [<Arrow [2013-05-09T07:00:00+00:00]>, <Arrow [2013-05-09T07:00:00+00:00]>, <Arrow [2013-05-09T07:30:00+00:00]>]
+
+            >>> arrow.Arrow.floor_many(values, 'hour', tz='US/Pacific', timestamps=True)
+            [1368082800.0, 1368082800.0, 1368082800.0]
 
         """
 
-        # In Arrow, `_datetime` cannot be naive.
-        return cast(dt_tzinfo, self._datetime.tzinfo)
+        frame_absolute, frame_relative, relative_steps = cls._get_frames(frame)
 
-    @property
-    def datetime(self) -> dt_datetime:
-        """Returns a datetime representation of the :class:`Arrow <arrow.arrow.Arrow>` object.
+        if frame_absolute == "week" and not 1 <= week_start <= 7:
+            raise ValueError("week_start argument must be between 1 and 7.")
 
-        Usage::
+        if multiple < 1:
+            raise ValueError("multiple has to be a positive integer")
 
-            >>> arw=arrow.utcnow()
-            >>> arw.datetime
-            datetime.datetime(2019, 1, 24, 16, 35, 27, 276649, tzinfo=tzutc())
+        tzinfo = None if tz is None else cls._normalize_tzinfo(cls._get_tzinfo(tz))
 
-        """
+        floors: List[Union["Arrow", float]] = []
+        previous: Optional[dt_datetime] = None
+        bucket: Union["Arrow", float] = 0.0
 
-        return self._datetime
+        for lower, _ in cls._iter_buckets(
+            values,
+            frame_absolute,
+            frame_relative,
+            relative_steps,
+            tzinfo,
+            week_start,
+            multiple,
+        ):
+            if lower is not previous:
+                floor = lower.replace(fold=0)
+                if frame_absolute in ["week", "quarter"] and not cls._is_fixed_offset(
+                    lower.tzinfo
+                ):
+                    floor = cls._resolve_imaginary(floor)
 
-    @property
-    def naive(self) -> dt_datetime:
-        """Returns a naive datetime representation of the :class:`Arrow <arrow.arrow.Arrow>`
-        object.
+                bucket = floor.timestamp() if timestamps else cls._wrap_datetime(floor)
+                previous = lower
 
-        Usage::
+            floors.append(bucket)
 
-            >>> nairobi = arrow.now('Africa/Nairobi')
-            >>> nairobi
-            <Arrow [2019-01-23T19:27:12.297999+03:00]>
-            >>> nairobi.naive
-            datetime.datetime(2019, 1, 23, 19, 27, 12, 297999)
+        return floors
 
-        """
+    @classmethod
+    def resample(
+        cls,
+        stream: Iterable[Tuple[Union["Arrow", dt_datetime, int, float, str], Any]],
+        frame: _T_FRAMES,
+        tz: Optional[TZ_EXPR] = None,
+        agg: Union[_AGGREGATES, Callable[[List[Any]], Any]] = "count",
+        bounds: _BOUNDS = "[)",
+        week_start: int = 1,
+        fill: bool = False,
+    ) -> Generator[Tuple[Tuple["Arrow", "Arrow"], Any], None, None]:
+        """Returns an iterator of tuples, each a timespan of a given timeframe and the aggregate
+        of the values of a time-sorted stream that fall within it.
 
-        return self._datetime.replace(tzinfo=None)
+        :param stream: an iterable of ``(time, value)`` tuples, sorted by time.  Each time is an
+            :class:`Arrow <arrow.arrow.Arrow>` object, a ``datetime`` object or a timestamp.
+        :param frame: the timeframe.  Can be any ``datetime`` property (day, hour, minute...).
+        :param tz: (optional) A :ref:`timezone expression <tz-expr>`.  Defaults to the timezone
+            of the first time in the stream, UTC for timestamps and naive ``datetime`` objects.
+        :param agg: (optional) the aggregate of the values in each timespan, either one of
+            'count', 'sum', 'min', 'max', 'mean', 'first' or 'last', or a function called with
+            the ``list`` of values in the timespan.  Defaults to 'count'.
+        :param bounds: (optional) a ``str`` of either '()', '(]', '[)', or '[]' that specifies
+            whether to include or exclude the start and end values in the timespans, as in
+            :func:`span_range <arrow.arrow.Arrow.span_range>`.  Times on the end of a timespan
+            are aggregated in it as well as in the next one when ']' is used.
+            If the bounds are not specified, the default bound '[)' is used.
+        :param week_start: (optional) only used in combination with the week timeframe. Follows isoweekday() where
+            Monday is 1 and Sunday is 7.
+        :param fill: (optional) whether to also return the timespans without values between
+            the first and last ones, with the aggregate of no values.  Defaults to False.
 
-    def timestamp(self) -> float:
-        """Returns a timestamp representation of the :class:`Arrow <arrow.arrow.Arrow>` object, in
-        UTC time.
+        The stream is consumed lazily in a single pass.  The named aggregates are computed as
+        the values arrive, so memory use does not depend on the length of the stream.
 
         Usage::
 
-            >>> arrow.utcnow().timestamp()
-            1616882340.256501
+            >>> stream = [(1368082800, 2), (1368083400, 3), (1368090000, 5)]
+            >>> for span, total in arrow.Arrow.resample(stream, 'hour', agg='sum', fill=True):
+            ...     print(span[0], total)
+            ...
+            2013-05-09T07:00:00+00:00 5
+            2013-05-09T08:00:00+00:00 0
+            2013-05-09T09:00:00+00:00 5
 
         """
 
-        return self._datetime.timestamp()
+        util.validate_bounds(bounds)
 
-    @property
-    def int_timestamp(self) -> int:
-        """Returns an integer timestamp representation of the :class:`Arrow <arrow.arrow.Arrow>` object, in
+        frame_absolute, frame_relative, relative_steps = cls._get_frames(frame)
+
+        if frame_absolute == "week" and not 1 <= week_start <= 7:
+            raise ValueError("week_start argument must be between 1 and 7.")
+
+        if callable(agg):
+            start: Callable[[], Any] = list
+            step: Callable[[Any, Any], Any] = lambda values, value: (  # noqa: E731
+                values.append(value) or values
+            )
+            result = agg
+        elif agg in cls._AGGREGATORS:
+            start, step, result = cls._AGGREGATORS[agg]
+        else:
+            raise ValueError(f"Unsupported aggregate {agg!r}.")
+
+        records = iter(stream)
+        first = next(records, None)
+        if first is None:
+            return
+        records = chain([first], records)
+
+        tzinfo = cls._get_bucket_tzinfo(tz, first[0])
+        include_start, include_end = bounds[0] == "[", bounds[1] == "]"
+
+        def span_pair(lower: dt_datetime) -> Tuple["Arrow", "Arrow"]:
+            floor, ceil = cls._bucket_span(
+                lower,
+                frame_absolute,
+                frame_relative,
+                relative_steps,
+                bounds,
+                week_start,
+            )
+            return cls._wrap_datetime(floor), cls._wrap_datetime(ceil)
+
+        def next_floor(lower: dt_datetime) -> dt_datetime:
+            return cls._next_bucket_floor(
+                lower, frame_absolute, frame_relative, relative_steps, week_start
+            )
+
+        # the timespans that can still receive values, as [start instant, floor, state]
+        # lists, and the start instant of the last timespan returned.  Timespans are
+        # ordered by instant, as wall clock floors repeat in DST folds.
+        periods: List[List[Any]] = []
+        emitted: Optional[dt_datetime] = None
+
+        def close(
+            key: dt_datetime, floor: dt_datetime, state: Any
+        ) -> Generator[Tuple[Tuple["Arrow", "Arrow"], Any], None, None]:
+            nonlocal emitted
+            if fill and emitted is not None:
+                gap = next_floor(emitted.astimezone(tzinfo))
+                while cls._bucket_start(gap) < key:
+                    yield span_pair(gap), result(start())
+                    gap = next_floor(gap)
+
+            yield span_pair(floor), result(state)
+            emitted = key
+
+        times, values = tee(records)
+        for (lower, on_floor), (_, value) in zip(
+            cls._iter_buckets(
+                (record[0] for record in times),
+                frame_absolute,
+                frame_relative,
+                relative_steps,
+                tzinfo,
+                week_start,
+                1,
+            ),
+            values,
+        ):
+            if periods and periods[-1][1] is lower and not on_floor:
+                periods[-1][2] = step(periods[-1][2], value)
+                continue
+
+            targets = []
+            if not on_floor or include_start:
+                targets.append(lower)
+            if on_floor and include_end:
+                previous = lower.astimezone(timezone.utc) - timedelta(microseconds=1)
+                targets.insert(
+                    0,
+                    cls._bucket_floor(
+                        previous.astimezone(tzinfo),
+                        frame_absolute,
+                        frame_relative,
+                        relative_steps,
+                        week_start,
+                        1,
+                    ),
+                )
+
+            keys = [cls._bucket_start(target) for target in targets]
+            if not keys:
+                continue
+
+            if (
+                keys[0] < periods[0][0]
+                if periods
+                else emitted is not None and keys[0] <= emitted
+            ):
+                raise ValueError("The stream is not sorted by time.")
+
+            # return the timespans that can no longer receive values
+            while periods and periods[0][0] < keys[0]:
+                yield from close(*periods.pop(0))
+
+            for key, target in zip(keys, targets):
+                for period in periods:
+                    if period[0] == key:
+                        period[1] = target
+                        period[2] = step(period[2], value)
+                        break
+                else:
+                    periods.append([key, target, step(start(), value)])
+
+        for period in periods:
+            yield from close(*period)
+
+    @classmethod
+    def find_gaps(
+        cls,
+        values: Iterable[Union["Arrow", dt_datetime, int, float, str]],
+        frame: _T_FRAMES,
+        start: Optional[Union["Arrow", dt_datetime, int, float]] = None,
+        end: Optional[Union["Arrow", dt_datetime, int, float]] = None,
+        tz: Optional[TZ_EXPR] = None,
+        bounds: _BOUNDS = "[)",
+        week_start: int = 1,
+    ) -> Generator[Tuple["Arrow", "Arrow"], None, None]:
+        """Returns an iterator of tuples, each a gap in a time-sorted series of values: the
+        start of the first and the end of the last of consecutive timespans of a given
+        timeframe that hold no value.
+
+        :param values: an iterable of times, sorted.  Each time is an
+            :class:`Arrow <arrow.arrow.Arrow>` object, a ``datetime`` object or a timestamp.
+        :param frame: the timeframe.  Can be any ``datetime`` property (day, hour, minute...).
+        :param start: (optional) the start of the series, as a time.  Defaults to the first value.
+        :param end: (optional) the end of the series, as a time.  Defaults to the last value.
+        :param tz: (optional) A :ref:`timezone expression <tz-expr>`.  Defaults to the timezone
+            of ``start``, or of the first value if ``start`` is not given, UTC for timestamps
+            and naive ``datetime`` objects.
+        :param bounds: (optional) a ``str`` of either '()', '(]', '[)', or '[]' that specifies
+            whether to include or exclude the start and end values in the gaps.
+            If the bounds are not specified, the default bound '[)' is used.
+        :param week_start: (optional) only used in combination with the week timeframe. Follows isoweekday() where
+            Monday is 1 and Sunday is 7.
+
+        The timespans are those of :func:`span_range <arrow.arrow.Arrow.span_range>` from
+        ``start`` to ``end``.  The values are consumed lazily in a single pass, and each gap is
+        computed from the values around it, so long gaps cost no more than short ones.
+        Values before ``start`` are skipped, and values after ``end`` are not read.
+
+        Usage::
+
+            >>> values = [1368082800, 1368083400, 1368093600]
+            >>> for gap in arrow.Arrow.find_gaps(values, 'hour'):
+            ...     print(gap)
+            ...
+            (<Arrow [2013-05-09T08:00:00+00:00]>, <Arrow [2013-05-09T09:59:59.999999+00:00]>)
+
+        """
+
+        util.validate_bounds(bounds)
+
+        frame_absolute, frame_relative, relative_steps = cls._get_frames(frame)
+
+        if frame_absolute == "week" and not 1 <= week_start <= 7:
+            raise ValueError("week_start argument must be between 1 and 7.")
+
+        times = iter(values)
+        if tz is None and start is None:
+            first = next(times, None)
+            if first is None:
+                return
+            times = chain([first], times)
+            tzinfo = cls._get_bucket_tzinfo(None, first)
+        else:
+            tzinfo = cls._get_bucket_tzinfo(tz, start)
+
+        def floor_of(value: Union["Arrow", dt_datetime, int, float]) -> dt_datetime:
+            return next(
+                cls._iter_buckets(
+                    [value],
+                    frame_absolute,
+                    frame_relative,
+                    relative_steps,
+                    tzinfo,
+                    week_start,
+                    1,
+                )
+            )[0]
+
+        def next_floor(lower: dt_datetime) -> dt_datetime:
+            return cls._next_bucket_floor(
+                lower, frame_absolute, frame_relative, relative_steps, week_start
+            )
+
+        def span_of(lower: dt_datetime) -> Tuple[dt_datetime, dt_datetime]:
+            return cls._bucket_span(
+                lower,
+                frame_absolute,
+                frame_relative,
+                relative_steps,
+                bounds,
+                week_start,
+            )
+
+        def gap(lower: dt_datetime, upper: dt_datetime) -> Tuple["Arrow", "Arrow"]:
+            # the timespans from the one with the floor ``lower`` to the one before the
+            # instant ``upper``, found without stepping through them
+            last = floor_of(upper - timedelta(microseconds=1))
+            return (
+                cls._wrap_datetime(span_of(lower)[0]),
+                cls._wrap_datetime(span_of(last)[1]),
+            )
+
+        # the floor of the first timespan not known to hold a value, and the instant at
+        # which the timespan of ``end`` ends
+        expected = None if start is None else floor_of(start)
+        stop = None if end is None else cls._bucket_start(next_floor(floor_of(end)))
+
+        previous: Optional[dt_datetime] = None
+        previous_key: Optional[dt_datetime] = None
+        for lower, _ in cls._iter_buckets(
+            times,
+            frame_absolute,
+            frame_relative,
+            relative_steps,
+            tzinfo,
+            week_start,
+            1,
+        ):
+            if lower is previous:
+                continue
+
+            key = cls._bucket_start(lower)
+            if previous_key is not None and key < previous_key:
+                raise ValueError("The values are not sorted by time.")
+            previous, previous_key = lower, key
+
+            if stop is not None and key >= stop:
+                break
+
+            if expected is None:
+                expected = lower
+            expected_key = cls._bucket_start(expected)
+            if key < expected_key:
+                continue
+            if key > expected_key:
+                yield gap(expected, key)
+
+            expected = next_floor(lower)
+
+        if (
+            expected is not None
+            and stop is not None
+            and cls._bucket_start(expected) < stop
+        ):
+            yield gap(expected, stop)
+
+    @classmethod
+    def convert_many(
+        cls,
+        values: Iterable[Union["Arrow", dt_datetime, int, float, str]],
+        tz: TZ_EXPR,
+        output: _CONVERT_OUTPUT = "arrow",
+    ) -> List[Union["Arrow", dt_datetime, Tuple[float, int]]]:
+        """Returns a list with each value converted to a timezone, as returned by
+        :func:`to <arrow.arrow.Arrow.to>`.
+
+        :param values: an iterable of :class:`Arrow <arrow.arrow.Arrow>` objects, ``datetime``
+            objects or timestamps.  Timestamps and naive ``datetime`` objects are in UTC.
+        :param tz: A :ref:`timezone expression <tz-expr>`.
+        :param output: (optional) the type of the converted values: 'arrow' for
+            :class:`Arrow <arrow.arrow.Arrow>` objects, 'datetime' for ``datetime`` objects, or
+            'epoch' for tuples of a ``float`` timestamp and the UTC offset in seconds.
+            Defaults to 'arrow'.
+
+        The UTC offset of a value is reused for the following values until the next UTC
+        offset transition of the timezone is near, so sorted input is converted without
+        looking up each offset.
+
+        Usage::
+
+            >>> values = [1368082800, 1368083400, 1368084600]
+            >>> arrow.Arrow.convert_many(values, 'US/Pacific')
+            [<Arrow [2013-05-09T00:00:00-07:00]>, <Arrow [2013-05-09T00:10:00-07:00]>, <Arrow [2013-05-09T00:30:00-07:00]>]
+
+            >>> arrow.Arrow.convert_many(values, 'US/Pacific', output='epoch')
+            [(1368082800.0, -25200), (1368083400.0, -25200), (1368084600.0, -25200)]
+
+        """
+
+        cls._validate_convert_output(output)
+
+        tzinfo = cls._normalize_tzinfo(cls._get_tzinfo(tz))
+
+        converted: List[Union["Arrow", dt_datetime, Tuple[float, int]]] = []
+        lower = upper = dt_datetime.max.replace(tzinfo=timezone.utc)
+        offset = timedelta(0)
+        seconds = 0
+
+        for value in values:
+            if isinstance(value, Arrow):
+                utc = value._datetime.astimezone(timezone.utc)
+            elif isinstance(value, dt_datetime):
+                utc = (
+                    value.astimezone(timezone.utc)
+                    if value.tzinfo
+                    else value.replace(tzinfo=timezone.utc)
+                )
+            elif util.is_timestamp(value):
+                utc = dt_datetime.fromtimestamp(
+                    util.normalize_timestamp(float(value)), timezone.utc
+                )
+            else:
+                raise ValueError(
+                    f"{value!r} not recognized as a datetime or timestamp."
+                )
+
+            if lower <= utc < upper:
+                if output == "epoch":
+                    converted.append((utc.timestamp(), seconds))
+                    continue
+                local = (utc + offset).replace(tzinfo=tzinfo)
+            else:
+                local = utc.astimezone(tzinfo)
+                bounds = cls._transition_free_range(tzinfo, utc)
+                if bounds is not None:
+                    lower, upper = bounds
+                    offset = cast(timedelta, local.utcoffset())
+                    seconds = int(offset.total_seconds())
+
+            converted.append(cls._convert_output(utc, local, output))
+
+        return converted
+
+    # representations
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} [{self.__str__()}]>"
+
+    def __str__(self) -> str:
+        return self._datetime.isoformat()
+
+    def __format__(self, formatstr: str) -> str:
+        if len(formatstr) > 0:
+            return self.format(formatstr)
+
+        return str(self)
+
+    def __hash__(self) -> int:
+        return self._datetime.__hash__()
+
+    # attributes and properties
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "week":
+            return self.isocalendar()[1]
+
+        if name == "quarter":
+            return int((self.month - 1) / self._MONTHS_PER_QUARTER) + 1
+
+        if not name.startswith("_"):
+            value: Optional[Any] = getattr(self._datetime, name, None)
+
+            if value is not None:
+                return value
+
+        return cast(int, object.__getattribute__(self, name))
+
+    @property
+    def tzinfo(self) -> dt_tzinfo:
+        """Gets the ``tzinfo`` of the :class:`Arrow <arrow.arrow.Arrow>` object.
+
+        Usage::
+
+            >>> arw=arrow.utcnow()
+            >>> arw.tzinfo
+            tzutc()
+
+        """
+
+        # In Arrow, `_datetime` cannot be naive.
+        return cast(dt_tzinfo, self._datetime.tzinfo)
+
+    @property
+    def datetime(self) -> dt_datetime:
+        """Returns a datetime representation of the :class:`Arrow <arrow.arrow.Arrow>` object.
+
+        Usage::
+
+            >>> arw=arrow.utcnow()
+            >>> arw.datetime
+            datetime.datetime(2019, 1, 24, 16, 35, 27, 276649, tzinfo=tzutc())
+
+        """
+
+        return self._datetime
+
+    @property
+    def naive(self) -> dt_datetime:
+        """Returns a naive datetime representation of the :class:`Arrow <arrow.arrow.Arrow>`
+        object.
+
+        Usage::
+
+            >>> nairobi = arrow.now('Africa/Nairobi')
+            >>> nairobi
+            <Arrow [2019-01-23T19:27:12.297999+03:00]>
+            >>> nairobi.naive
+            datetime.datetime(2019, 1, 23, 19, 27, 12, 297999)
+
+        """
+
+        return self._datetime.replace(tzinfo=None)
+
+    def timestamp(self) -> float:
+        """Returns a timestamp representation of the :class:`Arrow <arrow.arrow.Arrow>` object, in
+        UTC time.
+
+        Usage::
+
+            >>> arrow.utcnow().timestamp()
+            1616882340.256501
+
+        """
+
+        return self._datetime.timestamp()
+
+    @property
+    def int_timestamp(self) -> int:
+        """Returns an integer timestamp representation of the :class:`Arrow <arrow.arrow.Arrow>` object, in
         UTC time.
 
         Usage::
@@ -925,13 +1755,13 @@ class Arrow:
 
         """
 
-        return dateutil_tz.datetime_ambiguous(self._datetime)
+        return self._datetime_ambiguous(self._datetime)
 
     @property
     def imaginary(self) -> bool:
         """Indicates whether the :class: `Arrow <arrow.arrow.Arrow>` object exists in the current timezone."""
 
-        return not dateutil_tz.datetime_exists(self._datetime)
+        return not self._datetime_exists(self._datetime)
 
     # mutation and duplication.
 
@@ -1028,6 +1858,11 @@ class Arrow:
 
         """
 
+        if instrumentation._hooks and instrumentation._outermost():
+            return instrumentation._observe(
+                "shift", Arrow.shift, self, check_imaginary, **kwargs
+            )
+
         relative_kwargs = {}
         additional_attrs = ["weeks", "quarters", "weekday"]
 
@@ -1040,17 +1875,34 @@ class Arrow:
                     f"Invalid shift time frame. Please select one of the following: {supported_attr}."
                 )
 
-        # core datetime does not support quarters, translate to months.
-        relative_kwargs.setdefault("months", 0)
-        relative_kwargs["months"] += (
-            relative_kwargs.pop("quarters", 0) * self._MONTHS_PER_QUARTER
-        )
+        if all(
+            key in self._ATTRS_FIXED_LENGTH and isinstance(value, int)
+            for key, value in relative_kwargs.items()
+        ):
+            # fixed-length units only, plain timedelta arithmetic is equivalent.
+            current = self._datetime + timedelta(**relative_kwargs)
+        else:
+            # core datetime does not support quarters, translate to months.
+            relative_kwargs.setdefault("months", 0)
+            relative_kwargs["months"] += (
+                relative_kwargs.pop("quarters", 0) * self._MONTHS_PER_QUARTER
+            )
+
+            import dateutil.relativedelta
 
-        current = self._datetime + relativedelta(**relative_kwargs)
+            current = self._datetime + dateutil.relativedelta.relativedelta(
+                **relative_kwargs
+            )
 
         # If check_imaginary is True, perform the check for imaginary times (DST transitions)
-        if check_imaginary and not dateutil_tz.datetime_exists(current):
-            current = dateutil_tz.resolve_imaginary(current)
+        if (
+            check_imaginary
+            and not self._is_fixed_offset(current.tzinfo)
+            and not self._datetime_exists(current)
+        ):
+            import dateutil.tz
+
+            current = dateutil.tz.resolve_imaginary(current)
 
         return self.fromdatetime(current)
 
@@ -1100,11 +1952,40 @@ class Arrow:
             fold=getattr(dt, "fold", 0),
         )
 
+    def to_many(
+        self, tzs: Iterable[TZ_EXPR], output: _CONVERT_OUTPUT = "arrow"
+    ) -> List[Union["Arrow", dt_datetime, Tuple[float, int]]]:
+        """Returns a list with this :class:`Arrow <arrow.arrow.Arrow>` object converted to
+        each of many timezones, as returned by :func:`to <arrow.arrow.Arrow.to>`.
+
+        :param tzs: an iterable of :ref:`timezone expressions <tz-expr>`.
+        :param output: (optional) the type of the converted values, see
+            :func:`convert_many <arrow.arrow.Arrow.convert_many>`.  Defaults to 'arrow'.
+
+        Usage::
+
+            >>> utc = arrow.Arrow(2013, 5, 9, 3, 49, 12)
+            >>> utc.to_many(['US/Pacific', 'Europe/Paris'])
+            [<Arrow [2013-05-08T20:49:12-07:00]>, <Arrow [2013-05-09T05:49:12+02:00]>]
+
+        """
+
+        self._validate_convert_output(output)
+
+        utc = self._datetime.astimezone(timezone.utc)
+
+        return [
+            self._convert_output(
+                utc,
+                utc.astimezone(self._normalize_tzinfo(self._get_tzinfo(tz))),
+                output,
+            )
+            for tz in tzs
+        ]
+
     # string output and formatting
 
-    def format(
-        self, fmt: str = "YYYY-MM-DD HH:mm:ssZZ", locale: str = DEFAULT_LOCALE
-    ) -> str:
+    def format(self, fmt: str = _DEFAULT_FORMAT, locale: str = DEFAULT_LOCALE) -> str:
         """Returns a string representation of the :class:`Arrow <arrow.arrow.Arrow>` object,
         formatted according to the provided format string. For a list of formatting values,
         see :ref:`supported-tokens`
@@ -1158,113 +2039,209 @@ class Arrow:
 
         """
 
-        locale_name = locale
-        locale = locales.get_locale(locale)
+        if instrumentation._hooks and instrumentation._outermost():
+            return instrumentation._observe(
+                "humanize",
+                Arrow.humanize,
+                self,
+                other,
+                locale,
+                only_distance,
+                granularity,
+            )
 
         if other is None:
-            utc = dt_datetime.now(timezone.utc).replace(tzinfo=timezone.utc)
-            dt = utc.astimezone(self._datetime.tzinfo)
+            other = dt_datetime.now(timezone.utc).replace(tzinfo=timezone.utc)
+
+        return self._humanize(
+            self._get_humanize_other(other, self._datetime.tzinfo),
+            locales.get_locale(locale),
+            locale,
+            only_distance,
+            granularity,
+        )
 
-        elif isinstance(other, Arrow):
-            dt = other._datetime
+    @classmethod
+    def humanize_many(
+        cls,
+        values: Iterable[Union["Arrow", dt_datetime, int, float, str]],
+        other: Union["Arrow", dt_datetime, None] = None,
+        locale: str = DEFAULT_LOCALE,
+        only_distance: bool = False,
+        granularity: Union[_GRANULARITY, List[_GRANULARITY]] = "auto",
+    ) -> List[str]:
+        """Returns a list with a localized, humanized representation of the relative
+        difference in time of each value, as returned by
+        :func:`humanize <arrow.arrow.Arrow.humanize>`.
 
-        elif isinstance(other, dt_datetime):
-            if other.tzinfo is None:
-                dt = other.replace(tzinfo=self._datetime.tzinfo)
-            else:
-                dt = other.astimezone(self._datetime.tzinfo)
+        :param values: an iterable of :class:`Arrow <arrow.arrow.Arrow>` objects, ``datetime``
+            objects or timestamps.  Timestamps and naive ``datetime`` objects are in UTC.
+        :param other: (optional) an :class:`Arrow <arrow.arrow.Arrow>` or ``datetime`` object.
+            Defaults to now, read once for all the values.
 
-        else:
-            raise TypeError(
-                f"Invalid 'other' argument of type {type(other).__name__!r}. "
-                "Argument must be of type None, Arrow, or datetime."
-            )
+        See :func:`humanize <arrow.arrow.Arrow.humanize>` for the other arguments.  The locale
+        is looked up once, and ``other`` is converted once per run of values sharing a
+        timezone.
 
-        if isinstance(granularity, list) and len(granularity) == 1:
-            granularity = granularity[0]
+        Usage::
 
-        _delta = int(round((self._datetime - dt).total_seconds()))
-        sign = -1 if _delta < 0 else 1
-        delta_second = diff = abs(_delta)
+            >>> now = arrow.Arrow(2013, 5, 9, 12)
+            >>> arrow.Arrow.humanize_many([1368093600, 1368100800], now)
+            ['2 hours ago', 'just now']
 
-        try:
-            if granularity == "auto":
-                if diff < 10:
-                    return locale.describe("now", only_distance=only_distance)
+        """
 
-                if diff < self._SECS_PER_MINUTE:
-                    seconds = sign * delta_second
-                    return locale.describe(
-                        "seconds", seconds, only_distance=only_distance
-                    )
+        locale_obj = locales.get_locale(locale)
 
-                elif diff < self._SECS_PER_MINUTE * 2:
-                    return locale.describe("minute", sign, only_distance=only_distance)
+        if other is None:
+            other = dt_datetime.now(timezone.utc).replace(tzinfo=timezone.utc)
 
-                elif diff < self._SECS_PER_HOUR:
-                    minutes = sign * max(delta_second // self._SECS_PER_MINUTE, 2)
-                    return locale.describe(
-                        "minutes", minutes, only_distance=only_distance
-                    )
+        humanized: List[str] = []
+        tzinfo: Optional[dt_tzinfo] = None
+        dt = dt_datetime.min
 
-                elif diff < self._SECS_PER_HOUR * 2:
-                    return locale.describe("hour", sign, only_distance=only_distance)
+        for value in values:
+            arrow = (
+                value
+                if isinstance(value, Arrow)
+                else cls.fromdatetime(cls._get_datetime(value))
+            )
 
-                elif diff < self._SECS_PER_DAY:
-                    hours = sign * max(delta_second // self._SECS_PER_HOUR, 2)
-                    return locale.describe("hours", hours, only_distance=only_distance)
+            if dt is dt_datetime.min or arrow._datetime.tzinfo is not tzinfo:
+                tzinfo = arrow._datetime.tzinfo
+                dt = cls._get_humanize_other(other, tzinfo)
 
-                calendar_diff = (
-                    relativedelta(dt, self._datetime)
-                    if self._datetime < dt
-                    else relativedelta(self._datetime, dt)
-                )
-                calendar_months = (
-                    calendar_diff.years * self._MONTHS_PER_YEAR + calendar_diff.months
-                )
+            humanized.append(
+                arrow._humanize(dt, locale_obj, locale, only_distance, granularity)
+            )
 
-                # For months, if more than 2 weeks, count as a full month
-                if calendar_diff.days > 14:
-                    calendar_months += 1
+        return humanized
 
-                calendar_months = min(calendar_months, self._MONTHS_PER_YEAR)
+    @classmethod
+    def warmup(
+        cls,
+        formats: Iterable[str] = (),
+        locales: Iterable[str] = (DEFAULT_LOCALE,),
+        timezones: Iterable[TZ_EXPR] = (),
+    ) -> None:
+        """Fills the internal caches used to parse, format, humanize and convert ahead of
+        their first use, so that the first calls of a process are as fast as the next ones.
 
-                if diff < self._SECS_PER_DAY * 2:
-                    return locale.describe("day", sign, only_distance=only_distance)
+        :param formats: (optional) an iterable of format strings to prepare for parsing
+            and formatting in each locale.
+        :param locales: (optional) an iterable of locale names to load.  Defaults to
+            ``['en-us']``.
+        :param timezones: (optional) an iterable of timezone expressions to load, along
+            with their UTC offset transitions of the current year.
 
-                elif diff < self._SECS_PER_WEEK:
-                    days = sign * max(delta_second // self._SECS_PER_DAY, 2)
-                    return locale.describe("days", days, only_distance=only_distance)
+        The modules arrow imports on first use are loaded, and the ISO 8601 patterns most
+        commonly parsed are compiled for each locale.  Nothing is left running and no lock
+        is held afterwards, so a process that forks after calling it, like a gunicorn
+        master with ``preload_app`` enabled, shares the warmed caches with its workers.
 
-                elif calendar_months >= 1 and diff < self._SECS_PER_YEAR:
-                    if calendar_months == 1:
-                        return locale.describe(
-                            "month", sign, only_distance=only_distance
-                        )
-                    else:
-                        months = sign * calendar_months
-                        return locale.describe(
-                            "months", months, only_distance=only_distance
-                        )
+        Raises ``ValueError`` for an unknown locale or timezone, and
+        :class:`ParserError <arrow.parser.ParserError>` for a format with an unrecognized
+        token.
 
-                elif diff < self._SECS_PER_WEEK * 2:
-                    return locale.describe("week", sign, only_distance=only_distance)
+        Usage::
 
-                elif diff < self._SECS_PER_MONTH:
-                    weeks = sign * max(delta_second // self._SECS_PER_WEEK, 2)
-                    return locale.describe("weeks", weeks, only_distance=only_distance)
+            >>> arrow.Arrow.warmup(['DD MMM YYYY'], ['en-us', 'fr'], ['US/Pacific'])
 
-                elif diff < self._SECS_PER_YEAR * 2:
-                    return locale.describe("year", sign, only_distance=only_distance)
+        """
 
-                else:
-                    years = sign * max(delta_second // self._SECS_PER_YEAR, 2)
-                    return locale.describe("years", years, only_distance=only_distance)
+        for module in _DEFERRED_MODULES:
+            load(module)
+        for name in _DATEUTIL_MODULES:
+            import_module(name)
 
-            elif isinstance(granularity, str):
-                granularity = cast(TimeFrameLiteral, granularity)  # type: ignore[assignment]
+        formats = list(formats)
 
-                if granularity == "second":
+        for locale in locales:
+            locale_parser = parser.DateTimeParser._get_shared(locale)
+
+            for string in cls._WARMUP_ISO_STRINGS:
+                locale_parser.parse_iso(string)
+            for fmt in formats:
+                locale_parser._get_pattern_re(fmt)
+
+            if locale.lower().replace("_", "-") in DEHUMANIZE_LOCALES:
+                cls._get_dehumanizer(locale_parser.locale)
+
+        for fmt in [*formats, cls._DEFAULT_FORMAT]:
+            formatter.DateTimeFormatter._compile(fmt)
+
+        utc = dt_datetime.now(timezone.utc)
+        for tz in timezones:
+            cls._transition_free_range(cls._get_tzinfo(tz), utc)
+
+    def _humanize(
+        self,
+        dt: dt_datetime,
+        locale: "locales.Locale",
+        locale_name: str,
+        only_distance: bool,
+        granularity: Union[_GRANULARITY, List[_GRANULARITY]],
+    ) -> str:
+        """Returns the result of :meth:`humanize <arrow.arrow.Arrow.humanize>` relative to an
+        aware datetime, with the locale already looked up."""
+
+        if isinstance(granularity, list) and len(granularity) == 1:
+            granularity = granularity[0]
+
+        _delta = int(round((self._datetime - dt).total_seconds()))
+        sign = -1 if _delta < 0 else 1
+        delta_second = diff = abs(_delta)
+
+        try:
+            if granularity == "auto":
+                # the calendar difference only matters between two weeks and a year, as
+                # a UTC offset never changes by more than a day and a calendar month with
+                # more than 14 extra days is therefore at least two weeks away
+                if self._SECS_PER_WEEK * 2 <= diff < self._SECS_PER_YEAR:
+                    import dateutil.relativedelta
+
+                    calendar_diff = (
+                        dateutil.relativedelta.relativedelta(dt, self._datetime)
+                        if self._datetime < dt
+                        else dateutil.relativedelta.relativedelta(self._datetime, dt)
+                    )
+                    calendar_months = (
+                        calendar_diff.years * self._MONTHS_PER_YEAR
+                        + calendar_diff.months
+                    )
+
+                    # For months, if more than 2 weeks, count as a full month
+                    if calendar_diff.days > 14:
+                        calendar_months += 1
+
+                    calendar_months = min(calendar_months, self._MONTHS_PER_YEAR)
+
+                    if calendar_months == 1:
+                        return locale.describe(
+                            "month", sign, only_distance=only_distance
+                        )
+                    elif calendar_months > 1:
+                        months = sign * calendar_months
+                        return locale.describe(
+                            "months", months, only_distance=only_distance
+                        )
+
+                i = bisect_right(self._HUMANIZE_BOUNDS, diff)
+                frame, unit = self._HUMANIZE_FRAMES[i]
+
+                if frame == "now":
+                    return locale.describe("now", only_distance=only_distance)
+
+                if unit == 0:
+                    return locale.describe(frame, sign, only_distance=only_distance)
+
+                count = sign * max(delta_second // unit, 2)
+                return locale.describe(frame, count, only_distance=only_distance)
+
+            elif isinstance(granularity, str):
+                granularity = cast("TimeFrameLiteral", granularity)  # type: ignore[assignment]
+
+                if granularity == "second":
                     delta = sign * float(delta_second)
                     if abs(delta) < 2:
                         return locale.describe("now", only_distance=only_distance)
@@ -1301,13 +2278,15 @@ class Arrow:
 
                 timeframes: List[Tuple[TimeFrameLiteral, float]] = []
 
-                def gather_timeframes(_delta: float, _frame: TimeFrameLiteral) -> float:
+                def gather_timeframes(
+                    _delta: float, _frame: "TimeFrameLiteral"
+                ) -> float:
                     if _frame in granularity:
                         value = sign * _delta / self._SECS_MAP[_frame]
                         _delta %= self._SECS_MAP[_frame]
                         if trunc(abs(value)) != 1:
                             timeframes.append(
-                                (cast(TimeFrameLiteral, _frame + "s"), value)
+                                (cast("TimeFrameLiteral", _frame + "s"), value)
                             )
                         else:
                             timeframes.append((_frame, value))
@@ -1391,57 +2370,28 @@ class Arrow:
             False,
         )
 
-        # Create a regex pattern object for numbers
-        num_pattern = re.compile(r"\d+")
-
-        # Search input string for each time unit within locale
-        for unit, unit_object in locale_obj.timeframes.items():
-            # Need to check the type of unit_object to create the correct dictionary
-            if isinstance(unit_object, Mapping):
-                strings_to_search = unit_object
-            else:
-                strings_to_search = {unit: str(unit_object)}
+        dehumanizer = self._get_dehumanizer(locale_obj)
 
-            # Search for any matches that exist for that locale's unit.
-            # Needs to cycle all through strings as some locales have strings that
-            # could overlap in a regex match, since input validation isn't being performed.
-            for time_delta, time_string in strings_to_search.items():
-                # Replace {0} with regex \d representing digits
-                search_string = str(time_string)
-                search_string = search_string.format(r"\d+")
+        # Search input string for each time unit within locale.
+        # Needs to cycle all through strings as some locales have strings that
+        # could overlap in a regex match, since input validation isn't being performed.
+        for unit, default_value, pattern in dehumanizer.units:
+            match = pattern.search(input_string)
 
-                # Create search pattern and find within string
-                pattern = re.compile(rf"(^|\b|\d){search_string}")
-                match = pattern.search(input_string)
+            # If there is no match continue to next iteration
+            if not match:
+                continue
 
-                # If there is no match continue to next iteration
-                if not match:
-                    continue
-
-                match_string = match.group()
-                num_match = num_pattern.search(match_string)
-
-                # If no number matches
-                # Need for absolute value as some locales have signs included in their objects
-                if not num_match:
-                    change_value = (
-                        1 if not time_delta.isnumeric() else abs(int(time_delta))
-                    )
-                else:
-                    change_value = int(num_match.group())
+            # No time to update if now is the unit
+            if unit == "now":
+                unit_visited[unit] = True
+                continue
 
-                # No time to update if now is the unit
-                if unit == "now":
-                    unit_visited[unit] = True
-                    continue
-
-                # Add change value to the correct unit (incorporates the plurality that exists within timeframe i.e second v.s seconds)
-                time_unit_to_change = str(unit)
-                time_unit_to_change += (
-                    "s" if (str(time_unit_to_change)[-1] != "s") else ""
-                )
-                time_object_info[time_unit_to_change] = change_value
-                unit_visited[time_unit_to_change] = True
+            num_match = self._DIGITS_RE.search(match.group())
+            time_object_info[unit] = (
+                int(num_match.group()) if num_match else default_value
+            )
+            unit_visited[unit] = True
 
         # Assert error if string does not modify any units
         if not any([True for k, v in unit_visited.items() if v]):
@@ -1450,22 +2400,11 @@ class Arrow:
                 "If you are attempting to use the week granularity on an unsupported locale, this could be the cause of this error."
             )
 
-        # Sign logic
-        future_string = locale_obj.future
-        future_string = future_string.format(".*")
-        future_pattern = re.compile(rf"^{future_string}$")
-        future_pattern_match = future_pattern.findall(input_string)
-
-        past_string = locale_obj.past
-        past_string = past_string.format(".*")
-        past_pattern = re.compile(rf"^{past_string}$")
-        past_pattern_match = past_pattern.findall(input_string)
-
         # If a string contains the now unit, there will be no relative units, hence the need to check if the now unit
         # was visited before raising a ValueError
-        if past_pattern_match:
+        if dehumanizer.past.search(input_string):
             sign_val = -1
-        elif future_pattern_match:
+        elif dehumanizer.future.search(input_string):
             sign_val = 1
         elif unit_visited["now"]:
             sign_val = 0
@@ -1476,7 +2415,9 @@ class Arrow:
                 "Ex: 'in 5 seconds' or '5 seconds ago'."
             )
 
-        time_changes = {k: sign_val * v for k, v in time_object_info.items()}
+        # units left at zero are dropped so that fixed-length units can be shifted by
+        # timedelta arithmetic
+        time_changes = {k: sign_val * v for k, v in time_object_info.items() if v}
 
         return current_time.shift(check_imaginary=True, **time_changes)
 
@@ -1540,6 +2481,48 @@ class Arrow:
             and (include_end or target_ts < end_ts)
         )
 
+    def diff(self, other: Union["Arrow", dt_datetime], frame: _T_FRAMES) -> int:
+        """Returns the number of whole timeframes from the :class:`Arrow <arrow.arrow.Arrow>`
+        object to another, negative if the other is earlier.
+
+        :param other: an :class:`Arrow <arrow.arrow.Arrow>` or ``datetime`` object.
+        :param frame: the timeframe.  Can be any ``datetime`` property (day, hour, minute...).
+
+        The other object is converted to the timezone of this one, or given it if naive.  The
+        result is the number of points of :func:`range <arrow.arrow.Arrow.range>` between
+        the earlier and the later object, minus one, as given by
+        :func:`count <arrow.arrow.Arrow.count>`.
+
+        Usage::
+
+            >>> start = arrow.get(datetime(2013, 1, 31))
+            >>> start.diff(arrow.get(datetime(2013, 3, 30)), 'month')
+            1
+            >>> start.diff(arrow.get(datetime(2012, 12, 25)), 'week')
+            -5
+
+        """
+
+        if isinstance(other, Arrow):
+            dt = other._datetime.astimezone(self._datetime.tzinfo)
+
+        elif isinstance(other, dt_datetime):
+            if other.tzinfo is None:
+                dt = other.replace(tzinfo=self._datetime.tzinfo)
+            else:
+                dt = other.astimezone(self._datetime.tzinfo)
+
+        else:
+            raise TypeError(
+                f"Invalid 'other' argument of type {type(other).__name__!r}. "
+                "Argument must be of type Arrow or datetime."
+            )
+
+        if dt >= self._datetime:
+            return self.count(frame, self._datetime, dt) - 1
+
+        return 1 - self.count(frame, dt, self._datetime)
+
     # datetime methods
 
     def date(self) -> dt_date:
@@ -1745,16 +2728,20 @@ class Arrow:
     # math
 
     def __add__(self, other: Any) -> "Arrow":
-        if isinstance(other, (timedelta, relativedelta)):
+        if isinstance(other, timedelta) or _is_relativedelta(other):
             return self.fromdatetime(self._datetime + other, self._datetime.tzinfo)
 
         return NotImplemented
 
-    def __radd__(self, other: Union[timedelta, relativedelta]) -> "Arrow":
+    def __radd__(
+        self, other: Union[timedelta, "dateutil_relativedelta.relativedelta"]
+    ) -> "Arrow":
         return self.__add__(other)
 
     @overload
-    def __sub__(self, other: Union[timedelta, relativedelta]) -> "Arrow":
+    def __sub__(
+        self, other: Union[timedelta, "dateutil_relativedelta.relativedelta"]
+    ) -> "Arrow":
         pass  # pragma: no cover
 
     @overload
@@ -1762,7 +2749,7 @@ class Arrow:
         pass  # pragma: no cover
 
     def __sub__(self, other: Any) -> Union[timedelta, "Arrow"]:
-        if isinstance(other, (timedelta, relativedelta)):
+        if isinstance(other, timedelta) or _is_relativedelta(other):
             return self.fromdatetime(self._datetime - other, self._datetime.tzinfo)
 
         elif isinstance(other, dt_datetime):
@@ -1831,6 +2818,65 @@ class Arrow:
             except parser.ParserError:
                 raise ValueError(f"{tz_expr!r} not recognized as a timezone.")
 
+    @classmethod
+    def _get_dehumanizer(cls, locale: "locales.Locale") -> _Dehumanizer:
+        """Returns the :class:`_Dehumanizer` of a locale, compiling its patterns on first use."""
+        dehumanizer: Optional[_Dehumanizer] = cls._dehumanizers.get(type(locale))
+        if dehumanizer is not None:
+            return dehumanizer
+
+        units: List[Tuple[str, int, Pattern[str]]] = []
+        for unit, unit_object in locale.timeframes.items():
+            # Need to check the type of unit_object to create the correct dictionary
+            if isinstance(unit_object, Mapping):
+                strings_to_search = unit_object
+            else:
+                strings_to_search = {unit: str(unit_object)}
+
+            # Add change value to the correct unit (incorporates the plurality that exists within timeframe i.e second v.s seconds)
+            time_unit = unit if unit == "now" or unit[-1] == "s" else f"{unit}s"
+
+            for time_delta, time_string in strings_to_search.items():
+                # Replace {0} with regex \d representing digits
+                search_string = str(time_string).format(r"\d+")
+
+                # Need for absolute value as some locales have signs included in their objects
+                default_value = (
+                    1 if not time_delta.isnumeric() else abs(int(time_delta))
+                )
+
+                units.append(
+                    (time_unit, default_value, re.compile(rf"(^|\b|\d){search_string}"))
+                )
+
+        future_string = locale.future.format(".*")
+        past_string = locale.past.format(".*")
+
+        dehumanizer = _Dehumanizer(
+            units, re.compile(rf"^{future_string}$"), re.compile(rf"^{past_string}$")
+        )
+        cls._dehumanizers.set(type(locale), dehumanizer)
+        return dehumanizer
+
+    @staticmethod
+    def _get_humanize_other(
+        other: Union["Arrow", dt_datetime], tzinfo: Optional[dt_tzinfo]
+    ) -> dt_datetime:
+        """Returns the datetime humanized relative to, as given by the ``other`` argument of
+        :meth:`humanize <arrow.arrow.Arrow.humanize>`."""
+        if isinstance(other, Arrow):
+            return other._datetime
+
+        if isinstance(other, dt_datetime):
+            if other.tzinfo is None:
+                return other.replace(tzinfo=tzinfo)
+            return other.astimezone(tzinfo)
+
+        raise TypeError(
+            f"Invalid 'other' argument of type {type(other).__name__!r}. "
+            "Argument must be of type None, Arrow, or datetime."
+        )
+
     @classmethod
     def _get_datetime(
         cls, expr: Union["Arrow", dt_datetime, int, float, str]
@@ -1894,10 +2940,1128 @@ class Arrow:
             return end, limit
 
     @staticmethod
-    def _is_last_day_of_month(date: "Arrow") -> bool:
+    def _is_last_day_of_month(date: Union["Arrow", dt_date]) -> bool:
         """Returns a boolean indicating whether the datetime is the last day of the month."""
         return cast(int, date.day) == calendar.monthrange(date.year, date.month)[1]
 
+    @classmethod
+    def _wrap_datetime(cls, dt: dt_datetime) -> "Arrow":
+        """Constructs an :class:`Arrow <arrow.arrow.Arrow>` object around an aware ``datetime``
+        whose tzinfo has already been normalized, without copying it."""
+        if cls.__init__ is not Arrow.__init__:
+            return cls.fromdatetime(dt)
+
+        arrow = cls.__new__(cls)
+        arrow._datetime = dt
+        return arrow
+
+    @staticmethod
+    def _validate_convert_output(output: str) -> None:
+        """Raises a ValueError when ``output`` is not a conversion output type."""
+        if output not in ["arrow", "datetime", "epoch"]:
+            raise ValueError(
+                f"Unsupported output {output!r}, expected 'arrow', 'datetime' or 'epoch'."
+            )
+
+    @classmethod
+    def _convert_output(
+        cls, utc: dt_datetime, local: dt_datetime, output: _CONVERT_OUTPUT
+    ) -> Union["Arrow", dt_datetime, Tuple[float, int]]:
+        """Returns a datetime converted from UTC to a timezone as the given output type."""
+        if output == "arrow":
+            return cls._wrap_datetime(local)
+        if output == "datetime":
+            return local
+        return utc.timestamp(), int(cast(timedelta, local.utcoffset()).total_seconds())
+
+    @staticmethod
+    def _is_fixed_offset(tzinfo: Optional[dt_tzinfo]) -> bool:
+        """Returns a boolean indicating whether the timezone has a constant UTC offset,
+        in which case wall clock arithmetic never produces imaginary times."""
+        if isinstance(tzinfo, timezone):
+            return True
+        dateutil_tz = _imported("dateutil.tz")
+        return dateutil_tz is not None and isinstance(
+            tzinfo, (dateutil_tz.tzutc, dateutil_tz.tzoffset)
+        )
+
+    @staticmethod
+    def _has_transition_table(tzinfo: dt_tzinfo) -> bool:
+        """Returns a boolean indicating whether :meth:`_transition_table` looks up the
+        transitions of a timezone rather than sampling its UTC offsets."""
+        if isinstance(tzinfo, ZoneInfo):
+            return True
+        dateutil_tz = _imported("dateutil.tz")
+        return dateutil_tz is not None and isinstance(
+            tzinfo, (dateutil_tz.tzfile, dateutil_tz.tzrange)
+        )
+
+    @classmethod
+    def _get_transition_table(
+        cls, tzinfo: dt_tzinfo, year: int
+    ) -> Tuple[List[dt_datetime], List[dt_datetime]]:
+        """Returns the result of :meth:`_transition_table` for a timezone and year, building
+        it at most once."""
+        # dateutil timezones are unhashable, so the key holds the id of the tzinfo
+        key = (id(tzinfo), year)
+        entry: Optional[Tuple[dt_tzinfo, List[dt_datetime], List[dt_datetime]]] = (
+            cls._transition_tables.get(key)
+        )
+        if entry is None or entry[0] is not tzinfo:
+            entry = (tzinfo, *cls._transition_table(tzinfo, year))
+            cls._transition_tables.set(key, entry)
+
+        return entry[1], entry[2]
+
+    @classmethod
+    def _near_transition(cls, dt: dt_datetime) -> bool:
+        """Returns a boolean indicating whether the wall clock time of an aware datetime
+        lies within two days of a UTC offset transition of its timezone.
+
+        The transitions of ZoneInfo and dateutil timezones are looked up in a table built
+        once per timezone and year.  Other timezones are always considered to be near a
+        transition.
+
+        """
+        tzinfo = cast(dt_tzinfo, dt.tzinfo)
+        if not cls._has_transition_table(tzinfo) or not (MINYEAR < dt.year < MAXYEAR):
+            return True
+
+        starts, ends = cls._get_transition_table(tzinfo, dt.year)
+
+        # comparisons between datetimes sharing a tzinfo use wall clock time
+        i = bisect_right(starts, dt)
+        return i > 0 and dt < ends[i - 1]
+
+    @classmethod
+    def _transition_free_range(
+        cls, tzinfo: dt_tzinfo, utc: dt_datetime
+    ) -> Optional[Tuple[dt_datetime, dt_datetime]]:
+        """Returns the range of UTC datetimes around a UTC datetime over which a timezone
+        keeps the same UTC offset and no time is repeated, or None when it is unknown.
+
+        The range ends two days before the next UTC offset transition and, unless the
+        timezone has a fixed UTC offset, within the year of the datetime.
+
+        """
+        if cls._is_fixed_offset(tzinfo):
+            return dt_datetime.min.replace(
+                tzinfo=timezone.utc
+            ), dt_datetime.max.replace(tzinfo=timezone.utc)
+
+        year = utc.year
+        if not cls._has_transition_table(tzinfo) or not (MINYEAR < year < MAXYEAR):
+            return None
+
+        starts, ends = cls._get_transition_table(tzinfo, year)
+
+        # the ranges of the table are compared as UTC times, a transition is less than
+        # a day from the wall clock time it is recorded at
+        wall = utc.replace(tzinfo=tzinfo)
+        i = bisect_right(starts, wall)
+        if i > 0 and wall < ends[i - 1]:
+            return None
+
+        lower = dt_datetime(year, 1, 1, tzinfo=tzinfo)
+        upper = dt_datetime(year + 1, 1, 1, tzinfo=tzinfo)
+        if i > 0:
+            lower = max(lower, ends[i - 1])
+        if i < len(starts):
+            upper = min(upper, starts[i])
+
+        return lower.replace(tzinfo=timezone.utc), upper.replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def _tzfile_transitions(tzinfo: dt_tzinfo) -> Optional[List[int]]:
+        """Returns the transitions of a dateutil tzfile as sorted UTC timestamps, or None
+        if it does not keep them under the private attribute they are read from."""
+        return getattr(tzinfo, "_trans_list_utc", None)
+
+    @classmethod
+    def _transition_table(
+        cls, tzinfo: dt_tzinfo, year: int
+    ) -> Tuple[List[dt_datetime], List[dt_datetime]]:
+        """Returns the wall clock ranges of a year that lie within two days of a UTC offset
+        transition of a timezone, as sorted lists of range starts and ends.
+
+        dateutil timezones provide their transitions.  ZoneInfo does not, nor does a
+        tzfile without the private list it keeps them in, so their UTC offset is sampled
+        once a day and each change is bisected to the second.
+        Transitions in the tz database are always several days apart, and a UTC offset
+        never exceeds a day, so the margin covers every repeated or skipped wall clock
+        time, including those of a transition missed by the sampling.
+
+        """
+        # wall clock times of the epoch are also used as UTC times, both are only ever
+        # compared within the margin
+        epoch = dt_datetime(year, 1, 1, tzinfo=tzinfo)
+        margin = timedelta(days=2)
+        day = timedelta(days=1)
+        days = range(-3, (366 if calendar.isleap(year) else 365) + 4)
+        transitions: List[dt_datetime] = []
+        dateutil_tz = _imported("dateutil.tz")
+
+        timestamps = (
+            cls._tzfile_transitions(tzinfo)
+            if dateutil_tz is not None and isinstance(tzinfo, dateutil_tz.tzfile)
+            else None
+        )
+
+        if dateutil_tz is not None and isinstance(tzinfo, dateutil_tz.tzrange):
+            if tzinfo.hasdst:
+                transitions.extend(
+                    transition.replace(tzinfo=tzinfo)
+                    for shift in (-1, 0, 1)
+                    for transition in tzinfo.transitions(year + shift)
+                )
+
+        elif timestamps is not None:
+            epoch_seconds = int(
+                (epoch.replace(tzinfo=None) - dt_datetime(1970, 1, 1)).total_seconds()
+            )
+            lower = bisect_right(
+                timestamps, epoch_seconds + days[0] * cls._SECS_PER_DAY
+            )
+            upper = bisect_right(
+                timestamps, epoch_seconds + days[-1] * cls._SECS_PER_DAY
+            )
+            transitions.extend(
+                epoch + timedelta(seconds=timestamp - epoch_seconds)
+                for timestamp in timestamps[lower:upper]
+            )
+
+        else:
+            offsets = [tzinfo.fromutc(epoch + i * day).utcoffset() for i in days]
+            for i, (offset, next_offset) in enumerate(zip(offsets, offsets[1:])):
+                if next_offset == offset:
+                    continue
+
+                lower = days[i] * cls._SECS_PER_DAY
+                upper = lower + cls._SECS_PER_DAY
+                while upper - lower > 1:
+                    middle = (lower + upper) // 2
+                    utc = epoch + timedelta(seconds=middle)
+                    if tzinfo.fromutc(utc).utcoffset() == offset:
+                        lower = middle
+                    else:
+                        upper = middle
+
+                transitions.append(epoch + timedelta(seconds=upper))
+
+        starts: List[dt_datetime] = []
+        ends: List[dt_datetime] = []
+
+        for transition in sorted(transitions):
+            if ends and transition - margin <= ends[-1]:
+                ends[-1] = transition + margin
+            else:
+                starts.append(transition - margin)
+                ends.append(transition + margin)
+
+        return starts, ends
+
+    @classmethod
+    def _datetime_exists(cls, dt: dt_datetime) -> bool:
+        """Returns a boolean indicating whether an aware datetime exists in its timezone, as
+        ``dateutil.tz.datetime_exists`` does."""
+        if not cls._near_transition(dt):
+            return True
+
+        import dateutil.tz
+
+        return dateutil.tz.datetime_exists(dt)
+
+    @classmethod
+    def _datetime_ambiguous(cls, dt: dt_datetime) -> bool:
+        """Returns a boolean indicating whether an aware datetime is a repeated wall clock
+        time in its timezone, as ``dateutil.tz.datetime_ambiguous`` does."""
+        if not cls._near_transition(dt):
+            return False
+
+        import dateutil.tz
+
+        return dateutil.tz.datetime_ambiguous(dt)
+
+    @classmethod
+    def _resolve_imaginary(cls, dt: dt_datetime) -> dt_datetime:
+        """Moves an imaginary datetime forward past the DST gap it falls into."""
+        if not cls._datetime_exists(dt):
+            import dateutil.tz
+
+            return dateutil.tz.resolve_imaginary(dt)
+        return dt
+
+    @classmethod
+    def _add_months(cls, dt: dt_datetime, months: int) -> dt_datetime:
+        """Adds a number of months to a datetime, clipping the day to the end of the month
+        as ``relativedelta`` does."""
+        year, month = divmod(dt.year * cls._MONTHS_PER_YEAR + dt.month - 1 + months, 12)
+        month += 1
+        day = min(dt.day, calendar.monthrange(year, month)[1])
+        return dt.replace(year=year, month=month, day=day, fold=0)
+
+    @classmethod
+    def _shift_wall(
+        cls, dt: dt_datetime, frame_relative: str, steps: int
+    ) -> dt_datetime:
+        """Shifts the wall time of a datetime by a number of plural frames, without
+        resolving imaginary results."""
+        if frame_relative == "years":
+            return cls._add_months(dt, steps * cls._MONTHS_PER_YEAR)
+        elif frame_relative == "months":
+            return cls._add_months(dt, steps)
+        else:
+            return dt + timedelta(**{frame_relative: steps})
+
+    @classmethod
+    def _shift_datetime(
+        cls, dt: dt_datetime, frame_relative: str, steps: int
+    ) -> dt_datetime:
+        """Shifts a datetime by a number of plural frames, resolving imaginary results
+        the same way :meth:`shift <arrow.arrow.Arrow.shift>` does."""
+        current = cls._shift_wall(dt, frame_relative, steps)
+
+        if not cls._is_fixed_offset(current.tzinfo):
+            current = cls._resolve_imaginary(current)
+
+        return current
+
+    @staticmethod
+    def _normalize_tzinfo(tzinfo: dt_tzinfo) -> dt_tzinfo:
+        """Replaces pytz timezones with the equivalent timezones used by Arrow."""
+        # detect that tzinfo is a pytz object (issue #626)
+        if hasattr(tzinfo, "localize") and hasattr(tzinfo, "zone") and tzinfo.zone:
+            return parser.TzinfoParser.parse(tzinfo.zone)
+
+        return tzinfo
+
+    @classmethod
+    def _floor_wall(
+        cls, dt: dt_datetime, frame_absolute: str, week_start: int
+    ) -> dt_datetime:
+        """Truncates an aware datetime to the start of its frame in wall clock time."""
+        floor = dt.replace(**cls._FLOOR_RESETS[frame_absolute])
+
+        if frame_absolute == "week":
+            floor -= timedelta(days=(dt.isoweekday() - week_start) % 7)
+        elif frame_absolute == "quarter":
+            floor = floor.replace(
+                month=dt.month - (dt.month - 1) % cls._MONTHS_PER_QUARTER
+            )
+
+        return floor
+
+    @classmethod
+    def _align_floor(
+        cls, floor: dt_datetime, frame_absolute: str, multiple: int, week_start: int
+    ) -> dt_datetime:
+        """Moves the floor of a frame back to the start of its bucket of ``multiple`` frames."""
+        if frame_absolute == "week":
+            # weeks are counted from the first week starting on or after 0001-01-01
+            weeks = (floor.toordinal() - week_start) // 7
+            return floor - timedelta(weeks=weeks % multiple)
+
+        if frame_absolute == "quarter":
+            quarter = (floor.month - 1) // cls._MONTHS_PER_QUARTER
+            month = (quarter - quarter % multiple) * cls._MONTHS_PER_QUARTER + 1
+            return floor.replace(month=month)
+
+        value = getattr(floor, frame_absolute)
+        if frame_absolute in ["month", "day"]:
+            value -= (value - 1) % multiple
+        elif frame_absolute == "year":
+            # the first bucket is cut short, as there is no year 0
+            value = max(value - value % multiple, MINYEAR)
+        else:
+            value -= value % multiple
+
+        return floor.replace(**{frame_absolute: value})
+
+    @classmethod
+    def _bucket_floor(
+        cls,
+        local: dt_datetime,
+        frame_absolute: str,
+        frame_relative: str,
+        relative_steps: int,
+        week_start: int,
+        multiple: int,
+    ) -> dt_datetime:
+        """Returns the wall clock floor of the bucket of a datetime.  When the datetime is in
+        the repeat of a DST fold and so is the whole bucket, the floor has its ``fold`` set.
+        """
+        lower = cls._floor_wall(local, frame_absolute, week_start)
+        if multiple > 1:
+            lower = cls._align_floor(lower, frame_absolute, multiple, week_start)
+
+        if local.fold and cls._datetime_ambiguous(lower):
+            ceil = cls._shift_wall(
+                lower, frame_relative, relative_steps * multiple
+            ) - timedelta(microseconds=1)
+            if cls._datetime_ambiguous(ceil):
+                lower = lower.replace(fold=1)
+
+        return lower
+
+    @classmethod
+    def _bucket_start(cls, lower: dt_datetime) -> dt_datetime:
+        """Returns the instant at which the bucket with a given floor starts, as a UTC
+        ``datetime``.  A floor in a DST gap starts the bucket at the end of the gap."""
+        return cls._resolve_imaginary(lower).astimezone(timezone.utc)
+
+    @classmethod
+    def _get_bucket_tzinfo(
+        cls,
+        tz: Optional[TZ_EXPR],
+        value: Optional[Union["Arrow", dt_datetime, int, float, str]],
+    ) -> dt_tzinfo:
+        """Returns the timezone of a series of buckets, which defaults to the timezone of a
+        given value of the series."""
+        if tz is not None:
+            return cls._normalize_tzinfo(cls._get_tzinfo(tz))
+        if isinstance(value, (Arrow, dt_datetime)) and value.tzinfo:
+            return cls._normalize_tzinfo(value.tzinfo)
+        return timezone.utc
+
+    @classmethod
+    def _bucket_span(
+        cls,
+        lower: dt_datetime,
+        frame_absolute: str,
+        frame_relative: str,
+        relative_steps: int,
+        bounds: _BOUNDS,
+        week_start: int,
+    ) -> Tuple[dt_datetime, dt_datetime]:
+        """Returns the timespan of a bucket from the floor given by
+        :meth:`_bucket_floor <arrow.arrow.Arrow._bucket_floor>`."""
+        floor, ceil = cls._span_datetime(
+            lower,
+            frame_absolute,
+            frame_relative,
+            relative_steps,
+            bounds,
+            False,
+            week_start,
+        )
+        if lower.fold:
+            # the timespan is the repeat of a wall clock timespan in a DST fold
+            floor = floor.replace(fold=1)
+            if cls._datetime_ambiguous(ceil):
+                ceil = ceil.replace(fold=1)
+
+        return floor, ceil
+
+    @classmethod
+    def _next_bucket_floor(
+        cls,
+        lower: dt_datetime,
+        frame_absolute: str,
+        frame_relative: str,
+        relative_steps: int,
+        week_start: int,
+    ) -> dt_datetime:
+        """Returns the floor of the bucket following the bucket with a given floor."""
+        upper = cls._shift_wall(lower, frame_relative, relative_steps)
+        ceil = upper - timedelta(microseconds=1)
+        if cls._datetime_ambiguous(ceil) and (
+            lower.fold or not cls._datetime_ambiguous(lower)
+        ):
+            # the bucket ends in the repeat of a DST fold, unless it is the first
+            # occurrence of a bucket that repeats as a whole
+            ceil = ceil.replace(fold=1)
+
+        if cls._datetime_exists(ceil):
+            # step from the instant the bucket ends, which enters the repeat of
+            # the wall clock timespans in a DST fold
+            upper = (
+                ceil.astimezone(timezone.utc) + timedelta(microseconds=1)
+            ).astimezone(lower.tzinfo)
+        else:
+            # a floor skipped by a DST gap belongs to the timespan after the gap
+            upper = cls._resolve_imaginary(upper)
+        return cls._bucket_floor(
+            upper, frame_absolute, frame_relative, relative_steps, week_start, 1
+        )
+
+    @classmethod
+    def _iter_buckets(
+        cls,
+        values: Iterable[Union["Arrow", dt_datetime, int, float, str]],
+        frame_absolute: str,
+        frame_relative: str,
+        relative_steps: int,
+        tzinfo: Optional[dt_tzinfo],
+        week_start: int,
+        multiple: int,
+    ) -> Generator[Tuple[dt_datetime, bool], None, None]:
+        """Yields the wall clock floor of the bucket of each value, converted to ``tzinfo`` or
+        to its own timezone if ``tzinfo`` is None, and whether the value lies on that floor.
+
+        The range of instants in the bucket of the last value is kept, and following values
+        inside it yield the same floor object without being converted.
+
+        """
+        source: Optional[dt_tzinfo] = None
+        lower = upper = dt_datetime.max
+        lower_ts = upper_ts = 0.0
+        cached = False
+
+        for value in values:
+            if isinstance(value, Arrow):
+                dt = value._datetime
+            elif isinstance(value, dt_datetime):
+                dt = value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+            elif util.is_timestamp(value):
+                ts = util.normalize_timestamp(float(value))
+                if (
+                    cached
+                    and (tzinfo is not None or source is timezone.utc)
+                    and lower_ts <= ts < upper_ts
+                ):
+                    yield lower, ts == lower_ts
+                    continue
+
+                dt = dt_datetime.fromtimestamp(ts, tzinfo or timezone.utc)
+            else:
+                raise ValueError(
+                    f"{value!r} not recognized as a datetime or timestamp."
+                )
+
+            if (
+                cached
+                and (tzinfo is not None or dt.tzinfo is source)
+                and lower <= dt < upper
+            ):
+                yield lower, dt == lower
+                continue
+
+            source = dt.tzinfo
+            local = dt.astimezone(
+                tzinfo or cls._normalize_tzinfo(cast(dt_tzinfo, source))
+            )
+
+            lower = cls._bucket_floor(
+                local,
+                frame_absolute,
+                frame_relative,
+                relative_steps,
+                week_start,
+                multiple,
+            )
+
+            cached = False
+            try:
+                upper = cls._shift_wall(
+                    lower, frame_relative, relative_steps * multiple
+                )
+                if multiple > 1 and frame_absolute in cls._FLOOR_PARENTS:
+                    parent = cls._FLOOR_PARENTS[frame_absolute]
+                    upper = min(
+                        upper,
+                        cls._shift_wall(
+                            cls._floor_wall(lower, parent, week_start), f"{parent}s", 1
+                        ),
+                    )
+            except (OverflowError, ValueError):
+                pass
+            else:
+                # the bucket is only a contiguous range of instants when its bounds are
+                # neither skipped nor repeated by a DST transition
+                cached = cls._is_fixed_offset(local.tzinfo) or all(
+                    cls._datetime_exists(bound) and not cls._datetime_ambiguous(bound)
+                    for bound in (lower, upper)
+                )
+                if cached:
+                    lower_ts, upper_ts = lower.timestamp(), upper.timestamp()
+
+            yield lower, local == lower
+
+    @classmethod
+    def _span_datetime(
+        cls,
+        dt: dt_datetime,
+        frame_absolute: str,
+        frame_relative: str,
+        steps: int,
+        bounds: _BOUNDS,
+        exact: bool,
+        week_start: int,
+    ) -> Tuple[dt_datetime, dt_datetime]:
+        """Computes the bounds returned by :meth:`span <arrow.arrow.Arrow.span>` for an aware
+        datetime, assuming the arguments have already been validated.
+
+        The bounds are computed with wall clock arithmetic.  The imaginary time checks are
+        skipped when the timezone has a fixed UTC offset, or when the span is at most a day
+        long and its UTC offset does not change, since no DST gap can then fall inside it.
+
+        """
+        tzinfo = dt.tzinfo
+        floor = dt
+        if not exact:
+            floor = cls._floor_wall(dt, frame_absolute, week_start)
+
+        ceil = cls._shift_wall(floor, frame_relative, steps)
+
+        check_imaginary = not cls._is_fixed_offset(tzinfo) and not (
+            frame_absolute in cls._SUBDAY_FRAMES
+            and isinstance(tzinfo, ZoneInfo)
+            and ceil - floor <= timedelta(days=1)
+            # fold=0 gives the offset before a transition and fold=1 the one after it
+            and floor.replace(fold=0).utcoffset() == ceil.replace(fold=1).utcoffset()
+        )
+
+        if check_imaginary:
+            if not exact and frame_absolute in ["week", "quarter"]:
+                resolved = cls._resolve_imaginary(floor)
+                if resolved is not floor:
+                    floor = resolved
+                    ceil = cls._shift_wall(floor, frame_relative, steps)
+
+            ceil = cls._resolve_imaginary(ceil)
+
+        if bounds[0] == "(":
+            floor += timedelta(microseconds=1)
+            if check_imaginary:
+                floor = cls._resolve_imaginary(floor)
+
+        if bounds[1] == ")":
+            ceil -= timedelta(microseconds=1)
+            if check_imaginary:
+                ceil = cls._resolve_imaginary(ceil)
+
+        return floor, ceil
+
+    def _span_memoized(
+        self,
+        frame_absolute: str,
+        frame_relative: str,
+        relative_steps: int,
+        count: int,
+        bounds: _BOUNDS,
+        week_start: int,
+    ) -> Tuple[dt_datetime, dt_datetime]:
+        """Computes the bounds of a non-exact span, reusing the last span computed with the
+        same arguments when this object's wall clock time falls within the same frame.
+
+        A non-exact span only depends on the wall clock frame containing the datetime, so
+        each entry of the ``spans`` cache of :mod:`arrow.caches` stores that frame alongside
+        the span.  Entries are immutable tuples, so concurrent use can at worst cause a span
+        to be recomputed.
+
+        """
+        dt = self._datetime
+        tzinfo = dt.tzinfo
+        # dateutil timezones are unhashable, so the key holds the id of the tzinfo
+        key = (self.__class__, id(tzinfo), frame_absolute, count, week_start, bounds)
+
+        entry = self._span_memo.get(key)
+        # comparisons between datetimes sharing a tzinfo use wall clock time
+        if entry is not None and entry[0] is tzinfo and entry[1] <= dt < entry[2]:
+            return entry[3], entry[4]
+
+        floor, ceil = self._span_datetime(
+            dt,
+            frame_absolute,
+            frame_relative,
+            count * relative_steps,
+            bounds,
+            False,
+            week_start,
+        )
+
+        lower = self._floor_wall(dt, frame_absolute, week_start)
+        upper = self._shift_wall(lower, frame_relative, relative_steps)
+
+        self._span_memo.set(key, (tzinfo, lower, upper, floor, ceil))
+
+        return floor, ceil
+
+    @classmethod
+    def _iter_range(
+        cls,
+        frame: _T_FRAMES,
+        frame_relative: str,
+        relative_steps: int,
+        start: dt_datetime,
+        end: dt_datetime,
+        limit: int,
+    ) -> Generator[dt_datetime, None, None]:
+        """Yields the points of :meth:`range <arrow.arrow.Arrow.range>` as datetimes, stepping
+        from one point to the next."""
+        current = start
+        original_day = start.day
+        day_is_clipped = False
+        i = 0
+
+        while current <= end and i < limit:
+            i += 1
+            yield current
+
+            current = cls._shift_datetime(current, frame_relative, relative_steps)
+
+            if frame in ["month", "quarter", "year"] and current.day < original_day:
+                day_is_clipped = True
+
+            if day_is_clipped and not cls._is_last_day_of_month(current):
+                current = current.replace(day=original_day)
+
+    @classmethod
+    def _is_closed_form_range(
+        cls, frame: _T_FRAMES, frame_relative: str, start: dt_datetime, end: dt_datetime
+    ) -> bool:
+        """Returns whether the points of :meth:`range <arrow.arrow.Arrow.range>` can be
+        computed directly from its start: the timezones have a fixed UTC offset, and the day
+        of the month is either never clipped or clipped from the start each time."""
+        return (
+            cls._is_fixed_offset(start.tzinfo)
+            and cls._is_fixed_offset(end.tzinfo)
+            and (
+                frame_relative not in ["years", "months"]
+                or frame in ["month", "quarter", "year"]
+                or start.day <= 28
+            )
+        )
+
+    @classmethod
+    def _chunk_range(
+        cls,
+        frame: _T_FRAMES,
+        frame_relative: str,
+        relative_steps: int,
+        start: dt_datetime,
+        end: dt_datetime,
+        n: int,
+    ) -> List[Tuple[dt_datetime, dt_datetime]]:
+        """Splits the points of :meth:`range <arrow.arrow.Arrow.range>` into at most ``n``
+        chunks of nearly equal length, returned as their first and last points.
+
+        A range restarted from one of its points returns the same points as the original
+        one, except that the day of the month is clipped from the new start, so chunks only
+        start on points whose day is not clipped.  Each chunk after the first starts on the
+        one of these points nearest to where an even split would start it, while leaving one
+        for each chunk after it, so there are ``n`` chunks unless there are fewer of them.
+
+        The points are computed in closed form for timezones with a fixed UTC offset, and
+        from the segments of :meth:`_range_segments` for the frames shorter than a month in
+        other timezones.  Other ranges are stepped through.
+
+        """
+        closed_form = cls._is_closed_form_range(frame, frame_relative, start, end)
+        # whether the day of the month of some points is clipped and restored later
+        clipped = frame in ["month", "quarter", "year"] and start.day > 28
+
+        segments = None
+        if not closed_form and frame_relative not in ["years", "months"]:
+            segments = cls._range_segments(frame_relative, relative_steps, start, end)
+        # whether each point can be computed from its index
+        direct = closed_form or segments is not None
+
+        # the index of the first point of each segment
+        firsts = [0]
+        for _, length in segments or []:
+            firsts.append(firsts[-1] + length)
+
+        def point(index: int) -> dt_datetime:
+            if segments is None:
+                return cls._range_point(start, frame_relative, index * relative_steps)
+            i = bisect_right(firsts, index) - 1
+            step = timedelta(**{frame_relative: relative_steps})
+            return segments[i][0] + (index - firsts[i]) * step
+
+        if closed_form:
+            total = cls._count_range(
+                frame_relative, relative_steps, start, end, sys.maxsize
+            )
+        else:
+            total = firsts[-1]
+
+        def iter_points() -> Generator[dt_datetime, None, None]:
+            return cls._iter_range(
+                frame, frame_relative, relative_steps, start, end, sys.maxsize
+            )
+
+        restarts: Sequence[int]
+        if clipped:
+            if direct:
+                days = [point(index).day for index in range(total)]
+            else:
+                days = [current.day for current in iter_points()]
+            total = len(days)
+            restarts = [index for index, day in enumerate(days) if day == start.day]
+        else:
+            if not direct:
+                total = sum(1 for _ in iter_points())
+            restarts = range(total)
+
+        if total == 0:
+            return []
+
+        count = min(n, len(restarts))
+        size, extra = divmod(total, count)
+
+        heads = [0]
+        previous = 0
+        for i in range(1, count):
+            target = i * size + min(i, extra)
+            j = bisect_left(restarts, target)
+            if j == len(restarts) or (
+                j > 0 and target - restarts[j - 1] < restarts[j] - target
+            ):
+                j -= 1
+            previous = min(max(j, previous + 1), len(restarts) - count + i)
+            heads.append(restarts[previous])
+
+        tails = [head - 1 for head in heads[1:]] + [total - 1]
+
+        if direct:
+            return [(point(head), point(tail)) for head, tail in zip(heads, tails)]
+
+        wanted = set(heads).union(tails)
+        points = {
+            index: current
+            for index, current in enumerate(iter_points())
+            if index in wanted
+        }
+        return [(points[head], points[tail]) for head, tail in zip(heads, tails)]
+
+    @staticmethod
+    def _range_point(
+        start: dt_datetime, frame_relative: str, steps: int
+    ) -> dt_datetime:
+        """Computes a point of :meth:`range <arrow.arrow.Arrow.range>` directly from its start,
+        for timezones with a fixed UTC offset and ranges that never clip the day of the month.
+        """
+        if steps == 0:
+            return start
+        elif frame_relative == "years":
+            import dateutil.relativedelta
+
+            return start + dateutil.relativedelta.relativedelta(years=steps)
+        elif frame_relative == "months":
+            import dateutil.relativedelta
+
+            return start + dateutil.relativedelta.relativedelta(months=steps)
+        else:
+            return start + timedelta(**{frame_relative: steps})
+
+    @classmethod
+    def _count_range(
+        cls,
+        frame_relative: str,
+        relative_steps: int,
+        start: dt_datetime,
+        end: dt_datetime,
+        limit: int,
+        time: Optional[dt_time] = None,
+    ) -> int:
+        """Counts the points of :meth:`range <arrow.arrow.Arrow.range>` in closed form, under the
+        same conditions as :meth:`_range_point`.
+
+        For frames of a month or longer in timezones with DST gaps, ``time`` is the wall clock
+        time of the last points of the range, as found by :meth:`_range_wall_time`.
+
+        """
+        if frame_relative == "years" or frame_relative == "months":
+            months = (end.year - start.year) * cls._MONTHS_PER_YEAR
+            months += end.month - start.month
+            if frame_relative == "years":
+                relative_steps *= cls._MONTHS_PER_YEAR
+
+            last = months // relative_steps
+            if last >= 0:
+                point = cls._range_point(start, "months", last * relative_steps)
+                if time is not None:
+                    point = dt_datetime.combine(point.date(), time, point.tzinfo)
+
+                # comparisons between datetimes sharing a tzinfo use wall clock time
+                if point > end:
+                    last -= 1
+        else:
+            last = (end - start) // timedelta(**{frame_relative: relative_steps})
+
+        return max(min(last + 1, limit), 0)
+
+    @classmethod
+    def _range_segments(
+        cls,
+        frame_relative: str,
+        relative_steps: int,
+        start: dt_datetime,
+        end: dt_datetime,
+    ) -> Optional[List[Tuple[dt_datetime, int]]]:
+        """Splits the points of :meth:`range <arrow.arrow.Arrow.range>` at the DST gaps of its
+        timezone into segments of evenly spaced wall clock times, returned as their first
+        point and number of points, for the frames shorter than a month.  Returns None for
+        timezones whose transitions are not known.
+
+        A point falling into a DST gap is moved forward past it, and the next points step on
+        from there, so each gap a point falls into starts a new segment.  Gaps stepped over
+        do not.  Within a segment the points are computed in closed form, so the cost only
+        depends on the number of transitions.
+
+        """
+        tzinfo = cast(dt_tzinfo, start.tzinfo)
+        if (
+            end.tzinfo is not tzinfo
+            or not cls._has_transition_table(tzinfo)
+            or not (MINYEAR < start.year and end.year < MAXYEAR)
+        ):
+            return None
+
+        step = timedelta(**{frame_relative: relative_steps})
+        # comparisons between datetimes sharing a tzinfo use wall clock time
+        head = start
+        segments = []
+
+        for gap_start, gap_end in cls._dst_gaps(tzinfo, start.year, end.year):
+            if gap_start > end:
+                break
+            if gap_end <= head:
+                continue
+
+            # the first point of the segment at or after the start of the gap
+            steps = max(-((head - gap_start) // step), 1)
+            point = head + steps * step
+            if point > end:
+                break
+            if point >= gap_end:
+                continue
+
+            segments.append((head, steps))
+            head = point + (gap_end - gap_start)
+
+        if head <= end:
+            segments.append((head, (end - head) // step + 1))
+
+        return segments
+
+    @classmethod
+    def _range_wall_time(
+        cls, months_per_step: int, start: dt_datetime, end: dt_datetime
+    ) -> Optional[dt_time]:
+        """Returns the wall clock time of the last points of a monthly
+        :meth:`range <arrow.arrow.Arrow.range>`, following them through the DST gaps of its
+        timezone.  Returns None for timezones whose transitions are not known, and when a
+        point is moved past midnight.
+
+        A point falling into a gap is moved forward past it, and the next points are shifted
+        from there, so they keep its wall clock time.  A point is shifted from the previous
+        one before its day of the month is restored, so the day it is checked on is clipped
+        to both months.  Only the points in the months of the gaps are checked.
+
+        """
+        tzinfo = cast(dt_tzinfo, start.tzinfo)
+        if (
+            end.tzinfo is not tzinfo
+            or not cls._has_transition_table(tzinfo)
+            or not (MINYEAR < start.year and end.year < MAXYEAR)
+        ):
+            return None
+
+        time = start.time()
+
+        for gap_start, gap_end in cls._dst_gaps(tzinfo, start.year, end.year):
+            if gap_start > end:
+                break
+            if (gap_end - timedelta(microseconds=1)).date() != gap_start.date():
+                return None
+
+            months = (gap_start.year - start.year) * cls._MONTHS_PER_YEAR
+            months += gap_start.month - start.month
+            if months <= 0 or months % months_per_step:
+                continue
+
+            previous = cls._add_months(start, months - months_per_step)
+            days = calendar.monthrange(gap_start.year, gap_start.month)[1]
+            point = dt_datetime.combine(
+                gap_start.date().replace(day=min(previous.day, days)), time, tzinfo
+            )
+            if not gap_start <= point < gap_end:
+                continue
+
+            resolved = cls._resolve_imaginary(point)
+            if resolved.date() != point.date():
+                return None
+
+            time = resolved.time()
+
+        return time
+
+    @classmethod
+    def _dst_gaps(
+        cls, tzinfo: dt_tzinfo, first_year: int, last_year: int
+    ) -> List[Tuple[dt_datetime, dt_datetime]]:
+        """Returns the DST gaps of a timezone over a span of years, as sorted pairs of the
+        first skipped wall clock time and the wall clock time the gap ends at.
+
+        The UTC offset is sampled once a day over the ranges of
+        :meth:`_get_transition_table`, and each increase is bisected to the second.
+
+        """
+
+        def offset(utc: dt_datetime) -> timedelta:
+            return cast(timedelta, tzinfo.fromutc(utc).utcoffset())
+
+        day = timedelta(days=1)
+        gaps = set()
+
+        for year in range(first_year, last_year + 1):
+            # the ranges hold UTC times, see _transition_table
+            for lower, upper in zip(*cls._get_transition_table(tzinfo, year)):
+                samples = [lower + i * day for i in range((upper - lower).days + 1)]
+                samples.append(upper)
+
+                for before, after in zip(samples, samples[1:]):
+                    before_offset = offset(before)
+                    if offset(after) == before_offset:
+                        continue
+
+                    low = 0
+                    high = int((after - before).total_seconds())
+                    while high - low > 1:
+                        middle = (low + high) // 2
+                        if offset(before + timedelta(seconds=middle)) == before_offset:
+                            low = middle
+                        else:
+                            high = middle
+
+                    transition = before + timedelta(seconds=high)
+                    after_offset = offset(transition)
+                    if after_offset > before_offset:
+                        gaps.add(
+                            (transition + before_offset, transition + after_offset)
+                        )
+
+        return sorted(gaps)
+
+    @classmethod
+    def _iter_spans(
+        cls,
+        frame: _T_FRAMES,
+        start: dt_datetime,
+        end: dt_datetime,
+        tz: Optional[TZ_EXPR],
+        limit: Optional[int],
+        bounds: _BOUNDS,
+        exact: bool,
+        interval: int,
+    ) -> Generator[Tuple["Arrow", "Arrow"], None, None]:
+        """Yields the timespans of :meth:`span_range <arrow.arrow.Arrow.span_range>`, merging
+        every ``interval`` consecutive timespans into one as
+        :meth:`interval <arrow.arrow.Arrow.interval>` does.
+
+        Each merged timespan is computed from its first and last range points only.  For
+        timezones with a fixed UTC offset those points are found in closed form, so the cost
+        per timespan does not depend on ``interval``.
+
+        """
+        util.validate_bounds(bounds)
+
+        tzinfo = cls._get_tzinfo(start.tzinfo if tz is None else tz)
+        range_start = cls.fromdatetime(start, tzinfo)._span(frame, exact=exact)[0]
+        end_dt = cls.fromdatetime(end, tzinfo)._datetime
+
+        frame_absolute, frame_relative, relative_steps = cls._get_frames(frame)
+
+        # the timespans start at the points of Arrow.range, which replaces the tzinfo
+        # of its start and end with its own one.
+        range_tzinfo = cls._get_tzinfo(range_start.tzinfo if tz is None else tz)
+        first = cls.fromdatetime(
+            range_start._datetime.replace(tzinfo=range_tzinfo)
+        )._datetime
+        last = end_dt.replace(tzinfo=range_tzinfo)
+        limit = sys.maxsize if limit is None else limit
+
+        def exact_floor(point: dt_datetime) -> dt_datetime:
+            if bounds[0] == "(":
+                return cls._shift_datetime(point, "microseconds", 1)
+            return point
+
+        def is_past_end(floor: dt_datetime) -> bool:
+            return floor == end_dt or floor - timedelta(microseconds=1) == end_dt
+
+        def span_pair(head: dt_datetime, tail: dt_datetime) -> Tuple["Arrow", "Arrow"]:
+            if not exact:
+                floor, ceil = cls._span_datetime(
+                    head,
+                    frame_absolute,
+                    frame_relative,
+                    relative_steps,
+                    bounds,
+                    False,
+                    1,
+                )
+                if tail is not head:
+                    ceil = cls._span_datetime(
+                        tail,
+                        frame_absolute,
+                        frame_relative,
+                        relative_steps,
+                        bounds,
+                        False,
+                        1,
+                    )[1]
+            else:
+                floor = exact_floor(head)
+                ceil = cls._shift_datetime(tail, frame_relative, relative_steps)
+                if bounds[1] == ")":
+                    ceil = cls._shift_datetime(ceil, "microseconds", -1)
+                if ceil > end_dt:
+                    ceil = end_dt
+                    if bounds[1] == ")":
+                        ceil -= timedelta(microseconds=1)
+
+            return cls._wrap_datetime(floor), cls._wrap_datetime(ceil)
+
+        if cls._is_closed_form_range(frame, frame_relative, first, last):
+            count = cls._count_range(frame_relative, relative_steps, first, last, limit)
+
+            # only the last two points can start at or past the end of an exact range
+            if exact:
+                for i in range(max(count - 2, 0), count):
+                    point = cls._range_point(first, frame_relative, i * relative_steps)
+                    if is_past_end(exact_floor(point)):
+                        count = i
+                        break
+
+            for i in range(0, count, interval):
+                start_point = cls._range_point(
+                    first, frame_relative, i * relative_steps
+                )
+                j = min(i + interval, count) - 1
+                end_point = (
+                    start_point
+                    if j == i
+                    else cls._range_point(first, frame_relative, j * relative_steps)
+                )
+                yield span_pair(start_point, end_point)
+
+            return
+
+        head: Optional[dt_datetime] = None
+        tail = first
+        size = 0
+
+        for point in cls._iter_range(
+            frame, frame_relative, relative_steps, first, last, limit
+        ):
+            if exact and is_past_end(exact_floor(point)):
+                break
+
+            if head is None:
+                head = point
+            tail = point
+            size += 1
+
+            if size == interval:
+                yield span_pair(head, tail)
+                head = None
+                size = 0
+
+        if head is not None:
+            yield span_pair(head, tail)
+
 
 Arrow.min = Arrow.fromdatetime(dt_datetime.min)
 Arrow.max = Arrow.fromdatetime(dt_datetime.max)
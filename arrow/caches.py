@@ -0,0 +1,268 @@
+"""Provides the caches arrow keeps to speed up parsing, formatting, humanizing, spans and
+timezone conversions, along with their statistics and sizes.
+
+Every cache is named, and holds at most its maximum size of entries, evicting about
+the least recently used ones.  Caches are shared by threads, and only lock to change
+their entries, never to look them up.  The default size of a cache can be set with an environment
+variable named after it, such as ``ARROW_CACHE_PATTERNS_SIZE=512``, read when arrow is
+imported, or at any time with :func:`resize`.  A size of 0 disables a cache.  An invalid
+size in the environment is ignored with a warning.
+
+Usage::
+
+    >>> import arrow
+    >>> arrow.caches.info()["timezones"]
+    CacheInfo(hits=12, misses=3, size=3, maxsize=1024)
+    >>> arrow.caches.resize("timezones", 64)
+    >>> arrow.caches.clear()
+
+"""
+
+import os
+import warnings
+from _thread import RLock
+from typing import Any, Dict, Final, Iterator, NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+    """The statistics of a :class:`Cache`."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class _Entry:
+    __slots__ = ("value", "used")
+
+    value: Any
+    used: bool
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+        self.used = False
+
+
+class Cache:
+    """A cache evicting its least recently used entries first, counting its hits and
+    misses.
+
+    Lookups take no lock, so that threads sharing a cache never wait on each other, with
+    or without the GIL: a hit only flags its entry as used.  Eviction goes through the
+    entries in insertion order, giving those flagged since they were last considered a
+    second chance, which approximates least recently used order.  Changes to the entries
+    are made under a lock of the cache.  Hits and misses are counted without one, so that
+    they may miss a few concurrent lookups.
+
+    :param maxsize: the maximum number of entries, 0 disables the cache.
+
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_entries", "_lock")
+
+    maxsize: int
+    hits: int
+    misses: int
+    _entries: Dict[Any, _Entry]
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError(f"Cache size must be positive or 0, got {maxsize!r}.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = RLock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.info()}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Returns the value cached for a key, or None when there is none.
+
+        :param key: the key.
+
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if not entry.used:
+            entry.used = True
+        return entry.value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Caches the value of a key, evicting the least recently used entry when the
+        cache is full.
+
+        :param key: the key.
+        :param value: the value, which must not be None.
+
+        """
+
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            if key not in self._entries:
+                self._evict(self.maxsize - 1)
+            self._entries[key] = _Entry(value)
+
+    def clear(self) -> None:
+        """Removes every entry and resets the statistics."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        """Changes the maximum number of entries, evicting the least recently used
+        entries that no longer fit.
+
+        :param maxsize: the maximum number of entries, 0 disables the cache.
+
+        """
+
+        if maxsize < 0:
+            raise ValueError(f"Cache size must be positive or 0, got {maxsize!r}.")
+
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict(maxsize)
+
+    def info(self) -> CacheInfo:
+        """Returns the statistics of the cache."""
+
+        return CacheInfo(self.hits, self.misses, len(self._entries), self.maxsize)
+
+    def _evict(self, maxsize: int) -> None:
+        entries = self._entries
+        # bounds the second chances, as lookups may keep flagging entries meanwhile
+        chances = len(entries)
+
+        while len(entries) > maxsize:
+            key = next(iter(entries))
+            entry = entries.pop(key)
+
+            if entry.used and chances:
+                # moved to the end, as the most recently used entries are
+                chances -= 1
+                entry.used = False
+                entries[key] = entry
+
+
+# the caches and their default sizes
+_DEFAULT_SIZES: Final[Dict[str, int]] = {
+    # locale names to Locale objects
+    "locales": 256,
+    # locale classes to the regular expressions of their tokens
+    "locale_patterns": 256,
+    # locale names to the parsers shared by arrow.get
+    "parsers": 256,
+    # locale classes and format strings to regular expressions, for shared parsers
+    "patterns": 256,
+    # format strings to their literal text and tokens
+    "formats": 256,
+    # timezone expressions to tzinfo objects
+    "timezones": 1024,
+    # timezones and years to their UTC offset transitions
+    "transitions": 1024,
+    # locale classes to their dehumanize patterns
+    "dehumanizers": 256,
+    # classes, timezones and span arguments to the last span taken, see Arrow.span
+    "spans": 0,
+}
+
+
+def _default_size(name: str) -> int:
+    variable = f"ARROW_CACHE_{name.upper()}_SIZE"
+    value = os.environ.get(variable)
+
+    if value is None:
+        return _DEFAULT_SIZES[name]
+
+    try:
+        size = int(value)
+    except ValueError:
+        size = -1
+
+    if size < 0:
+        # arrow is still usable, so a bad setting does not fail the import
+        warnings.warn(
+            f"Invalid {variable} {value!r}, expected a positive integer or 0. "
+            f"Using the default size {_DEFAULT_SIZES[name]} instead.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return _DEFAULT_SIZES[name]
+
+    return size
+
+
+_caches: Dict[str, Cache] = {
+    name: Cache(_default_size(name)) for name in _DEFAULT_SIZES
+}
+
+
+def get_cache(name: str) -> Cache:
+    """Returns a cache by name.
+
+    :param name: the name of the cache, one of the keys of :func:`info`.
+
+    """
+
+    cache = _caches.get(name)
+
+    if cache is None:
+        raise ValueError(
+            f"Unknown cache {name!r}, expected one of {', '.join(map(repr, _caches))}."
+        )
+
+    return cache
+
+
+def info() -> Dict[str, CacheInfo]:
+    """Returns the statistics of every cache by name."""
+
+    return {name: cache.info() for name, cache in _caches.items()}
+
+
+def clear(name: Optional[str] = None) -> None:
+    """Removes the entries of a cache, or of every cache, and resets their statistics.
+
+    :param name: (optional) the name of the cache.  Defaults to every cache.
+
+    """
+
+    for cache in _caches.values() if name is None else [get_cache(name)]:
+        cache.clear()
+
+
+def resize(name: str, maxsize: int) -> None:
+    """Changes the maximum number of entries of a cache, 0 disabling it.
+
+    :param name: the name of the cache.
+    :param maxsize: the maximum number of entries.
+
+    """
+
+    get_cache(name).resize(maxsize)
+
+
+__all__ = ["Cache", "CacheInfo", "get_cache", "info", "clear", "resize"]
@@ -10,13 +10,38 @@ from datetime import date, datetime, timezone
 from datetime import tzinfo as dt_tzinfo
 from decimal import Decimal
 from time import struct_time
-from typing import Any, List, Optional, Tuple, Type, Union, overload
-
-from arrow import parser
-from arrow.arrow import TZ_EXPR, Arrow
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+
+from arrow._lazy import lazy_import
+from arrow.arrow import (
+    _AGGREGATES,
+    _BOUNDS,
+    _CONVERT_OUTPUT,
+    _GRANULARITY,
+    _T_FRAMES,
+    TZ_EXPR,
+    Arrow,
+)
 from arrow.constants import DEFAULT_LOCALE
 from arrow.util import is_timestamp, iso_to_gregorian
 
+if TYPE_CHECKING:
+    from arrow import parser
+else:
+    parser = lazy_import("arrow.parser")
+
 
 class ArrowFactory:
     """A factory for generating :class:`Arrow <arrow.arrow.Arrow>` objects.
@@ -244,7 +269,9 @@ class ArrowFactory:
 
             # (str) -> parse @ tzinfo
             elif isinstance(arg, str):
-                dt = parser.DateTimeParser(locale).parse_iso(arg, normalize_whitespace)
+                dt = parser.DateTimeParser._get_shared(locale).parse_iso(
+                    arg, normalize_whitespace
+                )
                 return self.type.fromdatetime(dt, tzinfo=tz)
 
             # (struct_time) -> from struct_time
@@ -282,7 +309,7 @@ class ArrowFactory:
 
             # (str, format) -> parse @ tzinfo
             elif isinstance(arg_1, str) and isinstance(arg_2, (str, list)):
-                dt = parser.DateTimeParser(locale).parse(
+                dt = parser.DateTimeParser._get_shared(locale).parse(
                     args[0], args[1], normalize_whitespace
                 )
                 return self.type.fromdatetime(dt, tzinfo=tz)
@@ -336,3 +363,130 @@ class ArrowFactory:
             tz = parser.TzinfoParser.parse(tz)
 
         return self.type.now(tz)
+
+    def resample(
+        self,
+        stream: Iterable[Tuple[Union[Arrow, datetime, int, float, str], Any]],
+        frame: _T_FRAMES,
+        tz: Optional[TZ_EXPR] = None,
+        agg: Union[_AGGREGATES, Callable[[List[Any]], Any]] = "count",
+        bounds: _BOUNDS = "[)",
+        week_start: int = 1,
+        fill: bool = False,
+    ) -> Iterator[Tuple[Tuple[Arrow, Arrow], Any]]:
+        """Returns an iterator of tuples, each a timespan of a given timeframe and the aggregate
+        of the values of a time-sorted stream that fall within it.  See
+        :func:`Arrow.resample <arrow.arrow.Arrow.resample>` for the arguments.
+
+        Usage::
+
+            >>> import arrow
+            >>> stream = [(1368082800, 2), (1368083400, 3), (1368090000, 5)]
+            >>> list(arrow.resample(stream, 'hour', agg='max'))
+            [((<Arrow [2013-05-09T07:00:00+00:00]>, <Arrow [2013-05-09T07:59:59.999999+00:00]>), 3), ((<Arrow [2013-05-09T09:00:00+00:00]>, <Arrow [2013-05-09T09:59:59.999999+00:00]>), 5)]
+        """
+
+        return self.type.resample(
+            stream,
+            frame,
+            tz=tz,
+            agg=agg,
+            bounds=bounds,
+            week_start=week_start,
+            fill=fill,
+        )
+
+    def find_gaps(
+        self,
+        values: Iterable[Union[Arrow, datetime, int, float, str]],
+        frame: _T_FRAMES,
+        start: Optional[Union[Arrow, datetime, int, float]] = None,
+        end: Optional[Union[Arrow, datetime, int, float]] = None,
+        tz: Optional[TZ_EXPR] = None,
+        bounds: _BOUNDS = "[)",
+        week_start: int = 1,
+    ) -> Iterator[Tuple[Arrow, Arrow]]:
+        """Returns an iterator of tuples, each a gap of consecutive timespans of a given
+        timeframe without values in a time-sorted series.  See
+        :func:`Arrow.find_gaps <arrow.arrow.Arrow.find_gaps>` for the arguments.
+
+        Usage::
+
+            >>> import arrow
+            >>> values = [1368082800, 1368093600]
+            >>> list(arrow.find_gaps(values, 'hour', end=1368100800))
+            [(<Arrow [2013-05-09T08:00:00+00:00]>, <Arrow [2013-05-09T09:59:59.999999+00:00]>), (<Arrow [2013-05-09T11:00:00+00:00]>, <Arrow [2013-05-09T12:59:59.999999+00:00]>)]
+        """
+
+        return self.type.find_gaps(
+            values,
+            frame,
+            start=start,
+            end=end,
+            tz=tz,
+            bounds=bounds,
+            week_start=week_start,
+        )
+
+    def convert_many(
+        self,
+        values: Iterable[Union[Arrow, datetime, int, float, str]],
+        tz: TZ_EXPR,
+        output: _CONVERT_OUTPUT = "arrow",
+    ) -> List[Union[Arrow, datetime, Tuple[float, int]]]:
+        """Returns a list with each value converted to a timezone.  See
+        :func:`Arrow.convert_many <arrow.arrow.Arrow.convert_many>` for the arguments.
+
+        Usage::
+
+            >>> import arrow
+            >>> arrow.convert_many([1368082800, 1368083400], 'US/Pacific')
+            [<Arrow [2013-05-09T00:00:00-07:00]>, <Arrow [2013-05-09T00:10:00-07:00]>]
+        """
+
+        return self.type.convert_many(values, tz, output=output)
+
+    def humanize_many(
+        self,
+        values: Iterable[Union[Arrow, datetime, int, float, str]],
+        other: Union[Arrow, datetime, None] = None,
+        locale: str = DEFAULT_LOCALE,
+        only_distance: bool = False,
+        granularity: Union[_GRANULARITY, List[_GRANULARITY]] = "auto",
+    ) -> List[str]:
+        """Returns a list with a humanized representation of the relative difference in time
+        of each value.  See :func:`Arrow.humanize_many <arrow.arrow.Arrow.humanize_many>` for
+        the arguments.
+
+        Usage::
+
+            >>> import arrow
+            >>> arrow.humanize_many([1368093600, 1368100800], arrow.get(1368100800))
+            ['2 hours ago', 'just now']
+        """
+
+        return self.type.humanize_many(
+            values,
+            other=other,
+            locale=locale,
+            only_distance=only_distance,
+            granularity=granularity,
+        )
+
+    def warmup(
+        self,
+        formats: Iterable[str] = (),
+        locales: Iterable[str] = (DEFAULT_LOCALE,),
+        timezones: Iterable[TZ_EXPR] = (),
+    ) -> None:
+        """Fills the internal caches used to parse, format, humanize and convert ahead of
+        their first use.  See :func:`Arrow.warmup <arrow.arrow.Arrow.warmup>` for the
+        arguments.
+
+        Usage::
+
+            >>> import arrow
+            >>> arrow.warmup(['DD MMM YYYY'], ['en-us', 'fr'], ['US/Pacific'])
+        """
+
+        self.type.warmup(formats, locales, timezones)
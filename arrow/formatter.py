@@ -2,11 +2,18 @@
 
 import re
 from datetime import datetime, timedelta, timezone
-from typing import Final, Optional, Pattern, cast
+from functools import partial
+from typing import TYPE_CHECKING, ClassVar, Final, Optional, Pattern, Tuple, cast
 
-from arrow import locales
+from arrow import caches, instrumentation
+from arrow._lazy import lazy_import
 from arrow.constants import DEFAULT_LOCALE
 
+if TYPE_CHECKING:
+    from arrow import locales
+else:
+    locales = lazy_import("arrow.locales")
+
 FORMAT_ATOM: Final[str] = "YYYY-MM-DD HH:mm:ssZZ"
 FORMAT_COOKIE: Final[str] = "dddd, DD-MMM-YYYY HH:mm:ss ZZZ"
 FORMAT_RFC822: Final[str] = "ddd, DD MMM YY HH:mm:ss Z"
@@ -29,16 +36,59 @@ class DateTimeFormatter:
         r"(\[(?:(?=(?P<literal>[^]]))(?P=literal))*\]|YYY?Y?|MM?M?M?|Do|DD?D?D?|d?dd?d?|HH?|hh?|mm?|ss?|SS?S?S?S?S?|ZZ?Z?|a|A|X|x|W)"
     )
 
-    locale: locales.Locale
+    # format strings split into their literal text and tokens, flagged True
+    _compiled_formats: ClassVar[caches.Cache] = caches.get_cache("formats")
+
+    locale: "locales.Locale"
 
     def __init__(self, locale: str = DEFAULT_LOCALE) -> None:
         self.locale = locales.get_locale(locale)
 
     def format(cls, dt: datetime, fmt: str) -> str:
+        if instrumentation._hooks and instrumentation._outermost():
+            return instrumentation._observe(
+                "format", partial(DateTimeFormatter.format, cls), dt, fmt
+            )
+
+        format_token = cls._format_token
         # FIXME: _format_token() is nullable
-        return cls._FORMAT_RE.sub(
-            lambda m: cast(str, cls._format_token(dt, m.group(0))), fmt
+        return "".join(
+            [
+                (format_token(dt, part) or "") if is_token else part
+                for part, is_token in cls._compile(fmt)
+            ]
+        )
+
+    @classmethod
+    def _compile(cls, fmt: str) -> Tuple[Tuple[str, bool], ...]:
+        """Returns the parts of a format string, so that it is only scanned for tokens
+        once.  Escaped text is unescaped and kept as literal text."""
+        compiled: Optional[Tuple[Tuple[str, bool], ...]] = cls._compiled_formats.get(
+            fmt
         )
+        if compiled is not None:
+            return compiled
+
+        parts = []
+        position = 0
+        for match in cls._FORMAT_RE.finditer(fmt):
+            if match.start() > position:
+                parts.append((fmt[position : match.start()], False))
+
+            token = match.group(0)
+            if token.startswith("["):
+                parts.append((token[1:-1], False))
+            else:
+                parts.append((token, True))
+            position = match.end()
+
+        if position < len(fmt):
+            parts.append((fmt[position:], False))
+
+        compiled = tuple(parts)
+        cls._compiled_formats.set(fmt, compiled)
+
+        return compiled
 
     def _format_token(self, dt: datetime, token: Optional[str]) -> Optional[str]:
         if token and token.startswith("[") and token.endswith("]"):
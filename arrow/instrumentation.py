@@ -0,0 +1,309 @@
+"""Provides hooks reporting the calls to arrow's hot paths, to count them, time them or
+find the inputs that make them slow.
+
+The instrumented calls are named:
+
+- ``parse``: :meth:`DateTimeParser.parse <arrow.parser.DateTimeParser.parse>`, and so
+  ``arrow.get`` with a format.
+- ``parse_iso``: :meth:`DateTimeParser.parse_iso <arrow.parser.DateTimeParser.parse_iso>`,
+  and so ``arrow.get`` with a string alone.
+- ``format``: :meth:`DateTimeFormatter.format <arrow.formatter.DateTimeFormatter.format>`.
+- ``parse_tzinfo``: :meth:`TzinfoParser.parse <arrow.parser.TzinfoParser.parse>`, and so
+  every timezone expression given as a string.
+- ``range``, ``span``, ``shift`` and ``humanize``: the :class:`Arrow <arrow.arrow.Arrow>`
+  methods of the same names.
+
+Only the outermost instrumented call of a thread is reported: the calls it makes in turn,
+such as the timezone lookups of ``range`` or the formats ``parse_iso`` tries, are part of
+it rather than reported on their own.  ``floor``, ``ceil`` and arrow's other methods
+calling ``span`` internally are not reported as ``span``.
+
+The instrumented methods check whether a hook is registered before anything else, so
+instrumentation costs next to nothing when there is none.
+
+Usage::
+
+    >>> import arrow
+    >>> def report(call):
+    ...     print(f"slow {call.name} of {call.args!r}: {call.duration * 1e6:.0f}µs")
+    >>> arrow.instrumentation.add_hook(report, ["parse", "parse_iso"], threshold=0.0001)
+
+"""
+
+from collections import Counter
+from threading import RLock, local
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+NAMES: Final[Tuple[str, ...]] = (
+    "parse",
+    "parse_iso",
+    "format",
+    "parse_tzinfo",
+    "range",
+    "span",
+    "shift",
+    "humanize",
+)
+
+
+class Call:
+    """An instrumented call, as reported to hooks once it has returned or raised.
+
+    :ivar name: the name of the call, one of :data:`NAMES`.
+    :ivar args: the arguments of the call, defaults included, in the order of the
+        parameters of the method.  Those of parsers and formatters leave out the object
+        they are called on, those of ``range`` its class.
+    :ivar kwargs: the units of ``shift``, empty for the other calls.
+    :ivar duration: the time spent in the call, in seconds.  For ``range``, the time
+        spent producing its values.
+    :ivar error: the exception the call raised, or None.
+    :ivar attempts: the number of formats tried by ``parse`` and ``parse_iso``, 0 for the
+        other calls.
+    :ivar cache_misses: the number of format patterns generated by ``parse`` and
+        ``parse_iso`` because they were not cached, 0 for the other calls.
+
+    """
+
+    __slots__ = (
+        "name",
+        "args",
+        "kwargs",
+        "duration",
+        "error",
+        "attempts",
+        "cache_misses",
+    )
+
+    name: str
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    duration: float
+    error: Optional[Exception]
+    attempts: int
+    cache_misses: int
+
+    def __init__(
+        self, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> None:
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.duration = 0.0
+        self.error = None
+        self.attempts = 0
+        self.cache_misses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} {self.name}{self.args!r} "
+            f"duration={self.duration!r} error={self.error!r}>"
+        )
+
+
+Hook = Callable[[Call], None]
+
+
+class CallStats:
+    """A hook counting the calls of each name, with their failures, format attempts, cache
+    misses, and total and maximum durations in seconds.
+
+    Usage::
+
+        >>> stats = arrow.instrumentation.CallStats()
+        >>> arrow.instrumentation.add_hook(stats)
+        >>> arrow.get('2013-05-05 12:30:45', 'YYYY-MM-DD HH:mm:ss')
+        <Arrow [2013-05-05T12:30:45+00:00]>
+        >>> stats.calls
+        Counter({'parse': 1})
+
+    """
+
+    calls: "Counter[str]"
+    failures: "Counter[str]"
+    attempts: "Counter[str]"
+    cache_misses: "Counter[str]"
+    total_time: "Counter[str]"
+    max_time: Dict[str, float]
+
+    def __init__(self) -> None:
+        self.calls = Counter()
+        self.failures = Counter()
+        self.attempts = Counter()
+        self.cache_misses = Counter()
+        self.total_time = Counter()
+        self.max_time = {}
+
+    def __call__(self, call: Call) -> None:
+        name = call.name
+        self.calls[name] += 1
+        if call.error is not None:
+            self.failures[name] += 1
+        self.attempts[name] += call.attempts
+        self.cache_misses[name] += call.cache_misses
+        self.total_time[name] += call.duration  # type: ignore[assignment]
+        if call.duration > self.max_time.get(name, 0.0):
+            self.max_time[name] = call.duration
+
+
+_T = TypeVar("_T")
+
+# the registered hooks, replaced rather than changed so that calls can read it unlocked
+_hooks: Tuple[Tuple[Hook, Optional[FrozenSet[str]], float], ...] = ()
+_lock = RLock()
+
+# the instrumented call running in each thread
+_state = local()
+
+# stands for the running call while hooks run, so that the calls they make are not
+# reported; what those calls count is dropped
+_reporting = Call("", (), {})
+
+
+def add_hook(
+    hook: Hook, names: Optional[Iterable[str]] = None, threshold: float = 0.0
+) -> None:
+    """Registers a hook, called with a :class:`Call` after each instrumented call.
+
+    :param hook: the hook.  It runs in the thread of the call, and must not raise.  The
+        arrow calls it makes are not reported.
+    :param names: (optional) the names of the calls to report.  Defaults to every call.
+    :param threshold: (optional) the duration in seconds below which calls are not
+        reported.  Defaults to 0, reporting every call.
+
+    """
+
+    global _hooks
+
+    name_set = None if names is None else frozenset(names)
+    if name_set is not None and not name_set <= set(NAMES):
+        unknown = ", ".join(map(repr, sorted(name_set - set(NAMES))))
+        raise ValueError(
+            f"Unknown call {unknown}, expected names among {', '.join(map(repr, NAMES))}."
+        )
+
+    with _lock:
+        _hooks = (*_hooks, (hook, name_set, threshold))
+
+
+def remove_hook(hook: Hook) -> None:
+    """Unregisters a hook, every registration of it if it was registered several times.
+
+    :param hook: the hook.
+
+    """
+
+    global _hooks
+
+    with _lock:
+        hooks = tuple(entry for entry in _hooks if entry[0] != hook)
+        if len(hooks) == len(_hooks):
+            raise ValueError(f"Hook {hook!r} is not registered.")
+
+        _hooks = hooks
+
+
+def _report(call: Call) -> None:
+    outer = getattr(_state, "call", None)
+    _state.call = _reporting
+
+    try:
+        for hook, names, threshold in _hooks:
+            if (names is None or call.name in names) and call.duration >= threshold:
+                hook(call)
+    finally:
+        _state.call = outer
+
+
+def _outermost() -> bool:
+    """Returns whether no instrumented call is running in the current thread.
+
+    The instrumented methods check it once a hook is registered, and then report their
+    call with :func:`_observe` or :func:`_observe_generator`.  These run the code of the
+    method, calling either its private implementation or the method itself again, which
+    then finds the call running.
+
+    """
+
+    return getattr(_state, "call", None) is None
+
+
+def _observe(name: str, function: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Calls ``function`` as the instrumented call ``name``, and reports it."""
+
+    call = Call(name, args, kwargs)
+    _state.call = call
+    start = perf_counter()
+
+    try:
+        return function(*args, **kwargs)
+    except Exception as e:
+        call.error = e
+        raise
+    finally:
+        call.duration = perf_counter() - start
+        _state.call = None
+        if name == "parse" and not call.attempts:
+            call.attempts = 1
+        _report(call)
+
+
+def _observe_generator(
+    name: str, function: Callable[..., Iterator[_T]], *args: Any
+) -> Generator[_T, None, None]:
+    """Yields the values of ``function`` as the instrumented call ``name``, and reports
+    the time spent producing them once it is exhausted, closed or has raised."""
+
+    call = Call(name, args, {})
+    iterator = function(*args)
+
+    try:
+        while True:
+            # the values can be consumed from within other calls
+            outer = getattr(_state, "call", None)
+            _state.call = call
+            start = perf_counter()
+            try:
+                value = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                call.duration += perf_counter() - start
+                _state.call = outer
+            yield value
+    except Exception as e:
+        call.error = e
+        raise
+    finally:
+        _report(call)
+
+
+def _count_attempt() -> None:
+    """Counts a format tried by the current call."""
+
+    call: Optional[Call] = getattr(_state, "call", None)
+    if call is not None:
+        call.attempts += 1
+
+
+def _count_cache_miss() -> None:
+    """Counts a format pattern generated by the current call."""
+
+    call: Optional[Call] = getattr(_state, "call", None)
+    if call is not None:
+        call.cache_misses += 1
+
+
+__all__ = ["NAMES", "Call", "CallStats", "Hook", "add_hook", "remove_hook"]
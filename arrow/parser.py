@@ -3,8 +3,9 @@
 import re
 from datetime import datetime, timedelta, timezone
 from datetime import tzinfo as dt_tzinfo
-from functools import lru_cache
+from functools import partial
 from typing import (
+    TYPE_CHECKING,
     Any,
     ClassVar,
     Dict,
@@ -28,10 +29,16 @@ try:
 except ImportError:
     from backports.zoneinfo import ZoneInfo, ZoneInfoNotFoundError  # type: ignore[import-not-found, no-redef]
 
-from arrow import locales
+from arrow import caches, instrumentation
+from arrow._lazy import lazy_import
 from arrow.constants import DEFAULT_LOCALE
 from arrow.util import next_weekday, normalize_timestamp
 
+if TYPE_CHECKING:
+    from arrow import locales
+else:
+    locales = lazy_import("arrow.locales")
+
 
 class ParserError(ValueError):
     """
@@ -148,6 +155,9 @@ class DateTimeParser:
     :param locale: the locale string
     :param cache_size: the size of the LRU cache used for regular expressions. Defaults to 0.
 
+    The parsers used by :func:`arrow.get` are shared and cache their regular expressions in
+    the ``patterns`` cache of :mod:`arrow.caches` instead.
+
     """
 
     _FORMAT_RE: ClassVar[Pattern[str]] = re.compile(
@@ -203,9 +213,15 @@ class DateTimeParser:
 
     SEPARATORS: ClassVar[List[str]] = ["-", "/", "."]
 
-    locale: locales.Locale
+    locale: "locales.Locale"
     _input_re_map: Dict[_FORMAT_TYPE, Pattern[str]]
 
+    _pattern_cache: Optional[caches.Cache]
+
+    _locale_input_re_maps: ClassVar[caches.Cache] = caches.get_cache("locale_patterns")
+    _shared_parsers: ClassVar[caches.Cache] = caches.get_cache("parsers")
+    _shared_pattern_cache: ClassVar[caches.Cache] = caches.get_cache("patterns")
+
     def __init__(self, locale: str = DEFAULT_LOCALE, cache_size: int = 0) -> None:
         """
         Contains the regular expressions and functions to parse and split the input strings into tokens and eventually
@@ -218,34 +234,67 @@ class DateTimeParser:
         """
         self.locale = locales.get_locale(locale)
         self._input_re_map = self._BASE_INPUT_RE_MAP.copy()
-        self._input_re_map.update(
-            {
-                "MMMM": self._generate_choice_re(
-                    self.locale.month_names[1:], re.IGNORECASE
-                ),
-                "MMM": self._generate_choice_re(
-                    self.locale.month_abbreviations[1:], re.IGNORECASE
-                ),
-                "Do": re.compile(self.locale.ordinal_day_re),
-                "dddd": self._generate_choice_re(
-                    self.locale.day_names[1:], re.IGNORECASE
+        self._input_re_map.update(self._get_locale_input_re_map(self.locale))
+        self._pattern_cache = caches.Cache(cache_size) if cache_size > 0 else None
+
+    @classmethod
+    def _get_locale_input_re_map(
+        cls, locale: "locales.Locale"
+    ) -> Dict[_FORMAT_TYPE, Pattern[str]]:
+        """
+        Return the regular expressions for the locale-specific tokens, compiled once per locale.
+
+        :param locale: The locale to generate the regular expressions for.
+        :type locale: locales.Locale
+        :returns: A dictionary mapping the locale-specific tokens to their regular expressions.
+        :rtype: Dict[str, re.Pattern[str]]
+        """
+        input_re_map: Optional[Dict[_FORMAT_TYPE, Pattern[str]]] = (
+            cls._locale_input_re_maps.get(type(locale))
+        )
+
+        if input_re_map is None:
+            input_re_map = {
+                "MMMM": cls._generate_choice_re(locale.month_names[1:], re.IGNORECASE),
+                "MMM": cls._generate_choice_re(
+                    locale.month_abbreviations[1:], re.IGNORECASE
                 ),
-                "ddd": self._generate_choice_re(
-                    self.locale.day_abbreviations[1:], re.IGNORECASE
+                "Do": re.compile(locale.ordinal_day_re),
+                "dddd": cls._generate_choice_re(locale.day_names[1:], re.IGNORECASE),
+                "ddd": cls._generate_choice_re(
+                    locale.day_abbreviations[1:], re.IGNORECASE
                 ),
                 "d": re.compile(r"[1-7]"),
-                "a": self._generate_choice_re(
-                    (self.locale.meridians["am"], self.locale.meridians["pm"])
+                "a": cls._generate_choice_re(
+                    (locale.meridians["am"], locale.meridians["pm"])
                 ),
                 # note: 'A' token accepts both 'am/pm' and 'AM/PM' formats to
                 # ensure backwards compatibility of this token
-                "A": self._generate_choice_re(self.locale.meridians.values()),
+                "A": cls._generate_choice_re(locale.meridians.values()),
             }
-        )
-        if cache_size > 0:
-            self._generate_pattern_re = lru_cache(maxsize=cache_size)(  # type: ignore
-                self._generate_pattern_re
-            )
+            cls._locale_input_re_maps.set(type(locale), input_re_map)
+
+        return input_re_map
+
+    @classmethod
+    def _get_shared(cls, locale: str = DEFAULT_LOCALE) -> "DateTimeParser":
+        """
+        Return the parser shared by every caller parsing with a locale, so that the regular
+        expressions generated for its formats are cached between calls.
+
+        :param locale: The locale string.
+        :type locale: str
+        :returns: A parser caching its regular expressions in the ``patterns`` cache.
+        :rtype: DateTimeParser
+        """
+        parser: Optional[DateTimeParser] = cls._shared_parsers.get(locale)
+
+        if parser is None:
+            parser = DateTimeParser(locale)
+            parser._pattern_cache = cls._shared_pattern_cache
+            cls._shared_parsers.set(locale, parser)
+
+        return parser
 
     # TODO: since we support more than ISO 8601, we should rename this function
     # IDEA: break into multiple functions
@@ -269,6 +318,14 @@ class DateTimeParser:
         datetime.datetime(2021, 10, 12, 14, 30)
 
         """
+
+        if instrumentation._hooks and instrumentation._outermost():
+            return instrumentation._observe(
+                "parse_iso",
+                partial(DateTimeParser.parse_iso, self),
+                datetime_string,
+                normalize_whitespace,
+            )
         if normalize_whitespace:
             datetime_string = re.sub(r"\s+", " ", datetime_string.strip())
 
@@ -397,6 +454,15 @@ class DateTimeParser:
 
 
         """
+
+        if instrumentation._hooks and instrumentation._outermost():
+            return instrumentation._observe(
+                "parse",
+                partial(DateTimeParser.parse, self),
+                datetime_string,
+                fmt,
+                normalize_whitespace,
+            )
         if normalize_whitespace:
             datetime_string = re.sub(r"\s+", " ", datetime_string)
 
@@ -406,7 +472,7 @@ class DateTimeParser:
         try:
             fmt_tokens: List[_FORMAT_TYPE]
             fmt_pattern_re: Pattern[str]
-            fmt_tokens, fmt_pattern_re = self._generate_pattern_re(fmt)
+            fmt_tokens, fmt_pattern_re = self._get_pattern_re(fmt)
         except re.error as e:
             raise ParserMatchError(
                 f"Failed to generate regular expression pattern: {e}."
@@ -438,6 +504,34 @@ class DateTimeParser:
 
         return self._build_datetime(parts)
 
+    def _get_pattern_re(self, fmt: str) -> Tuple[List[_FORMAT_TYPE], Pattern[str]]:
+        """
+        Return the result of :meth:`_generate_pattern_re` for a format string, from the
+        cache of the parser when it has one.
+
+        :param fmt: The format string to convert into a regular expression pattern.
+        :type fmt: str
+        :returns: A tuple containing a list of format tokens and the corresponding regular expression pattern.
+        :rtype: Tuple[List[str], re.Pattern[str]]
+        """
+        cache = self._pattern_cache
+        if cache is None:
+            if instrumentation._hooks:
+                instrumentation._count_cache_miss()
+            return self._generate_pattern_re(fmt)
+
+        # parsers of a locale share the same tokens
+        key = (type(self.locale), fmt)
+        entry: Optional[Tuple[List[_FORMAT_TYPE], Pattern[str]]] = cache.get(key)
+
+        if entry is None:
+            if instrumentation._hooks:
+                instrumentation._count_cache_miss()
+            entry = self._generate_pattern_re(fmt)
+            cache.set(key, entry)
+
+        return entry
+
     def _generate_pattern_re(self, fmt: str) -> Tuple[List[_FORMAT_TYPE], Pattern[str]]:
         """
         Generates a regular expression pattern from a format string.
@@ -631,18 +725,19 @@ class DateTimeParser:
         elif token == "Do":
             parts["day"] = int(value)
 
-        elif token == "dddd":
+        elif token in ["dddd", "ddd"]:
             # locale day names are 1-indexed
-            day_of_week = [x.lower() for x in self.locale.day_names].index(
-                value.lower()
-            )
-            parts["day_of_week"] = day_of_week - 1
-
-        elif token == "ddd":
-            # locale day abbreviations are 1-indexed
-            day_of_week = [x.lower() for x in self.locale.day_abbreviations].index(
-                value.lower()
-            )
+            day_of_week = (
+                self.locale._day_name_to_ordinal
+                if token == "dddd"
+                else self.locale._day_abbreviation_to_ordinal
+            ).get(value.lower())
+            # the regex match ignores case, which can accept letters that lower()
+            # does not map back onto the locale's names
+            if day_of_week is None:
+                raise ParserMatchError(
+                    f"Unable to match {value!r} to a day of the week for token {token!r}."
+                )
             parts["day_of_week"] = day_of_week - 1
 
         elif token.upper() in ["HH", "H"]:
@@ -681,13 +776,14 @@ class DateTimeParser:
             parts["tzinfo"] = TzinfoParser.parse(value)
 
         elif token in ["a", "A"]:
-            if value in (self.locale.meridians["am"], self.locale.meridians["AM"]):
+            am_pm = self.locale._meridian_to_am_pm.get(value)
+            if am_pm == "am":
                 parts["am_pm"] = "am"
                 if "hour" in parts and not 0 <= parts["hour"] <= 12:
                     raise ParserMatchError(
                         f"Hour token value must be between 0 and 12 inclusive for token {token!r}."
                     )
-            elif value in (self.locale.meridians["pm"], self.locale.meridians["PM"]):
+            elif am_pm == "pm":
                 parts["am_pm"] = "pm"
         elif token == "W":
             parts["weekdate"] = value
@@ -846,6 +942,8 @@ class DateTimeParser:
         _datetime: Optional[datetime] = None
 
         for fmt in formats:
+            if instrumentation._hooks:
+                instrumentation._count_attempt()
             try:
                 _datetime = self.parse(string, fmt)
                 break
@@ -891,6 +989,9 @@ class TzinfoParser:
         r"^(?:\(UTC)*([\+\-])?(\d{2})(?:\:?(\d{2}))?"
     )
 
+    # parsed timezones are kept alive here, beyond the few ZoneInfo caches strongly
+    _tzinfos: ClassVar[caches.Cache] = caches.get_cache("timezones")
+
     @classmethod
     def parse(cls, tzinfo_string: str) -> dt_tzinfo:
         """
@@ -902,12 +1003,24 @@ class TzinfoParser:
         :rtype: datetime.timezone
         :raises ParserError: If the timezone string cannot be parsed.
         """
-        tzinfo: Optional[dt_tzinfo] = None
+        if instrumentation._hooks and instrumentation._outermost():
+            return instrumentation._observe("parse_tzinfo", cls._parse, tzinfo_string)
+        return cls._parse(tzinfo_string)
+
+    @classmethod
+    def _parse(cls, tzinfo_string: str) -> dt_tzinfo:
+        """Returns the result of :meth:`parse`, without reporting the call to the hooks of
+        :mod:`arrow.instrumentation`."""
+        tzinfo: Optional[dt_tzinfo] = cls._tzinfos.get(tzinfo_string)
+        if tzinfo is not None:
+            return tzinfo
 
         if tzinfo_string == "local":
+            # the local timezone can change, so it is never cached
             tzinfo = datetime.now().astimezone().tzinfo
+            return cast(dt_tzinfo, tzinfo)
 
-        elif tzinfo_string in ["utc", "UTC", "Z"]:
+        if tzinfo_string in ["utc", "UTC", "Z"]:
             tzinfo = timezone.utc
 
         else:
@@ -934,4 +1047,6 @@ class TzinfoParser:
         if tzinfo is None:
             raise ParserError(f"Could not parse timezone expression {tzinfo_string!r}.")
 
+        cls._tzinfos.set(tzinfo_string, tzinfo)
+
         return tzinfo
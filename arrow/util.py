@@ -3,8 +3,6 @@
 import datetime
 from typing import Any, Optional
 
-from dateutil.rrule import WEEKLY, rrule
-
 from arrow.constants import (
     MAX_ORDINAL,
     MAX_TIMESTAMP,
@@ -39,7 +37,12 @@ def next_weekday(
     """
     if weekday < 0 or weekday > 6:
         raise ValueError("Weekday must be between 0 (Monday) and 6 (Sunday).")
-    return rrule(freq=WEEKLY, dtstart=start_date, byweekday=weekday, count=1)[0]
+
+    from dateutil import rrule
+
+    return rrule.rrule(
+        freq=rrule.WEEKLY, dtstart=start_date, byweekday=weekday, count=1
+    )[0]
 
 
 def is_timestamp(value: Any) -> bool:
@@ -0,0 +1,4 @@
+"""Benchmarks of arrow's hot paths, run with ``python -m benchmarks``.
+
+See ``benchmarks/README.rst`` for their usage.
+"""
@@ -0,0 +1,336 @@
+"""Runs the benchmarks, or compares saved results.
+
+Usage::
+
+    python -m benchmarks run --output baseline.json
+    python -m benchmarks run --output changes.json
+    python -m benchmarks compare baseline.json changes.json --threshold 0.1
+    python -m benchmarks parsers
+    python -m benchmarks cold-start
+    python -m benchmarks memory
+    python -m benchmarks threads
+    python -m benchmarks ingest --lines 1000000
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import Callable, List, Optional
+
+from . import cold_start, ingest, memory, parsers, runner, threads
+from .cases import CASES
+
+
+def _run(args: argparse.Namespace) -> int:
+    def report(name: str, result: runner.Result) -> None:
+        print(
+            f"{name:<40} {runner.format_time(result.min):>10} "
+            f"{runner.format_time(result.median):>10} {result.loops:>9}"
+        )
+
+    print(f"{'case':<40} {'min':>10} {'median':>10} {'loops':>9}")
+    results = runner.run(CASES, args.filter, args.repeat, args.min_time, report=report)
+
+    if not results:
+        print(f"No case matches {args.filter!r}.", file=sys.stderr)
+        return 2
+
+    if args.output is not None:
+        runner.save(args.output, results)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline_environment, baseline = runner.load(args.baseline)
+    environment, results = runner.load(args.results)
+
+    for key in ("python", "implementation", "machine"):
+        if baseline_environment.get(key) != environment.get(key):
+            print(
+                f"Warning: the results were taken on {key} "
+                f"{baseline_environment.get(key)} and {environment.get(key)}.",
+                file=sys.stderr,
+            )
+
+    changes = runner.compare(baseline, results, args.key)
+
+    print(f"{'case':<40} {'baseline':>10} {'results':>10} {'change':>9}")
+    for change in changes:
+        print(runner.format_change(change))
+
+    slower = runner.regressions(changes, args.threshold)
+    if slower:
+        print(
+            f"\n{len(slower)} case(s) slower by more than {args.threshold:.0%}:",
+            ", ".join(change.name for change in slower),
+        )
+        return 1
+    return 0
+
+
+def _parsers(args: argparse.Namespace) -> int:
+    disagreements = []
+
+    print(f"{'workload':<12} {'parser':<24} {'per second':>12} {'ratio':>8}")
+    for workload in parsers.workloads():
+        disagreements += parsers.check(workload)
+        for throughput in parsers.measure(workload, args.repeat, args.min_time):
+            print(
+                f"{throughput.workload:<12} {throughput.parser:<24} "
+                f"{throughput.per_second:>12,.0f} {throughput.ratio:>7.2f}x"
+            )
+
+    if disagreements:
+        print(f"\n{len(disagreements)} input(s) parsed differently than by arrow:")
+        for disagreement in disagreements:
+            print(
+                f"{disagreement.workload:<12} {disagreement.parser:<24} "
+                f"{disagreement.input!r}: {disagreement.value} "
+                f"instead of {disagreement.expected}"
+            )
+        return 1
+    return 0
+
+
+def _cold_start(args: argparse.Namespace) -> int:
+    budget = cold_start.load_budget(args.budget)
+    timings = []
+
+    print(f"{'scenario':<14} {'import':>10} {'first call':>10} {'budget':>10}")
+    for scenario in cold_start.SCENARIOS:
+        timing = cold_start.measure(scenario, args.repeat)
+        timings.append(timing)
+        print(
+            f"{scenario:<14} {runner.format_time(timing.import_time):>10} "
+            f"{runner.format_time(timing.call_time):>10} "
+            f"{runner.format_time(budget.get(scenario)):>10}"
+        )
+
+    for scenario in cold_start.SCENARIOS:
+        by_call = scenario != "import"
+        module_times = [
+            module_time
+            for module_time in cold_start.modules(scenario)
+            if module_time.by_call == by_call
+        ]
+        if not module_times:
+            continue
+
+        title = "import arrow" if not by_call else f"first call of {scenario}"
+        print(f"\nModules imported or executed by {title}:")
+        for module_time in sorted(module_times, key=lambda m: -m.self_time):
+            print(
+                f"  {module_time.module:<36} "
+                f"{runner.format_time(module_time.self_time):>10}"
+            )
+
+    slower = cold_start.over_budget(timings, budget)
+    if slower:
+        print(
+            f"\n{len(slower)} scenario(s) over budget:",
+            ", ".join(timing.scenario for timing in slower),
+        )
+        return 1
+    return 0
+
+
+def _memory(args: argparse.Namespace) -> int:
+    measurements, cache_sizes = memory.measure()
+
+    print(f"{'operation':<16} {'bytes':>10} {'blocks':>8} {'peak':>10}")
+    for measurement in measurements:
+        peak = "-" if measurement.peak is None else f"{measurement.peak:,}"
+        print(
+            f"{measurement.name:<16} {measurement.size:>10,.1f} "
+            f"{measurement.blocks:>8.2f} {peak:>10}"
+        )
+
+    print(f"\n{'cache':<16} {'entries':>10} {'bytes':>10}")
+    for cache_size in cache_sizes:
+        print(
+            f"{cache_size.name:<16} {cache_size.entries:>10,} "
+            f"{cache_size.size:>10,}"
+        )
+
+    if args.output is not None:
+        memory.save(args.output, measurements, cache_sizes)
+
+    if args.baseline is not None:
+        larger = memory.regressions(
+            args.baseline, measurements, cache_sizes, args.threshold
+        )
+        if larger:
+            print(f"\n{len(larger)} size(s) larger by more than {args.threshold:.0%}:")
+            for description in larger:
+                print(f"  {description}")
+            return 1
+    return 0
+
+
+def _threads(args: argparse.Namespace) -> int:
+    gil = "with" if threads.gil_enabled() else "without"
+    print(f"Python {sys.version.split()[0]} {gil} the GIL\n")
+
+    print(f"{'workload':<12} {'threads':>8} {'per second':>12} {'efficiency':>11}")
+    for name in threads.WORKLOADS:
+        for scaling in threads.measure(name, args.threads, args.calls):
+            print(
+                f"{scaling.workload:<12} {scaling.threads:>8} "
+                f"{scaling.per_second:>12,.0f} {scaling.efficiency:>11.0%}"
+            )
+    return 0
+
+
+def _ingest(args: argparse.Namespace) -> int:
+    path = args.log
+    if path is None:
+        descriptor, path = tempfile.mkstemp(prefix="arrow-", suffix=".log")
+        os.close(descriptor)
+
+    try:
+        ingest.generate(path, args.lines, args.junk, args.days, args.seed)
+        result = ingest.ingest(path)
+    finally:
+        if args.log is None:
+            os.remove(path)
+
+    peak_rss = "-" if result.peak_rss is None else f"{result.peak_rss / 2**20:.1f}MiB"
+    print(f"lines       {result.lines:>12,}")
+    print(f"parsed      {result.parsed:>12,}")
+    print(f"rejected    {result.rejected:>12,}")
+    print(f"minutes     {result.minutes:>12,}")
+    print(f"duration    {result.duration:>11.2f}s")
+    print(f"per second  {result.per_second:>12,.0f}")
+    print(f"peak RSS    {peak_rss:>12}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="time the benchmark cases")
+    run.add_argument("-o", "--output", help="save the results to a JSON file")
+    run.add_argument(
+        "-k", "--filter", help="only run the cases matching a regular expression"
+    )
+    run.add_argument(
+        "--repeat", type=int, default=5, help="the number of loops per case"
+    )
+    run.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="the minimum duration of a loop, in seconds",
+    )
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser(
+        "compare", help="compare results to a baseline, failing on regressions"
+    )
+    compare.add_argument("baseline", help="the JSON file of the baseline results")
+    compare.add_argument("results", help="the JSON file of the new results")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the relative slowdown failing a case, defaults to 0.1 for 10%%",
+    )
+    compare.add_argument(
+        "--key",
+        choices=("min", "median"),
+        default="min",
+        help="the timing compared, defaults to min",
+    )
+    compare.set_defaults(handler=_compare)
+
+    compare_parsers = commands.add_parser(
+        "parsers",
+        help="compare arrow.get to the standard library, dateutil and dateparser",
+    )
+    compare_parsers.add_argument(
+        "--repeat", type=int, default=5, help="the number of loops per parser"
+    )
+    compare_parsers.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="the minimum duration of a loop, in seconds",
+    )
+    compare_parsers.set_defaults(handler=_parsers)
+
+    cold = commands.add_parser(
+        "cold-start",
+        help="time importing arrow and first calls in fresh interpreters",
+    )
+    cold.add_argument(
+        "--repeat", type=int, default=10, help="the number of interpreters to run"
+    )
+    cold.add_argument(
+        "--budget",
+        default=cold_start.BUDGET,
+        help="a JSON file of the maximum time of each scenario, in milliseconds",
+    )
+    cold.set_defaults(handler=_cold_start)
+
+    measure_memory = commands.add_parser(
+        "memory", help="measure the memory of objects, hot paths and caches"
+    )
+    measure_memory.add_argument(
+        "-o", "--output", help="save the measurements to a JSON file"
+    )
+    measure_memory.add_argument(
+        "--baseline", help="compare the measurements to a JSON file saved before"
+    )
+    measure_memory.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the relative growth failing a size, defaults to 0.1 for 10%%",
+    )
+    measure_memory.set_defaults(handler=_memory)
+
+    scale = commands.add_parser(
+        "threads", help="measure how hot paths scale with threads"
+    )
+    scale.add_argument(
+        "--threads",
+        type=int,
+        default=threads.max_threads(),
+        help="the maximum number of threads, defaults to the CPUs up to 8",
+    )
+    scale.add_argument(
+        "--calls", type=int, default=20000, help="the number of calls per thread"
+    )
+    scale.set_defaults(handler=_threads)
+
+    ingest_log = commands.add_parser(
+        "ingest", help="measure the throughput of ingesting a synthetic log"
+    )
+    ingest_log.add_argument(
+        "--lines", type=int, default=1000000, help="the number of lines of the log"
+    )
+    ingest_log.add_argument(
+        "--junk", type=float, default=0.05, help="the share of junk lines"
+    )
+    ingest_log.add_argument(
+        "--days", type=int, default=7, help="the number of days the log spans"
+    )
+    ingest_log.add_argument(
+        "--seed", type=int, default=0, help="the seed of the generated log"
+    )
+    ingest_log.add_argument(
+        "--log",
+        help="the path the log is generated at and kept, defaults to a temporary file",
+    )
+    ingest_log.set_defaults(handler=_ingest)
+
+    args = parser.parse_args(argv)
+    handler: Callable[[argparse.Namespace], int] = args.handler
+    return handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""The cases of the benchmark suite, timing arrow's public hot paths once their caches
+are warm."""
+
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Dict
+
+import arrow
+from arrow.parser import TzinfoParser
+
+from .runner import Case
+
+CASES: Dict[str, Case] = {}
+
+
+def _case(name: str, case: Case) -> None:
+    if name in CASES:
+        raise ValueError(f"Duplicate benchmark case {name!r}.")
+    CASES[name] = case
+
+
+# arrow.get
+
+ISO_STRINGS = {
+    "date": "2013-05-05",
+    "datetime": "2013-05-05T12:30:45",
+    "fraction": "2013-05-05T12:30:45.123456",
+    "offset": "2013-05-05T12:30:45+05:30",
+    "utc": "2013-05-05T12:30:45Z",
+    "basic": "20130505T123045",
+    "week": "2013-W18-7",
+    "ordinal": "2013-125",
+    "space": "2013-05-05 12:30:45.123-07:00",
+}
+
+for _name, _string in ISO_STRINGS.items():
+    _case(f"get.iso.{_name}", partial(arrow.get, _string))
+
+FORMATTED_STRINGS = {
+    "numeric": ("2013-05-05 12:30:45", "YYYY-MM-DD HH:mm:ss"),
+    "names": ("Sunday, May 5, 2013 12:30 pm", "dddd, MMMM D, YYYY h:mm a"),
+    "offset": ("05/05/2013 12:30:45.123 +05:30", "MM/DD/YYYY HH:mm:ss.SSS ZZ"),
+    "timezone": ("2013-05-05 12:30 US/Pacific", "YYYY-MM-DD HH:mm ZZZ"),
+    "escaped": ("May 5th, 2013 at 12:30", "MMMM Do, YYYY [at] HH:mm"),
+    "timestamp": ("1367757045.123", "X"),
+}
+
+for _name, (_string, _fmt) in FORMATTED_STRINGS.items():
+    _case(f"get.format.{_name}", partial(arrow.get, _string, _fmt))
+
+_case(
+    "get.format.locale",
+    lambda: arrow.get("5 mai 2013 12:30", "D MMMM YYYY HH:mm", locale="fr"),
+)
+
+FORMAT_LIST = [
+    "YYYY-MM-DD HH:mm:ss",
+    "MM/DD/YYYY HH:mm",
+    "DD MMM YYYY HH:mm:ss ZZ",
+    "ddd, DD MMM YYYY HH:mm:ss Z",
+]
+
+_case("get.formats.first", lambda: arrow.get("2013-05-05 12:30:45", FORMAT_LIST))
+_case(
+    "get.formats.last",
+    lambda: arrow.get("Sun, 05 May 2013 12:30:45 +0000", FORMAT_LIST),
+)
+
+_case("get.datetime", lambda: arrow.get(datetime(2013, 5, 5, 12, 30, 45)))
+_case("get.timestamp", lambda: arrow.get(1367757045.123))
+
+# Arrow.format
+
+_ARW = arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456, tzinfo="US/Pacific")
+
+FORMATS = {
+    "date": "YYYY-MM-DD",
+    "numeric": "YYYY-MM-DD HH:mm:ss.SSSSSS ZZ",
+    "names": "dddd, MMMM Do YYYY h:mm a",
+    "timezone": "HH:mm ZZZ",
+    "escaped": "[Week] W [of] YYYY",
+    "timestamp": "X x",
+}
+
+_case("format.default", _ARW.format)
+for _name, _fmt in FORMATS.items():
+    _case(f"format.{_name}", partial(_ARW.format, _fmt))
+
+_case("format.locale", lambda: _ARW.format("dddd D MMMM YYYY", locale="ru"))
+_case("isoformat", lambda: _ARW.isoformat())
+
+# humanize and dehumanize
+
+_OTHER = _ARW.shift(hours=-3, minutes=-10)
+
+_case("humanize", lambda: _ARW.humanize(_OTHER))
+_case("humanize.locale", lambda: _ARW.humanize(_OTHER, locale="de"))
+_case(
+    "humanize.granularity",
+    lambda: _ARW.humanize(_OTHER, granularity=["hour", "minute"]),
+)
+_case("dehumanize", lambda: _ARW.dehumanize("in 3 hours"))
+_case("dehumanize.locale", lambda: _ARW.dehumanize("vor 3 Stunden", locale="de"))
+
+# ranges
+
+_START = arrow.Arrow(2013, 1, 1, tzinfo="US/Pacific")
+_END = _START.shift(days=99)
+
+_case("range.hour", lambda: list(arrow.Arrow.range("hour", _START, limit=100)))
+_case("range.day", lambda: list(arrow.Arrow.range("day", _START, limit=100)))
+_case("range.month", lambda: list(arrow.Arrow.range("month", _START, limit=100)))
+_case(
+    "span_range.day",
+    lambda: list(arrow.Arrow.span_range("day", _START.datetime, _END.datetime)),
+)
+_case(
+    "interval.day",
+    lambda: list(arrow.Arrow.interval("day", _START.datetime, _END.datetime, 7)),
+)
+
+# span and floor
+
+for _frame in ("minute", "hour", "day", "week", "month", "quarter", "year"):
+    _case(f"span.{_frame}", partial(_ARW.span, _frame))
+
+_case("floor.minute", lambda: _ARW.floor("minute"))
+_case("floor.day", lambda: _ARW.floor("day"))
+
+# shift and to
+
+_case("shift.hours", lambda: _ARW.shift(hours=1))
+_case("shift.days", lambda: _ARW.shift(days=1))
+_case("shift.months", lambda: _ARW.shift(months=1))
+_case("shift.mixed", lambda: _ARW.shift(years=-1, weeks=2, minutes=30))
+_case("shift.timedelta", lambda: _ARW + timedelta(hours=1))
+
+_case("to.utc", lambda: _ARW.to("UTC"))
+_case("to.name", lambda: _ARW.to("Europe/Paris"))
+_case("to.offset", lambda: _ARW.to("+05:30"))
+
+_TZINFO = _ARW.tzinfo
+_case("to.tzinfo", lambda: _ARW.to(_TZINFO))
+
+# TzinfoParser.parse
+
+for _name, _string in (
+    ("utc", "utc"),
+    ("name", "America/New_York"),
+    ("offset", "-07:00"),
+):
+    _case(f"tzinfo.{_name}", partial(TzinfoParser.parse, _string))
@@ -0,0 +1,191 @@
+"""Measures the time to import arrow, and the latency of first calls, in fresh
+interpreters."""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Tuple
+
+# the calls timed, with the code preparing them
+SCENARIOS: Dict[str, Tuple[str, str]] = {
+    "import": ("", "pass"),
+    "get_iso": ("", "arrow.get('2013-05-05T12:30:45+00:00')"),
+    "format": (
+        "arw = arrow.Arrow(2013, 5, 5, 12, 30)",
+        "arw.format('YYYY-MM-DD HH:mm:ss ZZ')",
+    ),
+    "to": ("arw = arrow.Arrow(2013, 5, 5, 12, 30)", "arw.to('US/Pacific')"),
+    "humanize_ru": (
+        "arw = arrow.Arrow(2013, 5, 5, 12, 30)\n"
+        "other = arrow.Arrow(2013, 5, 5, 11, 30)",
+        "arw.humanize(other, locale='ru')",
+    ),
+}
+
+# the modules reported individually, by prefix
+MODULES: Tuple[str, ...] = ("arrow", "dateutil", "zoneinfo", "tzdata")
+
+BUDGET = os.path.join(os.path.dirname(__file__), "cold_start_budget.json")
+
+_MARKER = "-- call"
+
+_SCRIPT = """\
+import sys
+from time import perf_counter
+start = perf_counter()
+import arrow
+imported = perf_counter()
+{setup}
+{trace}
+sys.stderr.write({marker!r} + "\\n")
+sys.stderr.flush()
+called = perf_counter()
+{call}
+end = perf_counter()
+print(imported - start, end - called)
+"""
+
+
+# arrow defers executing most of its own modules to their first use, which -X importtime
+# does not see: their execution is reported in the same format instead
+_TRACE = """\
+from importlib.machinery import SourceFileLoader
+exec_module = SourceFileLoader.exec_module
+children = []
+def traced_exec_module(self, module):
+    children.append(0.0)
+    begin = perf_counter()
+    try:
+        exec_module(self, module)
+    finally:
+        elapsed = perf_counter() - begin
+        self_time = elapsed - children.pop()
+        if children:
+            children[-1] += elapsed
+        sys.stderr.write(
+            f"import time: {int(self_time * 1e6)} | - | {module.__name__}\\n"
+        )
+SourceFileLoader.exec_module = traced_exec_module
+"""
+
+
+class Timing(NamedTuple):
+    """The median times of a scenario over fresh interpreters, in seconds."""
+
+    scenario: str
+    import_time: float
+    call_time: float
+
+
+class ModuleTime(NamedTuple):
+    """The time spent importing a module alone, in seconds, and whether it was
+    imported by the call rather than by ``import arrow``."""
+
+    scenario: str
+    module: str
+    self_time: float
+    by_call: bool
+
+
+def _script(scenario: str, trace: bool) -> str:
+    setup, call = SCENARIOS[scenario]
+    return _SCRIPT.format(
+        setup=setup, call=call, trace=_TRACE if trace else "", marker=_MARKER
+    )
+
+
+def _run(scenario: str, trace: bool = False) -> Tuple[str, str]:
+    options = ["-X", "importtime"] if trace else []
+    process = subprocess.run(
+        [sys.executable, *options, "-c", _script(scenario, trace)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return process.stdout, process.stderr
+
+
+def measure(scenario: str, repeat: int = 10) -> Timing:
+    """Returns the median times to import arrow and run the call of a scenario.
+
+    :param scenario: the name of the scenario.
+    :param repeat: the number of interpreters to run.
+
+    """
+
+    # compiles the bytecode of arrow and its dependencies beforehand
+    _run(scenario)
+
+    import_times, call_times = [], []
+    for _ in range(repeat):
+        stdout, _ = _run(scenario)
+        import_time, call_time = map(float, stdout.split())
+        import_times.append(import_time)
+        call_times.append(call_time)
+
+    return Timing(
+        scenario, statistics.median(import_times), statistics.median(call_times)
+    )
+
+
+def modules(scenario: str) -> List[ModuleTime]:
+    """Returns the modules of interest imported or executed by a scenario, with their
+    self time as reported by ``python -X importtime``.
+
+    :param scenario: the name of the scenario.
+
+    """
+
+    _, stderr = _run(scenario, trace=True)
+    # the deferred modules executed while being imported are reported twice
+    module_times: Dict[Tuple[str, bool], ModuleTime] = {}
+    by_call = False
+
+    for line in stderr.splitlines():
+        if line == _MARKER:
+            by_call = True
+            continue
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        # import time: self | cumulative | indented module name
+        self_time, _, module = line[len("import time:") :].split("|")
+        module = module.strip()
+        if module.split(".")[0] in MODULES:
+            module_times[module, by_call] = ModuleTime(
+                scenario, module, int(self_time) / 1e6, by_call
+            )
+
+    return list(module_times.values())
+
+
+def load_budget(path: str = BUDGET) -> Dict[str, float]:
+    """Loads the maximum time of each scenario, in seconds, from a JSON file of
+    milliseconds.
+
+    :param path: the path of the file.
+
+    """
+
+    with open(path) as f:
+        return {scenario: ms / 1e3 for scenario, ms in json.load(f).items()}
+
+
+def over_budget(timings: List[Timing], budget: Dict[str, float]) -> List[Timing]:
+    """Returns the timings over their budget.  The budget of ``import`` applies to
+    the import time, those of the others to their call time.
+
+    :param timings: the timings.
+    :param budget: the maximum times by scenario, in seconds.
+
+    """
+
+    return [
+        timing
+        for timing in timings
+        if timing.scenario in budget
+        and (timing.import_time if timing.scenario == "import" else timing.call_time)
+        > budget[timing.scenario]
+    ]
@@ -0,0 +1,160 @@
+"""Measures the end-to-end throughput of ingesting a synthetic log: parsing each line's
+timestamp, converting it to the line's timezone, flooring it to the minute and formatting
+it."""
+
+import random
+import sys
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from timeit import default_timer
+from typing import List, NamedTuple, Optional, Tuple
+
+import arrow
+
+# the formats of the timestamps, for strftime and for arrow.get
+FORMATS: List[Tuple[str, str]] = [
+    # ISO 8601
+    ("%Y-%m-%dT%H:%M:%S.{ms}{offset}", "YYYY-MM-DDTHH:mm:ss.SSSZZ"),
+    # RFC 2822
+    ("%a, %d %b %Y %H:%M:%S {compact}", "ddd, DD MMM YYYY HH:mm:ss Z"),
+    # common log format
+    ("%d/%b/%Y:%H:%M:%S {compact}", "DD/MMM/YYYY:HH:mm:ss Z"),
+    # custom
+    ("%Y/%m/%d %H:%M:%S {offset}", "YYYY/MM/DD HH:mm:ss ZZ"),
+]
+
+# the timezones the timestamps are written in and converted to
+TIMEZONES: List[str] = [
+    "UTC",
+    "US/Pacific",
+    "America/New_York",
+    "Europe/London",
+    "Europe/Paris",
+    "Asia/Kolkata",
+    "Asia/Tokyo",
+    "Australia/Sydney",
+]
+
+OUTPUT_FORMAT = "YYYY-MM-DD HH:mm ZZ"
+
+_MESSAGES = [
+    "GET /index.html 200",
+    "POST /api/orders 201",
+    "worker started",
+    "cache miss for key user:1234",
+    "connection reset by peer",
+]
+
+_JUNK = [
+    "",
+    "Traceback (most recent call last):",
+    "    at com.example.Service.handle(Service.java:42)",
+    "[not a timestamp] US/Pacific message",
+    "[2013-13-45T99:99:99.000+00:00] UTC invalid date",
+]
+
+
+class Result(NamedTuple):
+    """The outcome of an ingest: lines read, parsed and rejected, minutes counted, the
+    duration in seconds, and the peak resident set size in bytes, if known."""
+
+    lines: int
+    parsed: int
+    rejected: int
+    minutes: int
+    duration: float
+    peak_rss: Optional[int]
+
+    @property
+    def per_second(self) -> float:
+        return self.lines / self.duration
+
+
+def generate(
+    path: str, lines: int, junk: float = 0.05, days: int = 7, seed: int = 0
+) -> None:
+    """Writes a synthetic log, each line holding a timestamp in brackets, the timezone
+    it is reported in and a message, except for a share of junk lines.
+
+    :param path: the path of the log.
+    :param lines: the number of lines.
+    :param junk: the share of junk lines.
+    :param days: the number of days the log spans, its lines being about in order.
+    :param seed: the seed of the random generator, the same log being generated for
+        the same arguments.
+
+    """
+
+    rng = random.Random(seed)
+    start = datetime(2013, 3, 5, tzinfo=timezone.utc)
+    step = days * 86400 / max(lines, 1)
+    zones = [arrow.now(name).tzinfo for name in TIMEZONES]
+
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            if rng.random() < junk:
+                f.write(rng.choice(_JUNK) + "\n")
+                continue
+
+            instant = start + timedelta(seconds=i * step + rng.uniform(-5, 5))
+            written = instant.astimezone(rng.choice(zones))
+            offset = written.strftime("%z")
+            fmt = rng.choice(FORMATS)[0].format(
+                ms=f"{rng.randrange(1000):03d}",
+                offset=f"{offset[:3]}:{offset[3:]}",
+                compact=offset,
+            )
+            f.write(
+                f"[{written.strftime(fmt)}] {rng.choice(TIMEZONES)} "
+                f"{rng.choice(_MESSAGES)}\n"
+            )
+
+
+def _peak_rss() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes, except on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def ingest(path: str) -> Result:
+    """Ingests a log, counting its lines by minute in the timezone of each line.
+
+    :param path: the path of the log.
+
+    """
+
+    formats = [fmt for _, fmt in FORMATS]
+    minutes: "Counter[str]" = Counter()
+    lines = parsed = 0
+
+    start = default_timer()
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            lines += 1
+
+            if not line.startswith("["):
+                continue
+            end = line.find("] ")
+            if end < 0:
+                continue
+            zone, _, _ = line[end + 2 :].partition(" ")
+
+            try:
+                timestamp = arrow.get(line[1:end], formats)
+            except ValueError:
+                # a ParserError, or a date out of range
+                continue
+
+            minute = timestamp.to(zone).floor("minute").format(OUTPUT_FORMAT)
+            minutes[minute] += 1
+            parsed += 1
+
+    duration = default_timer() - start
+
+    return Result(lines, parsed, lines - parsed, len(minutes), duration, _peak_rss())
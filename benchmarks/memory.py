@@ -0,0 +1,233 @@
+"""Measures the memory held by Arrow objects, allocated by hot paths and kept by the
+caches, with tracemalloc."""
+
+import gc
+import json
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import arrow
+from arrow import caches
+
+from .cases import CASES
+from .runner import environment
+
+_START = arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456)
+_DATETIME = datetime(2013, 5, 5, 12, 30, 45, 123456, tzinfo=timezone.utc)
+
+# the operations measured, each returning a new object
+OPERATIONS: Dict[str, Callable[[], Any]] = {
+    "Arrow": lambda: arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456),
+    "fromdatetime": lambda: arrow.Arrow.fromdatetime(_DATETIME),
+    "shift": lambda: _START.shift(hours=1),
+    "to": lambda: _START.to("US/Pacific"),
+    "format": lambda: _START.format("YYYY-MM-DD HH:mm:ss ZZ"),
+    "parse": lambda: arrow.get("2013-05-05 12:30:45", "YYYY-MM-DD HH:mm:ss"),
+    "parse_iso": lambda: arrow.get("2013-05-05T12:30:45.123456+00:00"),
+}
+
+# the frames tracemalloc allocates its own snapshots in
+_FILTERS = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+# the size given to the caches disabled by default while they are measured
+_ENABLED_SIZE = 256
+
+
+class Measurement(NamedTuple):
+    """The memory of an operation: the bytes and blocks it keeps allocated per call,
+    for the object it returns, and the peak bytes allocated during a call, or None
+    before Python 3.9."""
+
+    name: str
+    size: float
+    blocks: float
+    peak: Optional[int]
+
+
+class CacheSize(NamedTuple):
+    """The entries of a cache after the standard workload, and the bytes they hold."""
+
+    name: str
+    entries: int
+    size: int
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_FILTERS)
+
+
+def _retained(fill: Callable[[List[Any]], None], count: int) -> Tuple[float, float]:
+    # the list of results is allocated beforehand so that it is not measured
+    results: List[Any] = [None] * count
+    gc.collect()
+    before = _snapshot()
+    fill(results)
+    statistics = _snapshot().compare_to(before, "filename")
+
+    size = sum(statistic.size_diff for statistic in statistics)
+    blocks = sum(statistic.count_diff for statistic in statistics)
+    return size / count, blocks / count
+
+
+def _peak(operation: Callable[[], Any]) -> Optional[int]:
+    if sys.version_info < (3, 9):
+        return None
+
+    gc.collect()
+    tracemalloc.reset_peak()
+    current = tracemalloc.get_traced_memory()[0]
+    operation()
+    return tracemalloc.get_traced_memory()[1] - current
+
+
+def measure_operation(name: str, count: int = 10000) -> Measurement:
+    """Measures an operation, warming up the caches it fills beforehand.
+
+    :param name: the name of the operation, in :data:`OPERATIONS`.
+    :param count: the number of calls averaged.
+
+    """
+
+    operation = OPERATIONS[name]
+    for _ in range(10):
+        operation()
+
+    def fill(results: List[Any]) -> None:
+        for i in range(count):
+            results[i] = operation()
+
+    size, blocks = _retained(fill, count)
+    return Measurement(name, size, blocks, _peak(operation))
+
+
+def measure_range(count: int = 10000) -> Measurement:
+    """Measures the elements of ``Arrow.range``.
+
+    :param count: the number of elements averaged.
+
+    """
+
+    def fill(results: List[Any]) -> None:
+        results[:] = arrow.Arrow.range("minute", _START, limit=count)
+
+    size, blocks = _retained(fill, count)
+    return Measurement("range element", size, blocks, None)
+
+
+def workload(repeat: int = 1) -> None:
+    """Runs the standard workload, every case of the benchmark suite."""
+
+    for case in CASES.values():
+        for _ in range(repeat):
+            case()
+
+
+def measure_caches() -> List[CacheSize]:
+    """Returns the size of every cache after the standard workload, measured as the
+    bytes freed by clearing it.  Caches disabled by default, such as ``spans``, are
+    enabled while they are measured."""
+
+    sizes = []
+
+    for name, info in caches.info().items():
+        if info.maxsize == 0:
+            caches.resize(name, _ENABLED_SIZE)
+
+        try:
+            workload()
+            entries = caches.info()[name].size
+
+            gc.collect()
+            before = tracemalloc.get_traced_memory()[0]
+            caches.clear(name)
+            gc.collect()
+            sizes.append(
+                CacheSize(name, entries, before - tracemalloc.get_traced_memory()[0])
+            )
+        finally:
+            caches.resize(name, info.maxsize)
+
+    return sizes
+
+
+def measure() -> Tuple[List[Measurement], List[CacheSize]]:
+    """Measures every operation, the elements of ranges, and the caches."""
+
+    started = tracemalloc.is_tracing()
+    if not started:
+        tracemalloc.start()
+
+    try:
+        measurements = [measure_operation(name) for name in OPERATIONS]
+        measurements.append(measure_range())
+        return measurements, measure_caches()
+    finally:
+        if not started:
+            tracemalloc.stop()
+
+
+def save(
+    path: str, measurements: List[Measurement], cache_sizes: List[CacheSize]
+) -> None:
+    """Saves measurements as JSON, along with their environment.
+
+    :param path: the path of the file.
+    :param measurements: the measurements of the operations.
+    :param cache_sizes: the sizes of the caches.
+
+    """
+
+    document = {
+        "environment": environment(),
+        "operations": {m.name: m._asdict() for m in measurements},
+        "caches": {c.name: c._asdict() for c in cache_sizes},
+    }
+
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+
+
+def regressions(
+    path: str,
+    measurements: List[Measurement],
+    cache_sizes: List[CacheSize],
+    threshold: float,
+) -> List[str]:
+    """Returns the descriptions of the sizes larger than in a baseline by more than a
+    threshold.
+
+    :param path: the path of the baseline, saved by :func:`save`.
+    :param measurements: the measurements of the operations.
+    :param cache_sizes: the sizes of the caches.
+    :param threshold: the relative growth allowed, such as 0.1 for 10%.
+
+    """
+
+    with open(path) as f:
+        document = json.load(f)
+
+    sizes = [
+        (f"{m.name} size", m.size, document["operations"], m.name, "size")
+        for m in measurements
+    ]
+    sizes += [
+        (f"{m.name} blocks", m.blocks, document["operations"], m.name, "blocks")
+        for m in measurements
+    ]
+    sizes += [
+        (f"{c.name} cache", c.size, document["caches"], c.name, "size")
+        for c in cache_sizes
+    ]
+
+    larger = []
+    for description, value, baseline, name, key in sizes:
+        if name not in baseline:
+            continue
+        expected = baseline[name][key]
+        if value > expected * (1 + threshold):
+            larger.append(f"{description} {value:.0f} instead of {expected:.0f}")
+
+    return larger
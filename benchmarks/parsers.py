@@ -0,0 +1,184 @@
+"""Compares arrow.get to the standard library, dateutil and dateparser, parsing the same
+inputs with each of them."""
+
+from datetime import datetime, timezone
+from functools import partial
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import dateutil.parser
+
+import arrow
+
+from .runner import time_case
+
+Parser = Callable[[str], datetime]
+
+# the name of the parser others are compared to
+ARROW = "arrow.get"
+
+
+class Workload(NamedTuple):
+    """Inputs parsed by every parser of a workload, including arrow's."""
+
+    name: str
+    inputs: Tuple[str, ...]
+    parsers: Dict[str, Parser]
+
+
+class Disagreement(NamedTuple):
+    """An input parsed into a different value than arrow's."""
+
+    workload: str
+    parser: str
+    input: str
+    expected: Optional[datetime]
+    value: Optional[datetime]
+
+
+class Throughput(NamedTuple):
+    """The inputs parsed per second by a parser, and the ratio to arrow's."""
+
+    workload: str
+    parser: str
+    per_second: float
+    ratio: float
+
+
+def _arrow(string: str) -> datetime:
+    return arrow.get(string).datetime
+
+
+def _arrow_format(fmt: str, string: str, locale: str = "en-us") -> datetime:
+    return arrow.get(string, fmt, locale=locale).datetime
+
+
+def _strptime(fmt: str, string: str) -> datetime:
+    return datetime.strptime(string, fmt)
+
+
+def workloads() -> List[Workload]:
+    """Returns the workloads, leaving out dateparser when it is not installed."""
+
+    iso = Workload(
+        "iso",
+        (
+            "2013-05-05",
+            "2013-05-05T12:30:45",
+            "2013-05-05T12:30:45.123456",
+            "2013-05-05T12:30:45+05:30",
+            "2013-05-05 12:30:45.123-07:00",
+        ),
+        {
+            ARROW: _arrow,
+            "datetime.fromisoformat": datetime.fromisoformat,
+            "dateutil.isoparse": dateutil.parser.isoparse,
+            "dateutil.parse": dateutil.parser.parse,
+        },
+    )
+
+    custom = Workload(
+        "format",
+        ("05/05/2013 12:30:45", "12/31/1999 23:59:59", "01/02/2020 00:00:01"),
+        {
+            ARROW: partial(_arrow_format, "MM/DD/YYYY HH:mm:ss"),
+            "datetime.strptime": partial(_strptime, "%m/%d/%Y %H:%M:%S"),
+            "dateutil.parse": dateutil.parser.parse,
+        },
+    )
+
+    month_names = Workload(
+        "month_names",
+        ("May 5, 2013 12:30", "December 31, 1999 23:59", "January 2, 2020 00:00"),
+        {
+            ARROW: partial(_arrow_format, "MMMM D, YYYY HH:mm"),
+            "datetime.strptime": partial(_strptime, "%B %d, %Y %H:%M"),
+            "dateutil.parse": dateutil.parser.parse,
+        },
+    )
+
+    locale = Workload(
+        "locale",
+        ("5 mai 2013 12:30", "31 décembre 1999 23:59", "2 janvier 2020 00:00"),
+        {
+            ARROW: partial(_arrow_format, "D MMMM YYYY HH:mm", locale="fr"),
+        },
+    )
+
+    try:
+        import dateparser  # type: ignore[import-untyped]
+    except ImportError:
+        return [iso, custom, month_names, locale]
+
+    iso.parsers["dateparser"] = dateparser.parse
+    custom.parsers["dateparser"] = partial(
+        dateparser.parse, date_formats=["%m/%d/%Y %H:%M:%S"]
+    )
+    month_names.parsers["dateparser"] = partial(dateparser.parse, languages=["en"])
+    locale.parsers["dateparser"] = partial(dateparser.parse, languages=["fr"])
+
+    return [iso, custom, month_names, locale]
+
+
+def _normalize(value: datetime) -> datetime:
+    # naive values are in UTC, as arrow.get assumes
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def check(workload: Workload) -> List[Disagreement]:
+    """Returns the inputs of a workload that a parser fails on or parses into another
+    value than arrow's.
+
+    :param workload: the workload.
+
+    """
+
+    expected_parse = workload.parsers[ARROW]
+    others = [item for item in workload.parsers.items() if item[0] != ARROW]
+    disagreements = []
+
+    for string in workload.inputs:
+        expected = _normalize(expected_parse(string))
+
+        for name, parse in others:
+            try:
+                value: Optional[datetime] = parse(string)
+            except ValueError:
+                value = None
+
+            if value is None or _normalize(value) != expected:
+                disagreements.append(
+                    Disagreement(workload.name, name, string, expected, value)
+                )
+
+    return disagreements
+
+
+def measure(
+    workload: Workload, repeat: int = 5, min_time: float = 0.1
+) -> List[Throughput]:
+    """Times every parser of a workload on all its inputs.
+
+    :param workload: the workload.
+    :param repeat: the number of loops of each parser.
+    :param min_time: the minimum duration of a loop, in seconds.
+
+    """
+
+    per_second = {}
+
+    for name, parse in workload.parsers.items():
+        result = time_case(
+            partial(_parse_all, parse, workload.inputs), repeat, min_time
+        )
+        per_second[name] = len(workload.inputs) / result.min
+
+    reference = per_second[ARROW]
+    return [
+        Throughput(workload.name, name, value, value / reference)
+        for name, value in per_second.items()
+    ]
+
+
+def _parse_all(parse: Parser, inputs: Tuple[str, ...]) -> None:
+    for string in inputs:
+        parse(string)
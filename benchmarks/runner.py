@@ -0,0 +1,207 @@
+"""Times benchmark cases, and saves and compares their results."""
+
+import json
+import platform
+import re
+import statistics
+import sys
+from datetime import datetime, timezone
+from timeit import default_timer
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import arrow
+
+Case = Callable[[], Any]
+
+
+class Result(NamedTuple):
+    """The timings of a case, in seconds per call."""
+
+    min: float
+    median: float
+    loops: int
+    repeat: int
+
+
+class Change(NamedTuple):
+    """The change of a case between a baseline and new results."""
+
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if self.baseline is None or self.current is None:
+            return None
+        return self.current / self.baseline
+
+
+def time_case(case: Case, repeat: int = 5, min_time: float = 0.1) -> Result:
+    """Times a case, calling it in loops long enough to take ``min_time`` seconds,
+    ``repeat`` times.
+
+    :param case: the case, a function without arguments.
+    :param repeat: the number of loops.
+    :param min_time: the minimum duration of a loop, in seconds.
+
+    """
+
+    # the loop size is doubled until a loop is long enough
+    loops = 1
+    while True:
+        duration = _loop(case, loops)
+        if duration >= min_time:
+            break
+        loops *= 2
+
+    timings = [duration / loops] + [
+        _loop(case, loops) / loops for _ in range(repeat - 1)
+    ]
+    return Result(min(timings), statistics.median(timings), loops, repeat)
+
+
+def _loop(case: Case, loops: int) -> float:
+    iterations = range(loops)
+    start = default_timer()
+    for _ in iterations:
+        case()
+    return default_timer() - start
+
+
+def run(
+    cases: Dict[str, Case],
+    pattern: Optional[str] = None,
+    repeat: int = 5,
+    min_time: float = 0.1,
+    report: Optional[Callable[[str, Result], None]] = None,
+) -> Dict[str, Result]:
+    """Times the cases whose names match a regular expression.
+
+    :param cases: the cases by name.
+    :param pattern: (optional) the regular expression, searched in the names.
+    :param repeat: the number of loops of each case.
+    :param min_time: the minimum duration of a loop, in seconds.
+    :param report: (optional) a function called with each case's name and result.
+
+    """
+
+    results = {}
+
+    for name, case in cases.items():
+        if pattern is not None and not re.search(pattern, name):
+            continue
+
+        result = time_case(case, repeat, min_time)
+        results[name] = result
+        if report is not None:
+            report(name, result)
+
+    return results
+
+
+def environment() -> Dict[str, str]:
+    """Returns the description of the interpreter and machine results are taken on."""
+
+    return {
+        "arrow": arrow.__version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def save(path: str, results: Dict[str, Result]) -> None:
+    """Saves results as JSON, along with their environment.
+
+    :param path: the path of the file.
+    :param results: the results by case name.
+
+    """
+
+    document = {
+        "environment": environment(),
+        "results": {name: result._asdict() for name, result in results.items()},
+    }
+
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+
+
+def load(path: str) -> Tuple[Dict[str, str], Dict[str, Result]]:
+    """Loads the environment and results saved in a file.
+
+    :param path: the path of the file.
+
+    """
+
+    with open(path) as f:
+        document = json.load(f)
+
+    results = {name: Result(**result) for name, result in document["results"].items()}
+    return document["environment"], results
+
+
+def compare(
+    baseline: Dict[str, Result], results: Dict[str, Result], key: str = "min"
+) -> List[Change]:
+    """Returns the changes of every case in the baseline or new results.
+
+    :param baseline: the baseline results by case name.
+    :param results: the new results by case name.
+    :param key: the timing compared, ``min`` or ``median``.
+
+    """
+
+    names = list(baseline) + [name for name in results if name not in baseline]
+
+    def timing(result: Optional[Result]) -> Optional[float]:
+        return None if result is None else getattr(result, key)
+
+    return [
+        Change(name, timing(baseline.get(name)), timing(results.get(name)))
+        for name in names
+    ]
+
+
+def regressions(changes: Iterable[Change], threshold: float) -> List[Change]:
+    """Returns the changes slower than their baseline by more than a threshold.
+
+    :param changes: the changes.
+    :param threshold: the relative slowdown allowed, such as 0.1 for 10%.
+
+    """
+
+    return [
+        change
+        for change in changes
+        if change.ratio is not None and change.ratio > 1 + threshold
+    ]
+
+
+def format_time(seconds: Optional[float]) -> str:
+    """Formats a duration in the most readable unit."""
+
+    if seconds is None:
+        return "-"
+
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def format_change(change: Change) -> str:
+    ratio = change.ratio
+    if ratio is None:
+        status = "new" if change.baseline is None else "missing"
+    else:
+        status = f"{(ratio - 1) * 100:+.1f}%"
+
+    return (
+        f"{change.name:<40} {format_time(change.baseline):>10} "
+        f"{format_time(change.current):>10} {status:>9}"
+    )
@@ -0,0 +1,93 @@
+"""Measures how parsing, formatting and timezone conversions scale with threads sharing
+arrow's caches."""
+
+import os
+import sys
+import threading
+from timeit import default_timer
+from typing import Any, Callable, Dict, List, NamedTuple
+
+import arrow
+
+_ARW = arrow.Arrow(2013, 5, 5, 12, 30, 45, 123456)
+
+# the workloads, each a function called by every thread
+WORKLOADS: Dict[str, Callable[[], Any]] = {
+    "parse": lambda: arrow.get("2013-05-05 12:30:45", "YYYY-MM-DD HH:mm:ss"),
+    "parse_iso": lambda: arrow.get("2013-05-05T12:30:45.123456+00:00"),
+    "format": lambda: _ARW.format("YYYY-MM-DD HH:mm:ss ZZ"),
+    "to": lambda: _ARW.to("US/Pacific"),
+}
+
+
+class Scaling(NamedTuple):
+    """The throughput of a workload on a number of threads, in calls per second, and
+    its ratio to the throughput of one thread times the number of threads."""
+
+    workload: str
+    threads: int
+    per_second: float
+    efficiency: float
+
+
+def gil_enabled() -> bool:
+    """Returns whether the interpreter runs with the GIL."""
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def max_threads() -> int:
+    """Returns the default maximum number of threads, the CPUs available up to 8."""
+
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return min(cpus, 8)
+
+
+def _run(workload: Callable[[], Any], threads: int, calls: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def run() -> None:
+        barrier.wait()
+        for _ in range(calls):
+            workload()
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start = default_timer()
+    for worker in workers:
+        worker.join()
+    return default_timer() - start
+
+
+def measure(
+    name: str, threads: int, calls: int = 20000, repeat: int = 3
+) -> List[Scaling]:
+    """Measures a workload on 1 to ``threads`` threads, each making ``calls`` calls.
+
+    :param name: the name of the workload, in :data:`WORKLOADS`.
+    :param threads: the maximum number of threads.
+    :param calls: the number of calls made by each thread.
+    :param repeat: the number of runs, of which the fastest is kept.
+
+    """
+
+    workload = WORKLOADS[name]
+    # fills the caches beforehand
+    for _ in range(10):
+        workload()
+
+    scaling: List[Scaling] = []
+    for count in range(1, threads + 1):
+        duration = min(_run(workload, count, calls) for _ in range(repeat))
+        per_second = count * calls / duration
+        single = per_second if count == 1 else scaling[0].per_second
+        scaling.append(Scaling(name, count, per_second, per_second / (count * single)))
+
+    return scaling
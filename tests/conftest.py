@@ -53,6 +53,7 @@ def arrow_factory(request):
 
 @pytest.fixture(scope="class")
 def lang_locales(request):
+    locales._import_locales()
     request.cls.locales = locales._locale_map
 
 
@@ -17,6 +17,33 @@ class TestModule:
 
         assert arrow.api.now("tz") == "now"
 
+    def test_resample(self, mocker):
+        mocker.patch("arrow.api._factory.resample", return_value="resample")
+
+        assert arrow.api.resample([], "hour") == "resample"
+
+    def test_find_gaps(self, mocker):
+        mocker.patch("arrow.api._factory.find_gaps", return_value="find_gaps")
+
+        assert arrow.api.find_gaps([], "hour") == "find_gaps"
+
+    def test_convert_many(self, mocker):
+        mocker.patch("arrow.api._factory.convert_many", return_value="convert_many")
+
+        assert arrow.api.convert_many([], "US/Pacific") == "convert_many"
+
+    def test_humanize_many(self, mocker):
+        mocker.patch("arrow.api._factory.humanize_many", return_value="humanize_many")
+
+        assert arrow.api.humanize_many([]) == "humanize_many"
+
+    def test_warmup(self, mocker):
+        mocked = mocker.patch("arrow.api._factory.warmup")
+
+        arrow.api.warmup(["YYYY"], ["fr"], ["US/Pacific"])
+
+        mocked.assert_called_once_with(["YYYY"], ["fr"], ["US/Pacific"])
+
     def test_factory(self):
         class MockCustomArrowClass(arrow.Arrow):
             pass
@@ -7,7 +7,7 @@ import pickle
 import sys
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import List
+from typing import Any, List
 
 import dateutil
 import pytest
@@ -16,7 +16,9 @@ import simplejson as json
 from dateutil import tz
 from dateutil.relativedelta import FR, MO, SA, SU, TH, TU, WE
 
-from arrow import arrow, locales
+from arrow import arrow, formatter, locales, parser
+from arrow.caches import Cache
+from arrow.parser import ParserError
 
 from .utils import assert_datetime_equality
 
@@ -628,6 +630,30 @@ class TestArrowConversion:
 
         assert before.utcoffset() != after.utcoffset()
 
+    def test_to_many(self):
+        arw = arrow.Arrow(2017, 11, 5, 7, 1)
+        tzs = ["US/Pacific", ZoneInfo("America/Chicago"), tz.tzoffset(None, 3600)]
+
+        result = arw.to_many(tzs)
+
+        assert result == [arw.to(tzinfo) for tzinfo in tzs]
+        assert [r.tzinfo for r in result] == [arw.to(t).tzinfo for t in tzs]
+        assert result[1].fold == 1
+        assert arw.to_many(tzs, output="datetime") == [r.datetime for r in result]
+        assert arw.to_many(tzs, output="epoch") == [
+            (1509865260.0, -25200),
+            (1509865260.0, -21600),
+            (1509865260.0, 3600),
+        ]
+        assert arw.to_many([]) == []
+
+    def test_to_many_bad_arguments(self):
+        with pytest.raises(ValueError):
+            arrow.Arrow.utcnow().to_many(["US/Pacific"], output="str")
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.utcnow().to_many(["abc"])
+
 
 class TestArrowPickling:
     def test_pickle_and_unpickle(self):
@@ -878,6 +904,40 @@ class TestArrowShift:
         shifted = dt.shift(hours=1, check_imaginary=False)
         assert shifted.datetime.hour == 3
 
+    def test_shift_fixed_length_units(self, mocker):
+        spy = mocker.spy(dateutil.relativedelta.relativedelta, "__init__")
+        exists = mocker.spy(tz, "datetime_exists")
+
+        result = arrow.Arrow(2013, 5, 5, 12, 30, 45, 5).shift(
+            weeks=1, days=-2, hours=3, minutes=-4, seconds=5, microseconds=6
+        )
+
+        assert result == arrow.Arrow(2013, 5, 10, 15, 26, 50, 11)
+        assert arrow.Arrow(2013, 5, 5, tzinfo="+05:30").shift(
+            hours=-1
+        ).utcoffset() == timedelta(hours=5, minutes=30)
+        spy.assert_not_called()
+        exists.assert_not_called()
+
+    def test_shift_fixed_length_units_dst(self, mocker):
+        spy = mocker.spy(dateutil.relativedelta.relativedelta, "__init__")
+
+        new_york = arrow.Arrow(2011, 3, 13, 1, 30, tzinfo="America/New_York")
+        assert new_york.shift(hours=1) == arrow.Arrow(
+            2011, 3, 13, 3, 30, tzinfo="America/New_York"
+        )
+        assert new_york.shift(days=1).utcoffset() == timedelta(hours=-4)
+        spy.assert_not_called()
+
+        # calendar units and fractional values still go through relativedelta
+        assert new_york.shift(months=1, hours=1) == arrow.Arrow(
+            2011, 4, 13, 2, 30, tzinfo="America/New_York"
+        )
+        assert new_york.shift(hours=0.5) == arrow.Arrow(
+            2011, 3, 13, 3, tzinfo="America/New_York"
+        )
+        assert spy.call_count == 2
+
     @pytest.mark.skipif(
         dateutil.__version__ < "2.7.1", reason="old tz database (2018d needed)"
     )
@@ -1142,6 +1202,383 @@ class TestArrowRange:
         ]
 
 
+class TestArrowCount:
+    def test_count(self):
+        start = datetime(2013, 5, 5, 12, 30)
+
+        for frame, end in [
+            ("year", datetime(2020, 5, 5, 12, 30)),
+            ("quarter", datetime(2016, 2, 1)),
+            ("month", datetime(2014, 5, 5, 12, 29)),
+            ("week", datetime(2013, 8, 1)),
+            ("day", datetime(2013, 5, 5, 12, 30)),
+            ("hour", datetime(2013, 5, 7, 1)),
+            ("minute", datetime(2013, 5, 5, 17, 15)),
+            ("second", datetime(2013, 5, 5, 12, 33, 20)),
+            ("day", datetime(2013, 5, 4)),
+        ]:
+            assert arrow.Arrow.count(frame, start, end) == len(
+                list(arrow.Arrow.range(frame, start, end))
+            )
+
+    def test_end_included(self):
+        assert (
+            arrow.Arrow.count(
+                "hour", datetime(2013, 5, 5, 12, 30), datetime(2013, 5, 5, 13, 30)
+            )
+            == 2
+        )
+        assert (
+            arrow.Arrow.count(
+                "hour", datetime(2013, 5, 5, 12, 30), datetime(2013, 5, 5, 13, 29)
+            )
+            == 1
+        )
+        assert (
+            arrow.Arrow.count(
+                "hour", datetime(2013, 5, 5, 12, 30), datetime(2013, 5, 5, 12)
+            )
+            == 0
+        )
+
+    def test_month_end(self):
+        start = datetime(2015, 1, 31)
+
+        assert arrow.Arrow.count("month", start, datetime(2015, 2, 28)) == 2
+        assert arrow.Arrow.count("month", start, datetime(2015, 3, 30)) == 2
+        assert arrow.Arrow.count("month", start, datetime(2015, 3, 31)) == 3
+        assert (
+            arrow.Arrow.count("quarter", datetime(2014, 11, 30), datetime(2015, 5, 29))
+            == 2
+        )
+        assert (
+            arrow.Arrow.count("year", datetime(2012, 2, 29), datetime(2016, 2, 28)) == 4
+        )
+        # plural frames clip the day of the month once and for all
+        assert arrow.Arrow.count("months", start, datetime(2015, 3, 30)) == 3
+
+    def test_tz(self):
+        start = datetime(2013, 1, 1)
+        end = datetime(2013, 1, 3, 12)
+
+        assert arrow.Arrow.count("day", start, end, tz="US/Pacific") == 3
+        assert arrow.Arrow.count("hour", start, end, tz="+05:30") == 61
+
+    def test_dst(self, mocker):
+        start = arrow.Arrow(2018, 3, 10, 2, 30, tzinfo="US/Pacific")
+        end = arrow.Arrow(2018, 3, 13, 2, 45, tzinfo="US/Pacific")
+        spy = mocker.spy(arrow.Arrow, "_iter_range")
+
+        # the point on the day of the gap moves to 03:30, and the next ones follow it
+        assert arrow.Arrow.count("day", start, end) == 3
+        assert spy.call_count == 0
+        assert len(list(arrow.Arrow.range("day", start, end))) == 3
+
+        # the minutes of the gap are skipped, the repeated ones are not counted twice
+        assert (
+            arrow.Arrow.count(
+                "minute",
+                datetime(2018, 3, 11, 1, 30, 30),
+                datetime(2018, 3, 11, 4, 10),
+                tz="US/Pacific",
+            )
+            == 100
+        )
+        assert (
+            arrow.Arrow.count(
+                "minute",
+                datetime(2018, 11, 4, 0, 30),
+                datetime(2018, 11, 4, 2, 30),
+                tz="US/Pacific",
+            )
+            == 121
+        )
+
+    def test_dst_transitions(self, mocker):
+        spy = mocker.spy(arrow.Arrow, "_iter_range")
+
+        for name, spring_forward, fall_back in [
+            ("US/Pacific", datetime(2018, 3, 11, 2), datetime(2018, 11, 4, 1)),
+            ("Australia/Lord_Howe", datetime(2019, 10, 6, 2), datetime(2019, 4, 7, 1)),
+            ("America/Havana", datetime(2018, 3, 11), datetime(2018, 11, 4)),
+        ]:
+            for tzinfo in [ZoneInfo(name), tz.gettz(name)]:
+                for frame, start, end in [
+                    (
+                        "second",
+                        spring_forward - timedelta(seconds=30),
+                        spring_forward + timedelta(minutes=61),
+                    ),
+                    (
+                        "minute",
+                        spring_forward - timedelta(minutes=7, seconds=30),
+                        spring_forward + timedelta(hours=2),
+                    ),
+                    ("minute", fall_back, fall_back + timedelta(hours=2)),
+                    (
+                        "hour",
+                        spring_forward - timedelta(hours=30, minutes=15),
+                        spring_forward + timedelta(days=1),
+                    ),
+                    (
+                        "hour",
+                        fall_back - timedelta(minutes=15),
+                        fall_back + timedelta(hours=3),
+                    ),
+                    ("day", spring_forward + timedelta(minutes=20), fall_back),
+                    ("week", fall_back - timedelta(days=20), spring_forward),
+                ]:
+                    start = start.replace(tzinfo=tzinfo)
+                    end = end.replace(tzinfo=tzinfo)
+                    expected = len(list(arrow.Arrow.range(frame, start, end)))
+                    spy.reset_mock()
+
+                    assert arrow.Arrow.count(frame, start, end) == expected
+                    assert spy.call_count == 0
+
+    def test_dst_months(self, mocker):
+        spy = mocker.spy(arrow.Arrow, "_iter_range")
+
+        for tzinfo in [ZoneInfo("US/Pacific"), tz.gettz("US/Pacific")]:
+            start = datetime(2018, 1, 11, 2, 30, tzinfo=tzinfo)
+            assert arrow.Arrow.count("month", start, datetime(2019, 1, 1)) == 12
+
+            # the point on the day of the gap moves to 03:30, and the next ones follow it
+            start = datetime(2018, 2, 11, 2, 30, tzinfo=tzinfo)
+            end = datetime(2019, 1, 11, 3, tzinfo=tzinfo)
+            assert arrow.Arrow.count("month", start, end) == 11
+            assert arrow.Arrow.count("months", start, end) == 11
+            assert arrow.Arrow.count("year", start, end) == 1
+            assert arrow.Arrow.fromdatetime(start).diff(end, "month") == 10
+
+        for tzinfo in [ZoneInfo("Europe/London"), tz.gettz("Europe/London")]:
+            # 2010-02-28 is shifted to 2010-03-28 01:30, in the gap, before the day is
+            # restored to the 31st
+            start = datetime(2010, 1, 31, 1, 30, tzinfo=tzinfo)
+            end = datetime(2011, 1, 31, 2, tzinfo=tzinfo)
+            assert arrow.Arrow.count("month", start, end) == 12
+            # the quarterly points skip 2010-03 and keep 01:30
+            assert arrow.Arrow.count("quarter", start, end) == 5
+            assert arrow.Arrow.fromdatetime(start).diff(end, "quarter") == 4
+
+            # no point falls into the gap, or the range ends before it
+            start = datetime(2010, 1, 1, 1, 30, tzinfo=tzinfo)
+            assert arrow.Arrow.count("month", start, end) == 13
+            assert arrow.Arrow.count("month", start, start.replace(month=3)) == 3
+            assert arrow.Arrow.count("month", end, start) == 0
+
+        assert spy.call_count == 0
+
+        # plural frames clipping the day of the month step through the range
+        start = datetime(2010, 1, 31, 1, 30, tzinfo=ZoneInfo("Europe/London"))
+        end = datetime(2011, 1, 31, 2, tzinfo=ZoneInfo("Europe/London"))
+
+        assert arrow.Arrow.count("months", start, end) == len(
+            list(arrow.Arrow.range("months", start, end))
+        )
+        assert spy.call_count == 2
+
+        # so do points moved past midnight, and timezones without a transition table
+        for tzinfo in [
+            tz.tzstr("EST5EDT,M3.2.0/23,M11.1.0"),
+            tz.tzstr("EST5EDT,M3.2.0/23:30,M11.1.0"),
+            tz.tzlocal(),
+        ]:
+            start = datetime(2018, 1, 11, 23, 45, tzinfo=tzinfo)
+            end = datetime(2019, 1, 11, 0, 15, tzinfo=tzinfo)
+            spy.reset_mock()
+
+            assert arrow.Arrow.count("month", start, end) == len(
+                list(arrow.Arrow.range("month", start, end))
+            )
+            assert spy.call_count == 2
+
+        spy.reset_mock()
+        assert arrow.Arrow.count("hour", start, start.replace(month=2)) == 745
+        assert spy.call_count == 1
+
+    def test_closed_form(self, mocker):
+        spy = mocker.spy(arrow.Arrow, "_iter_range")
+
+        assert (
+            arrow.Arrow.count("minute", datetime(1990, 1, 1), datetime(2020, 1, 1))
+            == 15778081
+        )
+        assert spy.call_count == 0
+
+    def test_unsupported(self):
+        with pytest.raises(ValueError):
+            arrow.Arrow.count("abc", datetime(2013, 1, 1), datetime(2013, 1, 3))
+
+
+class TestArrowRangeChunks:
+    def test_chunks(self):
+        start = datetime(2013, 5, 5, 12, 30)
+        end = datetime(2013, 5, 5, 22, 15)
+
+        result = arrow.Arrow.range_chunks("hour", start, end, 3)
+
+        assert result == [
+            (arrow.Arrow(2013, 5, 5, 12, 30), arrow.Arrow(2013, 5, 5, 15, 30)),
+            (arrow.Arrow(2013, 5, 5, 16, 30), arrow.Arrow(2013, 5, 5, 18, 30)),
+            (arrow.Arrow(2013, 5, 5, 19, 30), arrow.Arrow(2013, 5, 5, 21, 30)),
+        ]
+        assert [
+            point
+            for head, tail in result
+            for point in arrow.Arrow.range("hour", head, tail)
+        ] == list(arrow.Arrow.range("hour", start, end))
+
+    def test_fewer_points(self):
+        start = datetime(2013, 5, 5)
+
+        assert arrow.Arrow.range_chunks("day", start, datetime(2013, 5, 6), 4) == [
+            (arrow.Arrow(2013, 5, 5), arrow.Arrow(2013, 5, 5)),
+            (arrow.Arrow(2013, 5, 6), arrow.Arrow(2013, 5, 6)),
+        ]
+        assert arrow.Arrow.range_chunks("day", start, datetime(2013, 5, 4), 4) == []
+
+    def test_month_end(self):
+        start = datetime(2015, 1, 31)
+        end = datetime(2015, 12, 31)
+
+        result = arrow.Arrow.range_chunks("month", start, end, 4)
+
+        # chunks do not start on a clipped day, which would change the later points
+        assert [head.date() for head, _ in result] == [
+            date(2015, 1, 31),
+            date(2015, 5, 31),
+            date(2015, 7, 31),
+            date(2015, 10, 31),
+        ]
+        assert [
+            point
+            for head, tail in result
+            for point in arrow.Arrow.range("month", head, tail)
+        ] == list(arrow.Arrow.range("month", start, end))
+
+        result = arrow.Arrow.range_chunks("year", datetime(2012, 2, 29), end, 2)
+        assert result == [(arrow.Arrow(2012, 2, 29), arrow.Arrow(2015, 2, 28))]
+
+    def test_month_end_count(self):
+        # 11 points, 7 of them on the 31st
+        for tzinfo in [ZoneInfo("Europe/London"), timezone.utc]:
+            start = datetime(2011, 10, 31, tzinfo=tzinfo)
+            end = datetime(2012, 9, 23, tzinfo=tzinfo)
+            points = list(arrow.Arrow.range("month", start, end))
+
+            for n in range(1, 10):
+                result = arrow.Arrow.range_chunks("month", start, end, n)
+
+                assert len(result) == min(n, 7)
+                assert [
+                    point
+                    for head, tail in result
+                    for point in arrow.Arrow.range("month", head, tail)
+                ] == points
+
+            assert [head.date() for head, _ in result] == [
+                date(2011, 10, 31),
+                date(2011, 12, 31),
+                date(2012, 1, 31),
+                date(2012, 3, 31),
+                date(2012, 5, 31),
+                date(2012, 7, 31),
+                date(2012, 8, 31),
+            ]
+
+        # the chunks start on the nearest leap years, before or after an even split
+        start = datetime(2012, 2, 29)
+        assert [
+            head.year
+            for head, _ in arrow.Arrow.range_chunks(
+                "year", start, datetime(2024, 3, 1), 3
+            )
+        ] == [2012, 2016, 2020]
+        assert [
+            head.date()
+            for head, _ in arrow.Arrow.range_chunks(
+                "month", datetime(2015, 1, 31), datetime(2015, 11, 30), 6
+            )
+        ] == [
+            date(2015, 1, 31),
+            date(2015, 3, 31),
+            date(2015, 5, 31),
+            date(2015, 7, 31),
+            date(2015, 8, 31),
+            date(2015, 10, 31),
+        ]
+
+    def test_dst(self):
+        start = arrow.Arrow(2018, 3, 10, 2, 30, tzinfo="US/Pacific")
+        end = arrow.Arrow(2018, 3, 20, tzinfo="US/Pacific")
+
+        result = arrow.Arrow.range_chunks("day", start, end, 3)
+
+        assert [len(list(arrow.Arrow.range("day", *chunk))) for chunk in result] == [
+            4,
+            3,
+            3,
+        ]
+        assert [
+            point
+            for head, tail in result
+            for point in arrow.Arrow.range("day", head, tail)
+        ] == list(arrow.Arrow.range("day", start, end))
+
+    def test_closed_form(self, mocker):
+        spy = mocker.spy(arrow.Arrow, "_iter_range")
+
+        result = arrow.Arrow.range_chunks(
+            "minute", datetime(1990, 1, 1), datetime(2020, 1, 1), 4
+        )
+
+        assert result[1][0] == arrow.Arrow(1997, 7, 2, 6, 1)
+        assert spy.call_count == 0
+
+    def test_dst_closed_form(self, mocker):
+        spy = mocker.spy(arrow.Arrow, "_iter_range")
+        start = datetime(2021, 1, 1)
+        end = datetime(2022, 1, 1)
+
+        for tzinfo in ["US/Pacific", tz.gettz("US/Pacific")]:
+            result = arrow.Arrow.range_chunks("minute", start, end, 8, tz=tzinfo)
+
+            # the gap in March skips an hour of points
+            counts = [arrow.Arrow.count("minute", *chunk) for chunk in result]
+            assert counts == [65693] * 5 + [65692] * 3
+            assert result[1] == (
+                arrow.Arrow(2021, 2, 15, 14, 53, tzinfo="US/Pacific"),
+                arrow.Arrow(2021, 4, 2, 6, 45, tzinfo="US/Pacific"),
+            )
+            assert result[-1][1] == arrow.Arrow(2022, 1, 1, tzinfo="US/Pacific")
+
+            spans = arrow.Arrow.span_range_chunks("hour", start, end, 4, tz=tzinfo)
+            assert spans[0][1] == arrow.Arrow(
+                2021, 4, 2, 6, 59, 59, 999999, tzinfo="US/Pacific"
+            )
+
+        assert spy.call_count == 0
+
+        # monthly ranges step through the range
+        result = arrow.Arrow.range_chunks(
+            "month", datetime(2021, 1, 31), end, 4, tz="US/Pacific"
+        )
+        assert len(result) == 4
+        assert spy.call_count == 2
+
+    def test_bad_arguments(self):
+        with pytest.raises(ValueError):
+            arrow.Arrow.range_chunks(
+                "day", datetime(2013, 1, 1), datetime(2013, 1, 3), 0
+            )
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.range_chunks(
+                "abc", datetime(2013, 1, 1), datetime(2013, 1, 3), 2
+            )
+
+
 class TestArrowSpanRange:
     def test_year(self):
         result = list(
@@ -1555,6 +1992,116 @@ class TestArrowSpanRange:
 
         assert result == expected
 
+    def test_exact_month_end_before_day_of_start(self):
+        result = list(
+            arrow.Arrow.span_range(
+                "month", datetime(2013, 1, 15), datetime(2013, 3, 10), exact=True
+            )
+        )
+
+        assert result == [
+            (
+                arrow.Arrow(2013, 1, 15),
+                arrow.Arrow(2013, 2, 14, 23, 59, 59, 999999),
+            ),
+            (
+                arrow.Arrow(2013, 2, 15),
+                arrow.Arrow(2013, 3, 9, 23, 59, 59, 999999),
+            ),
+        ]
+
+    def test_exact_imaginary_end(self):
+        tz = "America/New_York"
+        result = list(
+            arrow.Arrow.span_range(
+                "hour",
+                datetime(2018, 3, 11, 0, 30),
+                datetime(2018, 3, 11, 3, 30),
+                tz=tz,
+                exact=True,
+            )
+        )
+
+        assert result == [
+            (
+                arrow.Arrow(2018, 3, 11, 0, 30, tzinfo=tz),
+                arrow.Arrow(2018, 3, 11, 1, 29, 59, 999999, tzinfo=tz),
+            ),
+            (
+                arrow.Arrow(2018, 3, 11, 1, 30, tzinfo=tz),
+                arrow.Arrow(2018, 3, 11, 3, 29, 59, 999999, tzinfo=tz),
+            ),
+        ]
+
+
+class TestArrowSpanRangeChunks:
+    def test_chunks(self):
+        start = datetime(2013, 5, 5, 12, 30)
+        end = datetime(2013, 5, 5, 17, 15)
+
+        result = arrow.Arrow.span_range_chunks("hour", start, end, 4)
+
+        assert result == [
+            (arrow.Arrow(2013, 5, 5, 12), arrow.Arrow(2013, 5, 5, 13, 59, 59, 999999)),
+            (arrow.Arrow(2013, 5, 5, 14), arrow.Arrow(2013, 5, 5, 15, 59, 59, 999999)),
+            (arrow.Arrow(2013, 5, 5, 16), arrow.Arrow(2013, 5, 5, 16, 59, 59, 999999)),
+            (arrow.Arrow(2013, 5, 5, 17), arrow.Arrow(2013, 5, 5, 17, 59, 59, 999999)),
+        ]
+        assert [
+            span
+            for floor, ceil in result
+            for span in arrow.Arrow.span_range("hour", floor, ceil)
+        ] == list(arrow.Arrow.span_range("hour", start, end))
+
+    def test_tz(self):
+        start = datetime(2013, 1, 1, 12)
+        end = datetime(2013, 3, 15)
+
+        result = arrow.Arrow.span_range_chunks("month", start, end, 2, tz="US/Pacific")
+
+        assert result == [
+            (
+                arrow.Arrow(2013, 1, 1, tzinfo="US/Pacific"),
+                arrow.Arrow(2013, 2, 28, 23, 59, 59, 999999, tzinfo="US/Pacific"),
+            ),
+            (
+                arrow.Arrow(2013, 3, 1, tzinfo="US/Pacific"),
+                arrow.Arrow(2013, 3, 31, 23, 59, 59, 999999, tzinfo="US/Pacific"),
+            ),
+        ]
+
+    def test_empty(self):
+        result = arrow.Arrow.span_range_chunks(
+            "day", datetime(2013, 1, 3), datetime(2013, 1, 1), 2
+        )
+
+        assert result == []
+
+    def test_dst(self):
+        # the local time jumps from midnight to 01:00 on 2015-10-18
+        start = datetime(2015, 10, 12, 7, 30)
+        end = datetime(2015, 10, 23, 18)
+
+        result = arrow.Arrow.span_range_chunks(
+            "day", start, end, 2, tz="America/Sao_Paulo"
+        )
+
+        assert result[0][1] == arrow.Arrow(
+            2015, 10, 17, 23, 59, 59, 999999, tzinfo="America/Sao_Paulo"
+        )
+        assert result[1][0] == arrow.Arrow(2015, 10, 18, tzinfo="America/Sao_Paulo")
+        assert [
+            span
+            for floor, ceil in result
+            for span in arrow.Arrow.span_range("day", floor, ceil)
+        ] == list(arrow.Arrow.span_range("day", start, end, tz="America/Sao_Paulo"))
+
+    def test_bad_arguments(self):
+        with pytest.raises(ValueError):
+            arrow.Arrow.span_range_chunks(
+                "day", datetime(2013, 1, 1), datetime(2013, 1, 3), 0
+            )
+
 
 class TestArrowInterval:
     def test_incorrect_input(self):
@@ -1628,6 +2175,82 @@ class TestArrowInterval:
 
         assert result == expected
 
+    def test_partial_last_interval(self):
+        result = list(
+            arrow.Arrow.interval(
+                "minute", datetime(2013, 1, 1, 0, 5), datetime(2013, 1, 1, 0, 50), 15
+            )
+        )
+
+        assert result == [
+            (
+                arrow.Arrow(2013, 1, 1, 0, 5),
+                arrow.Arrow(2013, 1, 1, 0, 19, 59, 999999),
+            ),
+            (
+                arrow.Arrow(2013, 1, 1, 0, 20),
+                arrow.Arrow(2013, 1, 1, 0, 34, 59, 999999),
+            ),
+            (
+                arrow.Arrow(2013, 1, 1, 0, 35),
+                arrow.Arrow(2013, 1, 1, 0, 49, 59, 999999),
+            ),
+            (
+                arrow.Arrow(2013, 1, 1, 0, 50),
+                arrow.Arrow(2013, 1, 1, 0, 50, 59, 999999),
+            ),
+        ]
+
+    def test_matches_span_range(self):
+        start = datetime(2013, 1, 30, 10, 17)
+        end = datetime(2014, 3, 2, 8, 3)
+
+        for frame, interval in [("month", 5), ("day", 40), ("hour", 97)]:
+            for exact in [False, True]:
+                spans = list(
+                    arrow.Arrow.span_range(frame, start, end, bounds="(]", exact=exact)
+                )
+                expected = [
+                    (spans[i][0], spans[min(i + interval, len(spans)) - 1][1])
+                    for i in range(0, len(spans), interval)
+                ]
+
+                assert (
+                    list(
+                        arrow.Arrow.interval(
+                            frame, start, end, interval, bounds="(]", exact=exact
+                        )
+                    )
+                    == expected
+                )
+
+    def test_dst(self):
+        tz = "America/New_York"
+        result = list(
+            arrow.Arrow.interval(
+                "hour",
+                datetime(2018, 3, 11, 0, 30),
+                datetime(2018, 3, 11, 5, 15),
+                2,
+                tz=tz,
+            )
+        )
+
+        assert result == [
+            (
+                arrow.Arrow(2018, 3, 11, 0, tzinfo=tz),
+                arrow.Arrow(2018, 3, 11, 3, 59, 59, 999999, tzinfo=tz),
+            ),
+            (
+                arrow.Arrow(2018, 3, 11, 3, tzinfo=tz),
+                arrow.Arrow(2018, 3, 11, 4, 59, 59, 999999, tzinfo=tz),
+            ),
+            (
+                arrow.Arrow(2018, 3, 11, 5, tzinfo=tz),
+                arrow.Arrow(2018, 3, 11, 5, 59, 59, 999999, tzinfo=tz),
+            ),
+        ]
+
 
 @pytest.mark.usefixtures("time_2013_02_15")
 class TestArrowSpan:
@@ -1938,80 +2561,915 @@ class TestArrowSpan:
         assert floor == datetime(2013, 2, 15, 3, 41, 22, 8924, tzinfo=tz.tzutc())
         assert ceil == datetime(2013, 3, 1, 3, 41, 22, 8922, tzinfo=tz.tzutc())
 
+    def test_span_imaginary_floor(self):
+        # DST started at midnight on 2018-11-04 in Sao Paulo
+        tz_expr = "America/Sao_Paulo"
+        arw = arrow.Arrow(2018, 11, 6, 12, tzinfo=tz_expr)
 
-@pytest.mark.usefixtures("time_2013_01_01")
-class TestArrowHumanize:
-    def test_granularity(self):
-        assert self.now.humanize(granularity="second") == "just now"
+        floor, ceil = arw.span("week", week_start=7)
 
-        later1 = self.now.shift(seconds=1)
-        assert self.now.humanize(later1, granularity="second") == "just now"
-        assert later1.humanize(self.now, granularity="second") == "just now"
-        assert self.now.humanize(later1, granularity="minute") == "0 minutes ago"
-        assert later1.humanize(self.now, granularity="minute") == "in 0 minutes"
+        assert floor == arrow.Arrow(2018, 11, 4, 1, tzinfo=tz_expr)
+        assert ceil == arrow.Arrow(2018, 11, 11, 0, 59, 59, 999999, tzinfo=tz_expr)
 
-        later100 = self.now.shift(seconds=100)
-        assert self.now.humanize(later100, granularity="second") == "100 seconds ago"
-        assert later100.humanize(self.now, granularity="second") == "in 100 seconds"
-        assert self.now.humanize(later100, granularity="minute") == "a minute ago"
-        assert later100.humanize(self.now, granularity="minute") == "in a minute"
-        assert self.now.humanize(later100, granularity="hour") == "0 hours ago"
-        assert later100.humanize(self.now, granularity="hour") == "in 0 hours"
+        floor, ceil = arrow.Arrow(2018, 11, 4, 1, 30, tzinfo=tz_expr).span(
+            "day", bounds="()"
+        )
 
-        later4000 = self.now.shift(seconds=4000)
-        assert self.now.humanize(later4000, granularity="minute") == "66 minutes ago"
-        assert later4000.humanize(self.now, granularity="minute") == "in 66 minutes"
-        assert self.now.humanize(later4000, granularity="hour") == "an hour ago"
-        assert later4000.humanize(self.now, granularity="hour") == "in an hour"
-        assert self.now.humanize(later4000, granularity="day") == "0 days ago"
-        assert later4000.humanize(self.now, granularity="day") == "in 0 days"
+        assert floor == arrow.Arrow(2018, 11, 4, 1, 0, 0, 1, tzinfo=tz_expr)
+        assert ceil == arrow.Arrow(2018, 11, 4, 23, 59, 59, 999999, tzinfo=tz_expr)
 
-        later105 = self.now.shift(seconds=10**5)
-        assert self.now.humanize(later105, granularity="hour") == "27 hours ago"
-        assert later105.humanize(self.now, granularity="hour") == "in 27 hours"
-        assert self.now.humanize(later105, granularity="day") == "a day ago"
-        assert later105.humanize(self.now, granularity="day") == "in a day"
-        assert self.now.humanize(later105, granularity="week") == "0 weeks ago"
-        assert later105.humanize(self.now, granularity="week") == "in 0 weeks"
-        assert self.now.humanize(later105, granularity="month") == "0 months ago"
-        assert later105.humanize(self.now, granularity="month") == "in 0 months"
-        assert self.now.humanize(later105, granularity=["month"]) == "0 months ago"
-        assert later105.humanize(self.now, granularity=["month"]) == "in 0 months"
+    def test_span_imaginary_ceil(self):
+        tz_expr = "America/New_York"
+        floor, ceil = arrow.Arrow(2018, 3, 11, 1, 30, tzinfo=tz_expr).span("hour")
 
-        later106 = self.now.shift(seconds=3 * 10**6)
-        assert self.now.humanize(later106, granularity="day") == "34 days ago"
-        assert later106.humanize(self.now, granularity="day") == "in 34 days"
-        assert self.now.humanize(later106, granularity="week") == "4 weeks ago"
-        assert later106.humanize(self.now, granularity="week") == "in 4 weeks"
-        assert self.now.humanize(later106, granularity="month") == "a month ago"
-        assert later106.humanize(self.now, granularity="month") == "in a month"
-        assert self.now.humanize(later106, granularity="year") == "0 years ago"
-        assert later106.humanize(self.now, granularity="year") == "in 0 years"
+        assert floor == arrow.Arrow(2018, 3, 11, 1, tzinfo=tz_expr)
+        assert ceil == arrow.Arrow(2018, 3, 11, 3, 59, 59, 999999, tzinfo=tz_expr)
 
-        later506 = self.now.shift(seconds=50 * 10**6)
-        assert self.now.humanize(later506, granularity="week") == "82 weeks ago"
-        assert later506.humanize(self.now, granularity="week") == "in 82 weeks"
-        assert self.now.humanize(later506, granularity="month") == "18 months ago"
-        assert later506.humanize(self.now, granularity="month") == "in 18 months"
-        assert self.now.humanize(later506, granularity="quarter") == "6 quarters ago"
-        assert later506.humanize(self.now, granularity="quarter") == "in 6 quarters"
-        assert self.now.humanize(later506, granularity="year") == "a year ago"
-        assert later506.humanize(self.now, granularity="year") == "in a year"
+        floor, ceil = arrow.Arrow(2018, 3, 11, 1, 30, tzinfo=tz_expr).span("quarter")
 
-        assert self.now.humanize(later1, granularity="quarter") == "0 quarters ago"
-        assert later1.humanize(self.now, granularity="quarter") == "in 0 quarters"
-        later107 = self.now.shift(seconds=10**7)
-        assert self.now.humanize(later107, granularity="quarter") == "a quarter ago"
-        assert later107.humanize(self.now, granularity="quarter") == "in a quarter"
-        later207 = self.now.shift(seconds=2 * 10**7)
-        assert self.now.humanize(later207, granularity="quarter") == "2 quarters ago"
-        assert later207.humanize(self.now, granularity="quarter") == "in 2 quarters"
-        later307 = self.now.shift(seconds=3 * 10**7)
-        assert self.now.humanize(later307, granularity="quarter") == "3 quarters ago"
-        assert later307.humanize(self.now, granularity="quarter") == "in 3 quarters"
-        later377 = self.now.shift(seconds=3.7 * 10**7)
-        assert self.now.humanize(later377, granularity="quarter") == "4 quarters ago"
-        assert later377.humanize(self.now, granularity="quarter") == "in 4 quarters"
+        assert floor == arrow.Arrow(2018, 1, 1, tzinfo=tz_expr)
+        assert ceil == arrow.Arrow(2018, 3, 31, 23, 59, 59, 999999, tzinfo=tz_expr)
+
+    def test_span_subclass(self):
+        class CustomArrow(arrow.Arrow):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                self.custom = True
+
+        floor, ceil = CustomArrow.fromdatetime(self.datetime).span("day")
+
+        assert isinstance(floor, CustomArrow) and floor.custom
+        assert isinstance(ceil, CustomArrow) and ceil.custom
+        assert floor == datetime(2013, 2, 15, tzinfo=tz.tzutc())
+
+    def test_span_memo(self, mocker):
+        mocker.patch.object(arrow.Arrow, "_span_memo", Cache(8))
+        span_datetime = mocker.spy(arrow.Arrow, "_span_datetime")
+
+        expected = (
+            arrow.Arrow(2013, 2, 15, 3),
+            arrow.Arrow(2013, 2, 15, 3, 59, 59, 999999),
+        )
+        assert self.arrow.span("hour") == expected
+        assert self.arrow.shift(minutes=-41).span("hour") == expected
+        assert self.arrow.shift(minutes=18).span("hour") == expected
+        assert span_datetime.call_count == 1
+
+        assert self.arrow.shift(minutes=19).span("hour") == (
+            arrow.Arrow(2013, 2, 15, 4),
+            arrow.Arrow(2013, 2, 15, 4, 59, 59, 999999),
+        )
+        assert self.arrow.span("hour", bounds="[]")[1] == arrow.Arrow(2013, 2, 15, 4)
+        assert self.arrow.to("US/Pacific").span("hour")[0] == arrow.Arrow(
+            2013, 2, 14, 19, tzinfo="US/Pacific"
+        )
+        assert self.arrow.span("hour", exact=True)[0] == self.arrow
+        assert span_datetime.call_count == 5
+
+    def test_span_memo_week_start(self, mocker):
+        mocker.patch.object(arrow.Arrow, "_span_memo", Cache(8))
+
+        assert self.arrow.floor("week") == arrow.Arrow(2013, 2, 11)
+        assert self.arrow.floor("week", week_start=7) == arrow.Arrow(2013, 2, 10)
+        assert self.arrow.shift(days=2).floor("week") == arrow.Arrow(2013, 2, 11)
+        assert self.arrow.shift(days=3).floor("week") == arrow.Arrow(2013, 2, 18)
+
+    def test_span_memo_dst(self, mocker):
+        mocker.patch.object(arrow.Arrow, "_span_memo", Cache(8))
+
+        before = arrow.Arrow(2018, 11, 4, 1, 30, tzinfo="America/New_York")
+        after = before.replace(fold=1)
+
+        assert before.span("hour")[0].utcoffset() == timedelta(hours=-4)
+        assert after.span("hour")[0].utcoffset() == timedelta(hours=-4)
+        assert after.span("day") == (
+            arrow.Arrow(2018, 11, 4, tzinfo="America/New_York"),
+            arrow.Arrow(2018, 11, 4, 23, 59, 59, 999999, tzinfo="America/New_York"),
+        )
+
+    def test_span_memo_size(self, mocker):
+        mocker.patch.object(arrow.Arrow, "_span_memo", Cache(2))
+
+        for frame in ["year", "month", "day", "microsecond"]:
+            self.arrow.span(frame)
+
+        assert [key[2] for key in arrow.Arrow._span_memo] == ["month", "day"]
+
+    def test_span_memo_disabled(self, mocker):
+        mocker.patch.object(arrow.Arrow, "_span_memo", Cache(0))
+        span_memoized = mocker.spy(arrow.Arrow, "_span_memoized")
+
+        self.arrow.span("hour")
+
+        assert span_memoized.call_count == 0
+        assert len(arrow.Arrow._span_memo) == 0
+
+
+class TestArrowFloorMany:
+    def test_values(self):
+        values = [
+            arrow.Arrow(2013, 5, 5, 12, 30),
+            datetime(2013, 5, 5, 12, 45, tzinfo=tz.tzutc()),
+            datetime(2013, 5, 5, 13, 15),
+            1367760600,
+            "1367760600",
+            1367760600000,
+        ]
+
+        assert arrow.Arrow.floor_many(values, "hour") == [
+            arrow.Arrow(2013, 5, 5, 12),
+            arrow.Arrow(2013, 5, 5, 12),
+            arrow.Arrow(2013, 5, 5, 13),
+            arrow.Arrow(2013, 5, 5, 13),
+            arrow.Arrow(2013, 5, 5, 13),
+            arrow.Arrow(2013, 5, 5, 13),
+        ]
+
+    def test_matches_floor(self):
+        start = arrow.Arrow(2018, 3, 10, 22, 17, 3, tzinfo="America/New_York")
+        values = [start.shift(minutes=37 * i) for i in range(300)]
+
+        for frame in ["year", "quarter", "month", "week", "day", "hour", "minute"]:
+            assert arrow.Arrow.floor_many(values, frame) == [
+                value.floor(frame) for value in values
+            ]
+            assert arrow.Arrow.floor_many(values, frame, tz="Europe/London") == [
+                value.to("Europe/London").floor(frame) for value in values
+            ]
+
+    def test_tz(self):
+        values = [1368082800, datetime(2013, 5, 9, 7, 10)]
+
+        floors = arrow.Arrow.floor_many(values, "day", tz="US/Pacific")
+
+        assert floors == [arrow.Arrow(2013, 5, 9, tzinfo="US/Pacific")] * 2
+        assert floors[0].tzinfo == ZoneInfo("US/Pacific")
+
+    def test_pytz_tz(self):
+        floors = arrow.Arrow.floor_many(
+            [1368082800], "hour", tz=pytz.timezone("Europe/Paris")
+        )
+
+        assert floors == [arrow.Arrow(2013, 5, 9, 9, tzinfo="Europe/Paris")]
+        assert floors[0].tzinfo == ZoneInfo("Europe/Paris")
+
+    def test_own_tz(self):
+        values = [
+            arrow.Arrow(2013, 5, 5, 12, 30, tzinfo="US/Pacific"),
+            arrow.Arrow(2013, 5, 5, 12, 40, tzinfo="Europe/Paris"),
+            arrow.Arrow(2013, 5, 5, 12, 50, tzinfo="US/Pacific"),
+        ]
+
+        assert arrow.Arrow.floor_many(values, "hour") == [
+            arrow.Arrow(2013, 5, 5, 12, tzinfo="US/Pacific"),
+            arrow.Arrow(2013, 5, 5, 12, tzinfo="Europe/Paris"),
+            arrow.Arrow(2013, 5, 5, 12, tzinfo="US/Pacific"),
+        ]
+
+    def test_timestamps(self):
+        values = [1368082800, 1368083400, 1368086400]
+
+        assert arrow.Arrow.floor_many(values, "hour", timestamps=True) == [
+            1368082800.0,
+            1368082800.0,
+            1368086400.0,
+        ]
+
+    def test_multiple(self):
+        start = arrow.Arrow(2013, 5, 5, 12, 30)
+
+        assert arrow.Arrow.floor_many([start], "minute", multiple=15) == [start]
+        assert arrow.Arrow.floor_many(
+            [start.shift(minutes=14)], "minute", multiple=15
+        ) == [start]
+        assert arrow.Arrow.floor_many([start], "hour", multiple=6) == [
+            arrow.Arrow(2013, 5, 5, 12)
+        ]
+        assert arrow.Arrow.floor_many(
+            [start.shift(seconds=13)], "second", multiple=7
+        ) == [arrow.Arrow(2013, 5, 5, 12, 30, 7)]
+        assert arrow.Arrow.floor_many([start], "day", multiple=2) == [
+            arrow.Arrow(2013, 5, 5)
+        ]
+        assert arrow.Arrow.floor_many([start], "month", multiple=2) == [
+            arrow.Arrow(2013, 5, 1)
+        ]
+        assert arrow.Arrow.floor_many([start], "quarter", multiple=2) == [
+            arrow.Arrow(2013, 1, 1)
+        ]
+        assert arrow.Arrow.floor_many([start], "year", multiple=10) == [
+            arrow.Arrow(2010, 1, 1)
+        ]
+        assert arrow.Arrow.floor_many([arrow.Arrow.min], "year", multiple=10) == [
+            arrow.Arrow(1, 1, 1)
+        ]
+
+    def test_multiple_week(self):
+        values = [
+            arrow.Arrow(2013, 5, 5),
+            arrow.Arrow(2013, 5, 12),
+            arrow.Arrow(2013, 5, 13),
+        ]
+
+        assert arrow.Arrow.floor_many(values, "week", multiple=2) == [
+            arrow.Arrow(2013, 4, 29),
+            arrow.Arrow(2013, 4, 29),
+            arrow.Arrow(2013, 5, 13),
+        ]
+        assert arrow.Arrow.floor_many(values, "week", week_start=7, multiple=2) == [
+            arrow.Arrow(2013, 5, 5),
+            arrow.Arrow(2013, 5, 5),
+            arrow.Arrow(2013, 5, 5),
+        ]
+
+    def test_multiple_restart(self):
+        values = [arrow.Arrow(2013, 1, 31), arrow.Arrow(2013, 2, 1)]
+
+        assert arrow.Arrow.floor_many(values, "day", multiple=7) == [
+            arrow.Arrow(2013, 1, 29),
+            arrow.Arrow(2013, 2, 1),
+        ]
+
+    def test_dst(self):
+        tzinfo = ZoneInfo("America/New_York")
+        values = [
+            datetime(2018, 11, 4, 5, 59, tzinfo=timezone.utc),
+            datetime(2018, 11, 4, 6, 0, tzinfo=timezone.utc),
+            datetime(2018, 11, 4, 6, 30, tzinfo=timezone.utc),
+        ]
+
+        floors = arrow.Arrow.floor_many(values, "hour", tz=tzinfo)
+
+        assert floors == [
+            arrow.Arrow.fromdatetime(v).to(tzinfo).floor("hour") for v in values
+        ]
+        assert [f.utcoffset() for f in floors] == [timedelta(hours=-4)] * 3
+
+    def test_imaginary_floor(self):
+        values = [datetime(2018, 11, 4, 12), datetime(2018, 11, 10, 12)]
+
+        floors = arrow.Arrow.floor_many(
+            values, "week", tz="America/Sao_Paulo", week_start=7
+        )
+
+        assert floors == [
+            arrow.Arrow(2018, 11, 4, 1, tzinfo="America/Sao_Paulo"),
+            arrow.Arrow(2018, 11, 4, 1, tzinfo="America/Sao_Paulo"),
+        ]
+
+    def test_overflow(self):
+        values = [arrow.Arrow.max, arrow.Arrow.max]
+
+        assert arrow.Arrow.floor_many(values, "year") == [arrow.Arrow(9999, 1, 1)] * 2
+
+    def test_bad_arguments(self):
+        with pytest.raises(ValueError):
+            arrow.Arrow.floor_many([0], "week", week_start=0)
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.floor_many([0], "hour", multiple=0)
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.floor_many([0], "fortnight")
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.floor_many([date(2013, 5, 5)], "day")
+
+
+class TestArrowResample:
+    def test_aggregates(self):
+        start = arrow.Arrow(2013, 5, 5, 12, 30)
+        stream = [(start.shift(minutes=20 * i), i) for i in range(7)]
+        first_hour = (
+            arrow.Arrow(2013, 5, 5, 12),
+            arrow.Arrow(2013, 5, 5, 12, 59, 59, 999999),
+        )
+
+        expected = {
+            "count": [2, 3, 2],
+            "sum": [1, 9, 11],
+            "min": [0, 2, 5],
+            "max": [1, 4, 6],
+            "mean": [0.5, 3, 5.5],
+            "first": [0, 2, 5],
+            "last": [1, 4, 6],
+        }
+        for agg, values in expected.items():
+            result = list(arrow.Arrow.resample(stream, "hour", agg=agg))
+
+            assert [value for _, value in result] == values
+            assert result[0][0] == first_hour
+
+        result = list(arrow.Arrow.resample(stream, "hour", agg=sorted))
+        assert [value for _, value in result] == [[0, 1], [2, 3, 4], [5, 6]]
+
+    def test_stream(self):
+        def records():
+            for i in range(3):
+                yield datetime(2013, 5, 5 + 2 * i), i
+
+        result = arrow.Arrow.resample(records(), "day", agg="sum")
+
+        assert next(result) == (
+            (arrow.Arrow(2013, 5, 5), arrow.Arrow(2013, 5, 5, 23, 59, 59, 999999)),
+            0,
+        )
+        assert len(list(result)) == 2
+        assert list(arrow.Arrow.resample([], "day")) == []
+
+    def test_fill(self):
+        stream = [(datetime(2013, 5, 5), 1), (datetime(2013, 5, 8), 2)]
+
+        result = list(arrow.Arrow.resample(stream, "day", fill=True))
+        assert [(span[0].day, count) for span, count in result] == [
+            (5, 1),
+            (6, 0),
+            (7, 0),
+            (8, 1),
+        ]
+
+        result = list(arrow.Arrow.resample(stream, "day", agg="max", fill=True))
+        assert [value for _, value in result] == [1, None, None, 2]
+
+    def test_tz(self):
+        stream = [(1368082800, 1), (1368136800, 1), (1368169200, 1)]
+
+        result = list(arrow.Arrow.resample(stream, "day", tz="US/Pacific"))
+        assert [(span[0], count) for span, count in result] == [
+            (arrow.Arrow(2013, 5, 9, tzinfo="US/Pacific"), 2),
+            (arrow.Arrow(2013, 5, 10, tzinfo="US/Pacific"), 1),
+        ]
+
+        stream = [(arrow.Arrow(2013, 5, 9, 23, tzinfo="US/Pacific"), 1)]
+        result = list(arrow.Arrow.resample(stream, "day"))
+        assert result[0][0][0] == arrow.Arrow(2013, 5, 9, tzinfo="US/Pacific")
+
+    def test_week_and_quarter(self):
+        stream = [(datetime(2013, 5, 5), 1), (datetime(2013, 5, 6), 1)]
+
+        result = list(arrow.Arrow.resample(stream, "week", week_start=7))
+        assert [(span[0], count) for span, count in result] == [
+            (arrow.Arrow(2013, 5, 5), 2)
+        ]
+
+        result = list(arrow.Arrow.resample(stream, "quarter"))
+        assert result == [
+            ((arrow.Arrow(2013, 4, 1), arrow.Arrow(2013, 6, 30, 23, 59, 59, 999999)), 2)
+        ]
+
+    def test_bounds(self):
+        stream = [
+            (datetime(2013, 5, 5, 12), "a"),
+            (datetime(2013, 5, 5, 12, 30), "b"),
+            (datetime(2013, 5, 5, 13), "c"),
+            (datetime(2013, 5, 5, 13), "d"),
+            (datetime(2013, 5, 5, 14, 30), "e"),
+        ]
+
+        def resample(bounds):
+            return [
+                (span[0].hour, values)
+                for span, values in arrow.Arrow.resample(
+                    stream, "hour", agg=list, bounds=bounds
+                )
+            ]
+
+        assert resample("[)") == [(12, ["a", "b"]), (13, ["c", "d"]), (14, ["e"])]
+        assert resample("(]") == [(11, ["a"]), (12, ["b", "c", "d"]), (14, ["e"])]
+        assert resample("()") == [(12, ["b"]), (14, ["e"])]
+        assert resample("[]") == [
+            (11, ["a"]),
+            (12, ["a", "b", "c", "d"]),
+            (13, ["c", "d"]),
+            (14, ["e"]),
+        ]
+
+    def test_dst(self):
+        stream = [
+            (datetime(2018, 11, 4, 5, 30, tzinfo=timezone.utc), 1),
+            (datetime(2018, 11, 4, 6, 30, tzinfo=timezone.utc), 2),
+            (datetime(2018, 11, 4, 7, 30, tzinfo=timezone.utc), 3),
+        ]
+
+        result = list(
+            arrow.Arrow.resample(stream, "hour", tz="America/New_York", agg="sum")
+        )
+
+        assert [span[0].utcoffset() for span, _ in result] == [
+            timedelta(hours=-4),
+            timedelta(hours=-5),
+            timedelta(hours=-5),
+        ]
+        assert [span[0].hour for span, _ in result] == [1, 1, 2]
+        assert [span[1].fold for span, _ in result] == [0, 1, 0]
+        assert [total for _, total in result] == [1, 2, 3]
+
+    def test_dst_fill(self):
+        stream = [
+            (datetime(2018, 11, 4, 6, 10, tzinfo=timezone.utc), 1),
+            (datetime(2018, 11, 4, 6, 12, tzinfo=timezone.utc), 1),
+        ]
+
+        result = list(
+            arrow.Arrow.resample(stream, "minute", tz="America/New_York", fill=True)
+        )
+
+        assert [(span[0].minute, span[0].fold, count) for span, count in result] == [
+            (10, 1, 1),
+            (11, 1, 0),
+            (12, 1, 1),
+        ]
+
+        result = list(
+            arrow.Arrow.resample(stream[:1], "hour", tz="America/New_York", bounds="[]")
+        )
+
+        assert result[0][0] == (
+            arrow.Arrow(2018, 11, 4, 1, tzinfo="America/New_York", fold=1),
+            arrow.Arrow(2018, 11, 4, 2, tzinfo="America/New_York"),
+        )
+        assert result[0][0][0].utcoffset() == timedelta(hours=-5)
+
+    def test_dst_midnight(self):
+        # the local time falls back from 01:00 to midnight
+        stream = [
+            (datetime(2018, 11, 4, 4, 30, tzinfo=timezone.utc), 1),
+            (datetime(2018, 11, 4, 5, 30, tzinfo=timezone.utc), 1),
+            (datetime(2018, 11, 4, 17, 30, tzinfo=timezone.utc), 1),
+        ]
+
+        result = list(arrow.Arrow.resample(stream, "day", tz="America/Havana"))
+        assert result == [
+            (
+                (
+                    arrow.Arrow(2018, 11, 4, tzinfo="America/Havana"),
+                    arrow.Arrow(
+                        2018, 11, 4, 23, 59, 59, 999999, tzinfo="America/Havana"
+                    ),
+                ),
+                3,
+            )
+        ]
+
+        result = list(arrow.Arrow.resample(stream, "hour", tz="America/Havana"))
+        assert [span[0].utcoffset() for span, _ in result] == [
+            timedelta(hours=-4),
+            timedelta(hours=-5),
+            timedelta(hours=-5),
+        ]
+
+        result = list(
+            arrow.Arrow.resample(stream, "day", tz="America/Havana", fill=True)
+        )
+        assert [(span[0].day, count) for span, count in result] == [(4, 3)]
+
+    def test_dst_fill_midnight(self):
+        # the local time falls back from midnight to 23:00, repeating an hour
+        stream = [
+            (datetime(2019, 2, 16, 21, 30, tzinfo=timezone.utc), 1),
+            (datetime(2019, 2, 17, 4, 30, tzinfo=timezone.utc), 1),
+        ]
+
+        result = list(
+            arrow.Arrow.resample(stream, "hour", tz="America/Sao_Paulo", fill=True)
+        )
+
+        assert [(span[0].hour, span[0].fold, count) for span, count in result] == [
+            (19, 0, 1),
+            (20, 0, 0),
+            (21, 0, 0),
+            (22, 0, 0),
+            (23, 0, 0),
+            (23, 1, 0),
+            (0, 0, 0),
+            (1, 0, 1),
+        ]
+        assert [span[0].utcoffset() for span, _ in result[4:6]] == [
+            timedelta(hours=-2),
+            timedelta(hours=-3),
+        ]
+
+    def test_subclass(self):
+        class CustomArrow(arrow.Arrow):
+            pass
+
+        result = list(CustomArrow.resample([(0, 1)], "day"))
+
+        assert isinstance(result[0][0][0], CustomArrow)
+
+    def test_not_sorted(self):
+        stream = [(datetime(2013, 5, 6), 1), (datetime(2013, 5, 5), 2)]
+
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.resample(stream, "day"))
+
+        stream = [(datetime(2013, 5, 7), 1), (datetime(2013, 5, 8), 1)] + stream
+
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.resample(stream, "day"))
+
+    def test_bad_arguments(self):
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.resample([(0, 1)], "day", agg="median"))
+
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.resample([(0, 1)], "week", week_start=8))
+
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.resample([(0, 1)], "day", bounds="[["))
+
+
+class TestArrowFindGaps:
+    def test_gaps(self):
+        values = [
+            datetime(2013, 5, 5, 12, 30),
+            datetime(2013, 5, 5, 12, 45),
+            datetime(2013, 5, 5, 15),
+            datetime(2013, 5, 5, 16, 10),
+            datetime(2013, 5, 5, 20, 59),
+        ]
+
+        result = list(arrow.Arrow.find_gaps(values, "hour"))
+
+        assert result == [
+            (arrow.Arrow(2013, 5, 5, 13), arrow.Arrow(2013, 5, 5, 14, 59, 59, 999999)),
+            (arrow.Arrow(2013, 5, 5, 17), arrow.Arrow(2013, 5, 5, 19, 59, 59, 999999)),
+        ]
+        assert list(arrow.Arrow.find_gaps(values[:2], "hour")) == []
+        assert list(arrow.Arrow.find_gaps([], "hour")) == []
+
+    def test_start_end(self):
+        values = [datetime(2013, 5, 7), datetime(2013, 5, 7, 12), datetime(2013, 5, 9)]
+
+        result = list(
+            arrow.Arrow.find_gaps(
+                values,
+                "day",
+                start=datetime(2013, 5, 5, 6),
+                end=datetime(2013, 5, 11, 1),
+            )
+        )
+
+        assert [(floor.day, ceil.day) for floor, ceil in result] == [
+            (5, 6),
+            (8, 8),
+            (10, 11),
+        ]
+
+        result = list(
+            arrow.Arrow.find_gaps(
+                values, "day", start=datetime(2013, 5, 8), end=datetime(2013, 5, 8, 23)
+            )
+        )
+        assert result == [
+            (arrow.Arrow(2013, 5, 8), arrow.Arrow(2013, 5, 8, 23, 59, 59, 999999))
+        ]
+
+        result = list(
+            arrow.Arrow.find_gaps(
+                [], "month", start=datetime(2013, 1, 31), end=datetime(2013, 3, 1)
+            )
+        )
+        assert result == [
+            (arrow.Arrow(2013, 1, 1), arrow.Arrow(2013, 3, 31, 23, 59, 59, 999999))
+        ]
+        assert list(arrow.Arrow.find_gaps([], "month", end=datetime(2013, 3, 1))) == []
+
+    def test_end_not_read(self):
+        def values():
+            yield datetime(2013, 5, 5)
+            yield datetime(2013, 5, 9)
+            raise AssertionError("read past the end")
+
+        result = list(arrow.Arrow.find_gaps(values(), "day", end=datetime(2013, 5, 6)))
+
+        assert result == [
+            (arrow.Arrow(2013, 5, 6), arrow.Arrow(2013, 5, 6, 23, 59, 59, 999999))
+        ]
+
+    def test_long_gap(self, mocker):
+        values = [datetime(1900, 1, 1), datetime(2100, 1, 1)]
+        spy = mocker.spy(arrow.Arrow, "_next_bucket_floor")
+
+        result = list(arrow.Arrow.find_gaps(values, "minute"))
+
+        assert result == [
+            (
+                arrow.Arrow(1900, 1, 1, 0, 1),
+                arrow.Arrow(2099, 12, 31, 23, 59, 59, 999999),
+            )
+        ]
+        assert spy.call_count == 2
+
+    def test_tz(self):
+        values = [1368082800, 1368169200]
+
+        result = list(arrow.Arrow.find_gaps(values, "day", tz="US/Pacific"))
+        assert result == []
+
+        result = list(
+            arrow.Arrow.find_gaps(
+                values, "day", start=arrow.Arrow(2013, 5, 8, tzinfo="US/Pacific")
+            )
+        )
+        assert result == [
+            (
+                arrow.Arrow(2013, 5, 8, tzinfo="US/Pacific"),
+                arrow.Arrow(2013, 5, 8, 23, 59, 59, 999999, tzinfo="US/Pacific"),
+            )
+        ]
+
+        values = [arrow.Arrow(2013, 5, 9, 1, tzinfo="US/Pacific"), 1368169200]
+        result = list(arrow.Arrow.find_gaps(values, "hour"))
+        assert result[0][0] == arrow.Arrow(2013, 5, 9, 2, tzinfo="US/Pacific")
+
+    def test_week_and_quarter(self):
+        values = [datetime(2013, 5, 5), datetime(2013, 5, 20)]
+
+        result = list(arrow.Arrow.find_gaps(values, "week", week_start=7))
+        assert result == [
+            (arrow.Arrow(2013, 5, 12), arrow.Arrow(2013, 5, 18, 23, 59, 59, 999999))
+        ]
+
+        values = [datetime(2013, 2, 5), datetime(2014, 1, 1)]
+        result = list(arrow.Arrow.find_gaps(values, "quarter"))
+        assert result == [
+            (arrow.Arrow(2013, 4, 1), arrow.Arrow(2013, 12, 31, 23, 59, 59, 999999))
+        ]
+
+    def test_bounds(self):
+        values = [datetime(2013, 5, 5, 12), datetime(2013, 5, 5, 14)]
+
+        result = list(arrow.Arrow.find_gaps(values, "hour", bounds="(]"))
+
+        assert result == [
+            (
+                arrow.Arrow(2013, 5, 5, 13, 0, 0, 1),
+                arrow.Arrow(2013, 5, 5, 14),
+            )
+        ]
+
+    def test_dst(self):
+        values = [
+            datetime(2018, 11, 4, 5, 30, tzinfo=timezone.utc),
+            datetime(2018, 11, 4, 7, 30, tzinfo=timezone.utc),
+        ]
+
+        result = list(arrow.Arrow.find_gaps(values, "hour", tz="America/New_York"))
+
+        assert result == [
+            (
+                arrow.Arrow(2018, 11, 4, 1, tzinfo="America/New_York", fold=1),
+                arrow.Arrow(
+                    2018, 11, 4, 1, 59, 59, 999999, tzinfo="America/New_York", fold=1
+                ),
+            )
+        ]
+        assert result[0][0].utcoffset() == timedelta(hours=-5)
+
+        values = [
+            datetime(2018, 3, 11, 6, 30, tzinfo=timezone.utc),
+            datetime(2018, 3, 11, 7, 30, tzinfo=timezone.utc),
+        ]
+        result = list(arrow.Arrow.find_gaps(values, "hour", tz="America/New_York"))
+        assert result == []
+
+        # the local time jumps from 23:38:44 to midnight
+        values = [
+            arrow.Arrow(1900, 12, 31, 23, 10, tzinfo="Africa/Ceuta"),
+            arrow.Arrow(1901, 1, 1, 1, 30, tzinfo="Africa/Ceuta"),
+        ]
+        result = list(arrow.Arrow.find_gaps(values, "hour"))
+        assert result == [
+            (
+                arrow.Arrow(1901, 1, 1, tzinfo="Africa/Ceuta"),
+                arrow.Arrow(1901, 1, 1, 0, 59, 59, 999999, tzinfo="Africa/Ceuta"),
+            )
+        ]
+
+    def test_dst_midnight(self):
+        # the day of the gap starts at 01:00 in Sao Paulo, and the day of the fold ends
+        # twice in Havana
+        for name, day in [
+            ("America/Sao_Paulo", datetime(2018, 11, 4)),
+            ("America/Sao_Paulo", datetime(2019, 2, 16)),
+            ("America/Havana", datetime(2018, 3, 11)),
+            ("America/Havana", datetime(2018, 11, 4)),
+        ]:
+            values = [
+                day.replace(tzinfo=ZoneInfo(name)) - timedelta(hours=12),
+                day.replace(tzinfo=ZoneInfo(name)) + timedelta(hours=36),
+            ]
+
+            for bounds in ["[)", "[]", "()"]:
+                result = list(arrow.Arrow.find_gaps(values, "day", bounds=bounds))
+                spans = list(
+                    arrow.Arrow.span_range("day", day, day, tz=name, bounds=bounds)
+                )
+
+                assert result == spans
+                assert [(floor.fold, ceil.fold) for floor, ceil in result] == [(0, 0)]
+
+        values = [
+            datetime(2018, 11, 3, 22, 30, tzinfo=ZoneInfo("America/Sao_Paulo")),
+            datetime(2018, 11, 4, 5, tzinfo=ZoneInfo("America/Sao_Paulo")),
+        ]
+        assert list(arrow.Arrow.find_gaps(values, "hour")) == [
+            (
+                arrow.Arrow(2018, 11, 3, 23, tzinfo="America/Sao_Paulo"),
+                arrow.Arrow(2018, 11, 4, 4, 59, 59, 999999, tzinfo="America/Sao_Paulo"),
+            )
+        ]
+
+    def test_subclass(self):
+        class CustomArrow(arrow.Arrow):
+            pass
+
+        result = list(CustomArrow.find_gaps([0, 7200], "hour"))
+
+        assert isinstance(result[0][0], CustomArrow)
+
+    def test_not_sorted(self):
+        values = [datetime(2013, 5, 6), datetime(2013, 5, 5)]
+
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.find_gaps(values, "day"))
+
+        values = [datetime(2013, 5, 6), datetime(2013, 5, 8), datetime(2013, 5, 5)]
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.find_gaps(values, "day", start=datetime(2013, 5, 7)))
+
+    def test_bad_arguments(self):
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.find_gaps([0], "week", week_start=8))
+
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.find_gaps([0], "day", bounds="[["))
+
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.find_gaps(["tomorrow"], "day"))
+
+
+class TestArrowConvertMany:
+    def test_convert_many(self):
+        values = [
+            1509861600,
+            datetime(2017, 11, 5, 6, 30),
+            arrow.Arrow(2017, 11, 5, 2, 45, tzinfo="US/Eastern"),
+            datetime(2017, 11, 5, 4, tzinfo=ZoneInfo("US/Pacific")),
+        ]
+
+        result = arrow.Arrow.convert_many(values, "America/Chicago")
+
+        assert result == [
+            arrow.Arrow(2017, 11, 5, 1, tzinfo="America/Chicago"),
+            arrow.Arrow(2017, 11, 5, 1, 30, tzinfo="America/Chicago"),
+            arrow.Arrow(2017, 11, 5, 1, 45, tzinfo="America/Chicago", fold=1),
+            arrow.Arrow(2017, 11, 5, 6, tzinfo="America/Chicago"),
+        ]
+        assert [r.fold for r in result] == [0, 0, 1, 0]
+        assert [r.utcoffset() for r in result] == [
+            timedelta(hours=-5),
+            timedelta(hours=-5),
+            timedelta(hours=-6),
+            timedelta(hours=-6),
+        ]
+
+    def test_output(self):
+        values = [1368082800, 1368083400]
+
+        assert arrow.Arrow.convert_many(values, "US/Pacific", output="datetime") == [
+            datetime(2013, 5, 9, tzinfo=tz.gettz("US/Pacific")),
+            datetime(2013, 5, 9, 0, 10, tzinfo=tz.gettz("US/Pacific")),
+        ]
+        assert arrow.Arrow.convert_many(values, "US/Pacific", output="epoch") == [
+            (1368082800.0, -25200),
+            (1368083400.0, -25200),
+        ]
+        assert arrow.Arrow.convert_many([], "US/Pacific") == []
+
+    def test_same_as_to(self, mocker):
+        spy = mocker.spy(arrow.Arrow, "_transition_free_range")
+        start = arrow.Arrow(2020, 3, 1)
+
+        values = [start.shift(minutes=37 * i) for i in range(0, 400 * 24)]
+
+        for tzinfo, cached in [
+            ("US/Eastern", True),
+            (ZoneInfo("Europe/London"), True),
+            (tz.tzstr("EST5EDT,M3.2.0,M11.1.0"), True),
+            ("+05:30", True),
+            (tz.tzlocal(), False),
+        ]:
+            spy.reset_mock()
+
+            result = arrow.Arrow.convert_many(values, tzinfo)
+
+            expected = [value.to(tzinfo) for value in values]
+            assert [r.datetime for r in result] == [e.datetime for e in expected]
+            assert [r.fold for r in result] == [e.fold for e in expected]
+            assert (spy.call_count < len(values) / 10) == cached
+
+        result = arrow.Arrow.convert_many(
+            reversed(values), "US/Eastern", output="epoch"
+        )
+        assert result == [
+            (value.timestamp(), int(value.to("US/Eastern").utcoffset().total_seconds()))
+            for value in reversed(values)
+        ]
+
+    def test_subclass(self):
+        class CustomArrow(arrow.Arrow):
+            pass
+
+        result = CustomArrow.convert_many([0], "US/Pacific")
+
+        assert isinstance(result[0], CustomArrow)
+
+    def test_bad_arguments(self):
+        with pytest.raises(ValueError):
+            arrow.Arrow.convert_many([0], "US/Pacific", output="str")
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.convert_many([0], "abc")
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.convert_many(["tomorrow"], "US/Pacific")
+
+
+@pytest.mark.usefixtures("time_2013_01_01")
+class TestArrowHumanize:
+    def test_granularity(self):
+        assert self.now.humanize(granularity="second") == "just now"
+
+        later1 = self.now.shift(seconds=1)
+        assert self.now.humanize(later1, granularity="second") == "just now"
+        assert later1.humanize(self.now, granularity="second") == "just now"
+        assert self.now.humanize(later1, granularity="minute") == "0 minutes ago"
+        assert later1.humanize(self.now, granularity="minute") == "in 0 minutes"
+
+        later100 = self.now.shift(seconds=100)
+        assert self.now.humanize(later100, granularity="second") == "100 seconds ago"
+        assert later100.humanize(self.now, granularity="second") == "in 100 seconds"
+        assert self.now.humanize(later100, granularity="minute") == "a minute ago"
+        assert later100.humanize(self.now, granularity="minute") == "in a minute"
+        assert self.now.humanize(later100, granularity="hour") == "0 hours ago"
+        assert later100.humanize(self.now, granularity="hour") == "in 0 hours"
+
+        later4000 = self.now.shift(seconds=4000)
+        assert self.now.humanize(later4000, granularity="minute") == "66 minutes ago"
+        assert later4000.humanize(self.now, granularity="minute") == "in 66 minutes"
+        assert self.now.humanize(later4000, granularity="hour") == "an hour ago"
+        assert later4000.humanize(self.now, granularity="hour") == "in an hour"
+        assert self.now.humanize(later4000, granularity="day") == "0 days ago"
+        assert later4000.humanize(self.now, granularity="day") == "in 0 days"
+
+        later105 = self.now.shift(seconds=10**5)
+        assert self.now.humanize(later105, granularity="hour") == "27 hours ago"
+        assert later105.humanize(self.now, granularity="hour") == "in 27 hours"
+        assert self.now.humanize(later105, granularity="day") == "a day ago"
+        assert later105.humanize(self.now, granularity="day") == "in a day"
+        assert self.now.humanize(later105, granularity="week") == "0 weeks ago"
+        assert later105.humanize(self.now, granularity="week") == "in 0 weeks"
+        assert self.now.humanize(later105, granularity="month") == "0 months ago"
+        assert later105.humanize(self.now, granularity="month") == "in 0 months"
+        assert self.now.humanize(later105, granularity=["month"]) == "0 months ago"
+        assert later105.humanize(self.now, granularity=["month"]) == "in 0 months"
+
+        later106 = self.now.shift(seconds=3 * 10**6)
+        assert self.now.humanize(later106, granularity="day") == "34 days ago"
+        assert later106.humanize(self.now, granularity="day") == "in 34 days"
+        assert self.now.humanize(later106, granularity="week") == "4 weeks ago"
+        assert later106.humanize(self.now, granularity="week") == "in 4 weeks"
+        assert self.now.humanize(later106, granularity="month") == "a month ago"
+        assert later106.humanize(self.now, granularity="month") == "in a month"
+        assert self.now.humanize(later106, granularity="year") == "0 years ago"
+        assert later106.humanize(self.now, granularity="year") == "in 0 years"
+
+        later506 = self.now.shift(seconds=50 * 10**6)
+        assert self.now.humanize(later506, granularity="week") == "82 weeks ago"
+        assert later506.humanize(self.now, granularity="week") == "in 82 weeks"
+        assert self.now.humanize(later506, granularity="month") == "18 months ago"
+        assert later506.humanize(self.now, granularity="month") == "in 18 months"
+        assert self.now.humanize(later506, granularity="quarter") == "6 quarters ago"
+        assert later506.humanize(self.now, granularity="quarter") == "in 6 quarters"
+        assert self.now.humanize(later506, granularity="year") == "a year ago"
+        assert later506.humanize(self.now, granularity="year") == "in a year"
+
+        assert self.now.humanize(later1, granularity="quarter") == "0 quarters ago"
+        assert later1.humanize(self.now, granularity="quarter") == "in 0 quarters"
+        later107 = self.now.shift(seconds=10**7)
+        assert self.now.humanize(later107, granularity="quarter") == "a quarter ago"
+        assert later107.humanize(self.now, granularity="quarter") == "in a quarter"
+        later207 = self.now.shift(seconds=2 * 10**7)
+        assert self.now.humanize(later207, granularity="quarter") == "2 quarters ago"
+        assert later207.humanize(self.now, granularity="quarter") == "in 2 quarters"
+        later307 = self.now.shift(seconds=3 * 10**7)
+        assert self.now.humanize(later307, granularity="quarter") == "3 quarters ago"
+        assert later307.humanize(self.now, granularity="quarter") == "in 3 quarters"
+        later377 = self.now.shift(seconds=3.7 * 10**7)
+        assert self.now.humanize(later377, granularity="quarter") == "4 quarters ago"
+        assert later377.humanize(self.now, granularity="quarter") == "in 4 quarters"
         later407 = self.now.shift(seconds=4 * 10**7)
         assert self.now.humanize(later407, granularity="quarter") == "5 quarters ago"
         assert later407.humanize(self.now, granularity="quarter") == "in 5 quarters"
@@ -2605,6 +4063,137 @@ def slavic_locales() -> List[str]:
     return tested_langs
 
 
+class TestArrowHumanizeMany:
+    def test_humanize_many(self):
+        now = arrow.Arrow(2013, 5, 9, 12, tzinfo="US/Pacific")
+        values = [
+            now.shift(seconds=-5),
+            now.shift(minutes=-90).datetime,
+            now.shift(days=-17).timestamp(),
+            now.shift(weeks=1, hours=1).to("Asia/Tokyo"),
+            now.shift(months=3).datetime.replace(tzinfo=None),
+            now.shift(years=-3),
+        ]
+
+        for kwargs in [
+            {},
+            {"locale": "fr"},
+            {"only_distance": True},
+            {"granularity": "minute"},
+            {"granularity": ["day", "hour"]},
+        ]:
+            expected = [
+                arrow.Arrow.fromdatetime(arrow.Arrow._get_datetime(value)).humanize(
+                    now, **kwargs
+                )
+                for value in values
+            ]
+            assert arrow.Arrow.humanize_many(values, now, **kwargs) == expected
+
+        assert arrow.Arrow.humanize_many(values, now.datetime) == [
+            "just now",
+            "an hour ago",
+            "a month ago",
+            "in a week",
+            "in 3 months",
+            "3 years ago",
+        ]
+        assert arrow.Arrow.humanize_many([]) == []
+
+    def test_now(self, mocker):
+        spy = mocker.spy(arrow.locales, "get_locale")
+        now = arrow.Arrow.utcnow()
+
+        result = arrow.Arrow.humanize_many(
+            [now.shift(hours=-2), now.shift(hours=-2).to("US/Pacific")]
+        )
+
+        assert result == ["2 hours ago", "2 hours ago"]
+        spy.assert_called_once_with("en-us")
+
+    def test_subclass(self, mocker):
+        class CustomArrow(arrow.Arrow):
+            pass
+
+        mocker.patch.object(CustomArrow, "_humanize", return_value="custom")
+
+        # values that are already Arrow objects keep their class
+        assert CustomArrow.humanize_many([0, arrow.Arrow.utcnow()]) == [
+            "custom",
+            "just now",
+        ]
+
+    def test_bad_arguments(self):
+        with pytest.raises(TypeError):
+            arrow.Arrow.humanize_many([0], "now")
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.humanize_many([0], granularity="decade")
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.humanize_many(["tomorrow"])
+
+
+class TestArrowWarmup:
+    def test_warmup(self, mocker):
+        mocker.patch.object(parser.DateTimeParser, "_shared_parsers", Cache(8))
+        mocker.patch.object(parser.DateTimeParser, "_shared_pattern_cache", Cache(64))
+        mocker.patch.object(formatter.DateTimeFormatter, "_compiled_formats", Cache(8))
+        mocker.patch.object(parser.TzinfoParser, "_tzinfos", Cache(8))
+        mocker.patch.object(arrow.Arrow, "_dehumanizers", Cache(8))
+        mocker.patch.object(arrow.Arrow, "_transition_tables", Cache(8))
+        load = mocker.spy(arrow, "load")
+        import_module = mocker.spy(arrow, "import_module")
+
+        arrow.Arrow.warmup(["DD MMMM YYYY"], ["fr", "th"], ["US/Pacific", "+01:00"])
+
+        assert [call.args[0] for call in load.call_args_list] == list(
+            arrow._DEFERRED_MODULES
+        )
+        assert [call.args[0] for call in import_module.call_args_list] == list(
+            arrow._DATEUTIL_MODULES
+        )
+        assert set(parser.DateTimeParser._shared_parsers) == {"fr", "th"}
+        shared = parser.DateTimeParser._shared_parsers.get("fr")
+        misses = shared._pattern_cache.misses
+        assert shared.parse("05 mai 2020", "DD MMMM YYYY") == datetime(2020, 5, 5)
+        assert shared.parse_iso("2020-05-05T10:30:00+02:00") == datetime(
+            2020, 5, 5, 10, 30, tzinfo=timezone(timedelta(hours=2))
+        )
+        assert shared._pattern_cache.misses == misses
+
+        # only the locales supported by dehumanize get a dehumanizer
+        assert list(arrow.Arrow._dehumanizers) == [type(locales.get_locale("fr"))]
+
+        assert set(formatter.DateTimeFormatter._compiled_formats) == {
+            "DD MMMM YYYY",
+            "YYYY-MM-DD HH:mm:ssZZ",
+        }
+
+        tzinfo = parser.TzinfoParser._tzinfos.get("US/Pacific")
+        assert list(arrow.Arrow._transition_tables) == [
+            (id(tzinfo), datetime.now(timezone.utc).year)
+        ]
+        assert "+01:00" in parser.TzinfoParser._tzinfos
+
+    def test_warmup_defaults(self, mocker):
+        mocker.patch.object(parser.DateTimeParser, "_shared_parsers", Cache(8))
+
+        arrow.Arrow.warmup()
+
+        assert set(parser.DateTimeParser._shared_parsers) == {"en-us"}
+
+    def test_warmup_bad_arguments(self):
+        with pytest.raises(ValueError):
+            arrow.Arrow.warmup(locales=["xx"])
+
+        with pytest.raises(ValueError):
+            arrow.Arrow.warmup(timezones=["Mars/Olympus_Mons"])
+
+        with pytest.raises(ParserError):
+            arrow.Arrow.warmup(["YYY"])
+
+
 class TestArrowDehumanize:
     def test_now(self, locale_list_no_weeks: List[str]):
         for lang in locale_list_no_weeks:
@@ -2987,6 +4576,29 @@ class TestArrowDehumanize:
                 assert arw.dehumanize(past_string, locale=lang) == past
                 assert arw.dehumanize(future_string, locale=lang) == future
 
+    def test_dehumanizer_cached(self, mocker):
+        mocker.patch.object(arrow.Arrow, "_dehumanizers", Cache(8))
+        spy = mocker.spy(arrow.re, "compile")
+        arw = arrow.Arrow(2000, 2, 18, 1, 50, 30)
+
+        assert arw.dehumanize("in 2 hours") == arw.shift(hours=2)
+        compiled = spy.call_count
+        assert compiled > 0
+
+        assert arw.dehumanize("3 days ago", locale="en-gb") == arw.shift(days=-3)
+        assert arw.dehumanize("vor 3 Tagen", locale="de") == arw.shift(days=-3)
+        assert spy.call_count > compiled
+        compiled = spy.call_count
+
+        assert arw.dehumanize("a week ago") == arw.shift(weeks=-1)
+        assert arw.dehumanize("in 4 Minuten", locale="de_DE") == arw.shift(minutes=4)
+        assert spy.call_count == compiled
+
+        assert set(arrow.Arrow._dehumanizers) == {
+            arrow.locales.EnglishLocale,
+            arrow.locales.GermanLocale,
+        }
+
 
 class TestArrowIsBetween:
     def test_start_before_end(self):
@@ -3065,6 +4677,36 @@ class TestArrowIsBetween:
             target.span("week", week_start=55)
 
 
+class TestArrowDiff:
+    def test_diff(self):
+        start = arrow.Arrow(2013, 1, 31, 12)
+
+        assert start.diff(arrow.Arrow(2013, 3, 31, 12), "month") == 2
+        assert start.diff(arrow.Arrow(2013, 3, 31, 11), "month") == 1
+        assert start.diff(arrow.Arrow(2013, 2, 28, 12), "month") == 1
+        assert start.diff(arrow.Arrow(2013, 2, 7), "week") == 0
+        assert start.diff(start, "day") == 0
+
+    def test_earlier(self):
+        start = arrow.Arrow(2013, 1, 31, 12)
+
+        assert start.diff(arrow.Arrow(2012, 12, 25), "week") == -5
+        assert start.diff(arrow.Arrow(2013, 1, 31, 11, 30), "hour") == 0
+        assert start.diff(arrow.Arrow(2012, 1, 31, 12), "year") == -1
+
+    def test_tz(self):
+        start = arrow.Arrow(2013, 1, 31, tzinfo="US/Pacific")
+
+        assert start.diff(arrow.Arrow(2013, 2, 1, 7), "day") == 0
+        assert start.diff(arrow.Arrow(2013, 2, 1, 8), "day") == 1
+        assert start.diff(datetime(2013, 2, 1, 7), "day") == 1
+        assert start.diff(datetime(2013, 2, 1, 7, tzinfo=timezone.utc), "day") == 0
+
+    def test_type_error(self):
+        with pytest.raises(TypeError):
+            arrow.Arrow.utcnow().diff("2013-01-01", "day")
+
+
 class TestArrowUtil:
     def test_get_datetime(self):
         get_datetime = arrow.Arrow._get_datetime
@@ -3090,6 +4732,138 @@ class TestArrowUtil:
             get_tzinfo("abc")
         assert "not recognized as a timezone" in str(raise_ctx.value)
 
+    def test_transition_table(self):
+        transition_table = arrow.Arrow._transition_table
+
+        for tzinfo in [
+            ZoneInfo("America/New_York"),
+            tz.gettz("America/New_York"),
+        ]:
+            starts, ends = transition_table(tzinfo, 2020)
+            assert starts == [
+                datetime(2020, 3, 6, 7, tzinfo=tzinfo),
+                datetime(2020, 10, 30, 6, tzinfo=tzinfo),
+            ]
+            assert ends == [
+                datetime(2020, 3, 10, 7, tzinfo=tzinfo),
+                datetime(2020, 11, 3, 6, tzinfo=tzinfo),
+            ]
+
+        tzinfo = tz.tzstr("EST5EDT,M3.2.0,M11.1.0")
+        starts, ends = transition_table(tzinfo, 2020)
+        assert datetime(2020, 3, 6, 2, tzinfo=tzinfo) in starts
+        assert datetime(2020, 11, 3, 1, tzinfo=tzinfo) in ends
+
+        # transitions less than four days apart share a range
+        tzinfo = ZoneInfo("Africa/Freetown")
+        assert transition_table(tzinfo, 1939)[1] == [
+            datetime(1939, 6, 3, 0, 40, tzinfo=tzinfo),
+            datetime(1939, 9, 7, 0, 40, tzinfo=tzinfo),
+        ]
+
+        assert transition_table(ZoneInfo("Asia/Kolkata"), 2020) == ([], [])
+        assert transition_table(ZoneInfo("UTC"), 2020) == ([], [])
+        assert transition_table(tz.tzstr("EST5"), 2020) == ([], [])
+
+    def test_transition_table_without_tzfile_transitions(self, mocker):
+        tzinfo = tz.gettz("America/New_York")
+        expected = arrow.Arrow._transition_table(tzinfo, 2020)
+
+        # the UTC offsets of a tzfile are sampled when its transitions are unavailable
+        mocker.patch.object(arrow.Arrow, "_tzfile_transitions", return_value=None)
+        assert arrow.Arrow._transition_table(tzinfo, 2020) == expected
+        assert arrow.Arrow._tzfile_transitions.call_count == 1
+
+    def test_near_transition(self, mocker):
+        mocker.patch.object(arrow.Arrow, "_transition_tables", Cache(8))
+        spy = mocker.spy(arrow.Arrow, "_transition_table")
+        near_transition = arrow.Arrow._near_transition
+
+        tzinfo = ZoneInfo("America/New_York")
+        assert near_transition(datetime(2020, 3, 8, 2, 30, tzinfo=tzinfo))
+        assert not near_transition(datetime(2020, 3, 10, 7, tzinfo=tzinfo))
+        assert not near_transition(datetime(2020, 7, 1, tzinfo=tzinfo))
+        assert near_transition(datetime(2020, 11, 1, 1, 30, fold=1, tzinfo=tzinfo))
+        assert spy.call_count == 1
+
+        assert not near_transition(
+            datetime(2020, 7, 1, tzinfo=ZoneInfo("Asia/Kolkata"))
+        )
+        assert spy.call_count == 2
+
+        # other timezones and years are always near a transition
+        assert near_transition(datetime(2020, 7, 1, tzinfo=tz.tzlocal()))
+        assert near_transition(datetime(9999, 7, 1, tzinfo=tzinfo))
+        assert spy.call_count == 2
+
+    def test_near_transition_size(self, mocker):
+        mocker.patch.object(arrow.Arrow, "_transition_tables", Cache(2))
+        tzinfo = ZoneInfo("Europe/London")
+
+        for year in range(2020, 2025):
+            arrow.Arrow._near_transition(datetime(year, 1, 1, tzinfo=tzinfo))
+        assert list(arrow.Arrow._transition_tables) == [
+            (id(tzinfo), 2023),
+            (id(tzinfo), 2024),
+        ]
+
+    def test_dst_gaps(self, mocker):
+        for tzinfo in [
+            ZoneInfo("US/Pacific"),
+            tz.gettz("US/Pacific"),
+            tz.tzstr("PST8PDT,M3.2.0,M11.1.0"),
+        ]:
+            # the ranges of a tzrange also hold the transitions of the years around
+            gaps = arrow.Arrow._dst_gaps(tzinfo, 2018, 2019)
+            assert [gap for gap in gaps if 2018 <= gap[0].year <= 2019] == [
+                (
+                    datetime(2018, 3, 11, 2, tzinfo=tzinfo),
+                    datetime(2018, 3, 11, 3, tzinfo=tzinfo),
+                ),
+                (
+                    datetime(2019, 3, 10, 2, tzinfo=tzinfo),
+                    datetime(2019, 3, 10, 3, tzinfo=tzinfo),
+                ),
+            ]
+
+        # a transition between the daily samples of a range is bisected
+        tzinfo = ZoneInfo("Australia/Lord_Howe")
+        expected = [
+            (
+                datetime(2019, 10, 6, 2, tzinfo=tzinfo),
+                datetime(2019, 10, 6, 2, 30, tzinfo=tzinfo),
+            )
+        ]
+        assert arrow.Arrow._dst_gaps(tzinfo, 2019, 2019) == expected
+
+        starts, ends = arrow.Arrow._get_transition_table(tzinfo, 2019)
+        mocker.patch.object(
+            arrow.Arrow,
+            "_get_transition_table",
+            return_value=([start - timedelta(hours=5) for start in starts], ends),
+        )
+        assert arrow.Arrow._dst_gaps(tzinfo, 2019, 2019) == expected
+
+    def test_datetime_exists_ambiguous(self):
+        for tzinfo in [
+            ZoneInfo("America/New_York"),
+            tz.gettz("America/New_York"),
+            tz.tzstr("EST5EDT,M3.2.0,M11.1.0"),
+            tz.tzlocal(),
+        ]:
+            for dt in [
+                datetime(2020, 3, 8, 1, 59, tzinfo=tzinfo),
+                datetime(2020, 3, 8, 2, 30, tzinfo=tzinfo),
+                datetime(2020, 3, 8, 3, tzinfo=tzinfo),
+                datetime(2020, 6, 1, 2, 30, tzinfo=tzinfo),
+                datetime(2020, 11, 1, 1, 30, tzinfo=tzinfo),
+                datetime(2020, 11, 1, 1, 30, fold=1, tzinfo=tzinfo),
+                datetime(2020, 11, 1, 2, tzinfo=tzinfo),
+            ]:
+                assert arrow.Arrow._datetime_exists(dt) == tz.datetime_exists(dt)
+                assert arrow.Arrow._datetime_ambiguous(dt) == tz.datetime_ambiguous(dt)
+                assert arrow.Arrow._resolve_imaginary(dt) == tz.resolve_imaginary(dt)
+
     def test_get_iteration_params(self):
         assert arrow.Arrow._get_iteration_params("end", None) == ("end", sys.maxsize)
         assert arrow.Arrow._get_iteration_params(None, 100) == (arrow.Arrow.max, 100)
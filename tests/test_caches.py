@@ -0,0 +1,174 @@
+import threading
+from typing import Any
+
+import pytest
+
+import arrow
+from arrow import caches, locales
+from arrow.caches import Cache, CacheInfo
+
+
+class TestCache:
+    def test_get_set(self):
+        cache = Cache(2)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        assert cache.info() == CacheInfo(hits=1, misses=1, size=2, maxsize=2)
+
+        # b is the least recently used entry
+        cache.set("c", 3)
+        assert list(cache) == ["a", "c"]
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_disabled(self):
+        cache = Cache(0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert cache.info() == CacheInfo(hits=0, misses=1, size=0, maxsize=0)
+
+    def test_clear(self):
+        cache = Cache(2)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        assert cache.info() == CacheInfo(hits=0, misses=0, size=0, maxsize=2)
+
+    def test_resize(self):
+        cache = Cache(3)
+        for key in "abc":
+            cache.set(key, key)
+        cache.get("a")
+
+        cache.resize(1)
+        assert list(cache) == ["a"]
+        assert cache.maxsize == 1
+
+        with pytest.raises(ValueError):
+            cache.resize(-1)
+
+        with pytest.raises(ValueError):
+            Cache(-1)
+
+    def test_second_chance(self):
+        cache = Cache(3)
+        for key in "abc":
+            cache.set(key, key)
+
+        # entries looked up since they were last considered for eviction are kept
+        cache.get("a")
+        cache.get("c")
+        cache.set("d", "d")
+        assert list(cache) == ["c", "a", "d"]
+
+        # c was not considered yet
+        cache.set("e", "e")
+        assert list(cache) == ["d", "c", "e"]
+
+    def test_second_chance_bounded(self):
+        cache = Cache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        entries = cache._entries
+
+        class Entries(dict):
+            def pop(self, key: str) -> Any:
+                # other threads keep looking every entry up
+                for entry in self.values():
+                    entry.used = True
+                return super().pop(key)
+
+        cache._entries = Entries(entries)
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+
+    def test_threads(self):
+        cache = Cache(8)
+
+        def use(offset: int) -> None:
+            for i in range(2000):
+                key = (i + offset) % 16
+                if cache.get(key) is None:
+                    cache.set(key, key)
+
+        threads = [threading.Thread(target=use, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 8
+        assert all(cache.get(key) in (None, key) for key in range(16))
+
+    def test_repr(self):
+        assert repr(Cache(2)) == (
+            "<Cache CacheInfo(hits=0, misses=0, size=0, maxsize=2)>"
+        )
+
+
+class TestModule:
+    def test_info(self):
+        info = caches.info()
+
+        assert list(info) == list(caches._DEFAULT_SIZES)
+        assert info["timezones"].maxsize == caches.get_cache("timezones").maxsize
+
+    def test_caches_used(self):
+        assert locales._locale_cache is caches.get_cache("locales")
+        assert arrow.parser.TzinfoParser._tzinfos is caches.get_cache("timezones")
+        assert arrow.Arrow._transition_tables is caches.get_cache("transitions")
+        assert arrow.Arrow._span_memo is caches.get_cache("spans")
+
+    def test_clear(self, mocker):
+        mocker.patch.dict(caches._caches, {"a": Cache(2), "b": Cache(2)}, clear=True)
+        caches.get_cache("a").set("key", 1)
+        caches.get_cache("b").set("key", 1)
+
+        caches.clear("a")
+        assert caches.info() == {
+            "a": CacheInfo(hits=0, misses=0, size=0, maxsize=2),
+            "b": CacheInfo(hits=0, misses=0, size=1, maxsize=2),
+        }
+
+        caches.clear()
+        assert caches.info()["b"].size == 0
+
+    def test_resize(self, mocker):
+        mocker.patch.dict(caches._caches, {"a": Cache(2)}, clear=True)
+
+        caches.resize("a", 8)
+        assert caches.info()["a"].maxsize == 8
+
+    def test_unknown_cache(self):
+        with pytest.raises(ValueError, match="Unknown cache 'nonsense'"):
+            caches.get_cache("nonsense")
+
+        with pytest.raises(ValueError):
+            caches.clear("nonsense")
+
+        with pytest.raises(ValueError):
+            caches.resize("nonsense", 8)
+
+    def test_default_size(self, monkeypatch):
+        assert caches._default_size("patterns") == caches._DEFAULT_SIZES["patterns"]
+
+        monkeypatch.setenv("ARROW_CACHE_PATTERNS_SIZE", "512")
+        assert caches._default_size("patterns") == 512
+
+        monkeypatch.setenv("ARROW_CACHE_PATTERNS_SIZE", "0")
+        assert caches._default_size("patterns") == 0
+
+        # invalid sizes fall back to the default rather than failing the import
+        for value in ["many", "-1"]:
+            monkeypatch.setenv("ARROW_CACHE_PATTERNS_SIZE", value)
+            with pytest.warns(RuntimeWarning, match="ARROW_CACHE_PATTERNS_SIZE"):
+                assert (
+                    caches._default_size("patterns")
+                    == caches._DEFAULT_SIZES["patterns"]
+                )
@@ -393,3 +393,64 @@ class TestNow:
 
     def test_tz_str(self):
         assert_datetime_equality(self.factory.now("EST"), datetime.now(ZoneInfo("EST")))
+
+
+@pytest.mark.usefixtures("arrow_factory")
+class TestResample:
+    def test_resample(self):
+        stream = [(1368082800, 2), (1368083400, 3), (1368090000, 5)]
+
+        assert list(self.factory.resample(stream, "hour", agg="sum")) == [
+            ((Arrow(2013, 5, 9, 7), Arrow(2013, 5, 9, 7, 59, 59, 999999)), 5),
+            ((Arrow(2013, 5, 9, 9), Arrow(2013, 5, 9, 9, 59, 59, 999999)), 5),
+        ]
+
+
+@pytest.mark.usefixtures("arrow_factory")
+class TestFindGaps:
+    def test_find_gaps(self):
+        values = [1368082800, 1368093600]
+
+        assert list(self.factory.find_gaps(values, "hour", end=1368100800)) == [
+            (Arrow(2013, 5, 9, 8), Arrow(2013, 5, 9, 9, 59, 59, 999999)),
+            (Arrow(2013, 5, 9, 11), Arrow(2013, 5, 9, 12, 59, 59, 999999)),
+        ]
+
+
+@pytest.mark.usefixtures("arrow_factory")
+class TestConvertMany:
+    def test_convert_many(self):
+        values = [1368082800, 1368083400]
+
+        assert self.factory.convert_many(values, "US/Pacific") == [
+            Arrow(2013, 5, 9, tzinfo="US/Pacific"),
+            Arrow(2013, 5, 9, 0, 10, tzinfo="US/Pacific"),
+        ]
+        assert self.factory.convert_many(values, "US/Pacific", output="epoch") == [
+            (1368082800.0, -25200),
+            (1368083400.0, -25200),
+        ]
+
+
+@pytest.mark.usefixtures("arrow_factory")
+class TestHumanizeMany:
+    def test_humanize_many(self):
+        values = [1368093600, 1368100800]
+
+        assert self.factory.humanize_many(values, Arrow(2013, 5, 9, 12)) == [
+            "2 hours ago",
+            "just now",
+        ]
+        assert self.factory.humanize_many(
+            values, Arrow(2013, 5, 9, 12), locale="fr", granularity="minute"
+        ) == ["il y a 120 minutes", "dans 0 minutes"]
+
+
+@pytest.mark.usefixtures("arrow_factory")
+class TestWarmup:
+    def test_warmup(self, mocker):
+        mocked = mocker.patch.object(Arrow, "warmup")
+
+        self.factory.warmup(["YYYY"], ["fr"], ["US/Pacific"])
+
+        mocked.assert_called_once_with(["YYYY"], ["fr"], ["US/Pacific"])
@@ -21,6 +21,8 @@ from arrow import (
     FORMAT_RSS,
     FORMAT_W3C,
 )
+from arrow.caches import Cache
+from arrow.formatter import DateTimeFormatter
 
 from .utils import make_full_tz_list
 
@@ -207,6 +209,33 @@ class TestFormatterFormatToken:
 
         # Escaping is atomic: brackets inside brackets are treated literally
         assert self.formatter.format(datetime(1, 1, 1), "[[[ ]]") == "[[ ]"
+        assert self.formatter._format_token(datetime(1, 1, 1), "[at]") == "at"
+
+    def test_compile(self, mocker):
+        mocker.patch.object(DateTimeFormatter, "_compiled_formats", Cache(2))
+
+        compiled = DateTimeFormatter._compile("[at] h:mm[]a ")
+        assert compiled == (
+            ("at", False),
+            (" ", False),
+            ("h", True),
+            (":", False),
+            ("mm", True),
+            ("", False),
+            ("a", True),
+            (" ", False),
+        )
+        assert DateTimeFormatter._compile("[at] h:mm[]a ") is compiled
+        assert DateTimeFormatter._compile("") == ()
+        assert list(DateTimeFormatter._compiled_formats) == ["[at] h:mm[]a ", ""]
+
+        # the format looked up again since it was compiled is kept
+        DateTimeFormatter._compile("YYYY")
+        assert list(DateTimeFormatter._compiled_formats) == ["[at] h:mm[]a ", "YYYY"]
+
+    def test_format_nullable_token(self):
+        # tokens formatted to None are left out
+        assert self.formatter.format(datetime(2012, 1, 1), "YYYY ZZZ") == "2012 "
 
 
 @pytest.mark.usefixtures("arrow_formatter", "time_1975_12_25")
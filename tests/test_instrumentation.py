@@ -0,0 +1,238 @@
+from datetime import datetime
+
+import pytest
+
+import arrow
+from arrow import formatter, instrumentation, parser
+from arrow.parser import ParserError
+
+
+@pytest.fixture
+def calls():
+    reported = []
+
+    def hook(call: instrumentation.Call) -> None:
+        reported.append(call)
+
+    instrumentation.add_hook(hook)
+    yield reported
+    instrumentation.remove_hook(hook)
+
+
+class TestHooks:
+    def test_add_and_remove(self):
+        def hook(call: instrumentation.Call) -> None:
+            pass
+
+        instrumentation.add_hook(hook)
+        instrumentation.add_hook(hook, ["shift"])
+        assert len(instrumentation._hooks) == 2
+
+        # every registration of the hook is removed
+        instrumentation.remove_hook(hook)
+        assert instrumentation._hooks == ()
+
+        with pytest.raises(ValueError):
+            instrumentation.remove_hook(hook)
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="Unknown call 'parse_all'"):
+            instrumentation.add_hook(lambda call: None, ["parse", "parse_all"])
+
+        assert instrumentation._hooks == ()
+
+    def test_names_and_threshold(self):
+        reported = []
+
+        def hook(call: instrumentation.Call) -> None:
+            reported.append(call.name)
+
+        def slow_hook(call: instrumentation.Call) -> None:
+            reported.append(f"slow {call.name}")
+
+        instrumentation.add_hook(hook, ["format"])
+        instrumentation.add_hook(slow_hook, threshold=60)
+        try:
+            arrow.Arrow(2013, 5, 5).shift(days=1).format("YYYY")
+        finally:
+            instrumentation.remove_hook(hook)
+            instrumentation.remove_hook(slow_hook)
+
+        assert reported == ["format"]
+
+    def test_parse(self, calls):
+        dt_parser = parser.DateTimeParser()
+
+        assert dt_parser.parse("2013-05-05", "YYYY-MM-DD") == datetime(2013, 5, 5)
+        assert dt_parser.parse(
+            "05 May 2013", ["YYYY-MM-DD", "DD MMM YYYY"], normalize_whitespace=True
+        ) == datetime(2013, 5, 5)
+
+        [single, multiple] = calls
+        assert single.name == "parse"
+        assert single.args == ("2013-05-05", "YYYY-MM-DD", False)
+        assert single.kwargs == {}
+        assert single.error is None
+        assert single.duration > 0
+        assert (single.attempts, single.cache_misses) == (1, 1)
+
+        # the formats tried are counted, rather than reported
+        assert multiple.args == ("05 May 2013", ["YYYY-MM-DD", "DD MMM YYYY"], True)
+        assert (multiple.attempts, multiple.cache_misses) == (2, 2)
+
+    def test_parse_cached(self, calls):
+        dt_parser = parser.DateTimeParser(cache_size=8)
+
+        dt_parser.parse("2013-05-05", "YYYY-MM-DD")
+        dt_parser.parse("2013-05-05", "YYYY-MM-DD")
+
+        assert [call.cache_misses for call in calls] == [1, 0]
+
+        # patterns generated outside of a call are not counted
+        dt_parser._get_pattern_re("YYYY-MM")
+        assert len(calls) == 2
+
+        # nor are formats tried outside of a call, each parse being reported instead
+        dt_parser._parse_multiformat("2013", ["YYYY"])
+        assert [call.attempts for call in calls[2:]] == [1]
+
+    def test_parse_iso(self, calls):
+        assert arrow.get("2013.5.5") == arrow.Arrow(2013, 5, 5)
+
+        [call] = calls
+        assert call.name == "parse_iso"
+        assert call.args == ("2013.5.5", False)
+        assert call.attempts > 1
+        assert call.cache_misses <= call.attempts
+
+    def test_failure(self, calls):
+        with pytest.raises(ParserError) as raised:
+            arrow.get("nonsense", "YYYY")
+
+        [call] = calls
+        assert call.error is raised.value
+        assert call.attempts == 1
+
+    def test_format(self, calls):
+        dt = datetime(2013, 5, 5)
+
+        assert formatter.DateTimeFormatter().format(dt, "YYYY") == "2013"
+
+        [call] = calls
+        assert call.name == "format"
+        assert call.args == (dt, "YYYY")
+
+    def test_parse_tzinfo(self, calls):
+        arrow.Arrow(2013, 5, 5).to("US/Pacific")
+
+        [call] = calls
+        assert call.name == "parse_tzinfo"
+        assert call.args == ("US/Pacific",)
+
+    def test_arrow_methods(self, calls):
+        arw = arrow.Arrow(2013, 5, 5, 12, 30)
+
+        arw.span("day")
+        arw.shift(hours=1)
+        arw.humanize(arw, granularity="hour")
+
+        assert [call.name for call in calls] == ["span", "shift", "humanize"]
+        assert calls[0].args == (arw, "day", 1, "[)", False, 1)
+        assert calls[1].args == (arw, True)
+        assert calls[1].kwargs == {"hours": 1}
+        assert calls[2].args == (arw, arw, "en-us", False, "hour")
+        assert calls[2].kwargs == {}
+
+    def test_nested_calls(self, calls):
+        arw = arrow.Arrow(2013, 5, 5, 12, 30, tzinfo="US/Pacific")
+        calls.clear()
+
+        # floor and ceil do not call span through its instrumented entry point
+        arw.floor("day")
+        arw.ceil("day")
+        assert calls == []
+
+        # the timezone lookups and shifts of range are part of it
+        list(arrow.Arrow.range("month", arw, limit=3, tz="US/Pacific"))
+        assert [call.name for call in calls] == ["range"]
+
+    def test_hook_calling_arrow(self):
+        reported = []
+
+        def hook(call: instrumentation.Call) -> None:
+            # the calls made by a hook are not reported
+            reported.append((call.name, arrow.utcnow().format("YYYY")))
+            arrow.get("2013-05-05", "YYYY-MM-DD")
+
+        instrumentation.add_hook(hook)
+        try:
+            arrow.get("2013-05-05 12:30", "YYYY-MM-DD HH:mm")
+            list(arrow.Arrow.range("hour", datetime(2013, 5, 5), limit=2))
+        finally:
+            instrumentation.remove_hook(hook)
+
+        assert [name for name, _ in reported] == ["parse", "range"]
+        assert instrumentation._outermost()
+
+    def test_subclass(self, calls):
+        class Custom(arrow.Arrow):
+            pass
+
+        Custom(2013, 5, 5).shift(days=1)
+
+        [call] = calls
+        assert call.name == "shift"
+
+    def test_range(self, calls):
+        start = arrow.Arrow(2013, 5, 5)
+        end = start.shift(hours=2)
+        calls.clear()
+
+        points = arrow.Arrow.range("hour", start, end)
+        assert calls == []
+
+        assert len(list(points)) == 3
+        [call] = calls
+        assert call.name == "range"
+        assert call.args == ("hour", start, end, None, None)
+        assert call.duration > 0
+
+        # closing a range reports it as well
+        points = arrow.Arrow.range("hour", start, end)
+        next(points)
+        points.close()
+        assert len(calls) == 2
+
+    def test_range_failure(self, calls):
+        with pytest.raises(ValueError):
+            list(arrow.Arrow.range("fortnight", datetime(2013, 5, 5)))
+
+        [call] = calls
+        assert isinstance(call.error, ValueError)
+
+    def test_repr(self, calls):
+        arrow.Arrow(2013, 5, 5).format("YYYY")
+
+        assert repr(calls[0]).startswith(
+            "<Call format(datetime.datetime(2013, 5, 5, 0, 0, tzinfo=datetime.timezone.utc), 'YYYY') duration="
+        )
+        assert repr(calls[0]).endswith(" error=None>")
+
+
+class TestCallStats:
+    def test_call_stats(self):
+        stats = instrumentation.CallStats()
+
+        instrumentation.add_hook(stats)
+        try:
+            arrow.get("2013-05-05", "YYYY-MM-DD")
+            arrow.get("2013-05-05", ["MM-DD", "YYYY-MM-DD"])
+            with pytest.raises(ParserError):
+                arrow.get("nonsense", "YYYY")
+        finally:
+            instrumentation.remove_hook(stats)
+
+        assert stats.calls == {"parse": 3}
+        assert stats.failures == {"parse": 1}
+        assert stats.attempts == {"parse": 4}
+        assert 0 < stats.max_time["parse"] <= stats.total_time["parse"]
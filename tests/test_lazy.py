@@ -0,0 +1,211 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import arrow
+from arrow import _lazy, parser
+
+# The modules ``import arrow`` must not execute: arrow's own are deferred until first
+# use, and dateutil's only imported by the functions using them.
+DEFERRED_MODULES = [
+    "arrow.locales",
+    "arrow.parser",
+    "dateutil.relativedelta",
+    "dateutil.rrule",
+    "dateutil.tz",
+]
+
+# The most modules ``import arrow`` may execute, besides those the interpreter loads at
+# startup: 64 on CPython 3.11, most of them from the standard library, and 14 more if
+# dateutil were imported eagerly.  Counting them keeps the budget independent of the
+# speed of the machine; the time of the import itself is checked against
+# benchmarks/cold_start_budget.json, by ``python -m benchmarks cold-start``.
+IMPORT_MODULE_BUDGET = 75
+
+_IMPORT_SCRIPT = """
+import sys
+startup = set(sys.modules)
+import arrow
+from arrow._lazy import _LazyModule
+loaded = [
+    name
+    for name, module in list(sys.modules.items())
+    if not isinstance(module, _LazyModule)
+]
+print(len(set(loaded) - startup))
+print(" ".join(loaded))
+"""
+
+
+@pytest.fixture
+def module_dir(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in list(sys.modules):
+        if name.startswith("lazy_example"):
+            del sys.modules[name]
+
+
+class TestLazyImport:
+    def test_lazy_import(self, module_dir):
+        (module_dir / "lazy_example_counter.py").write_text("count = 0\n")
+        (module_dir / "lazy_example.py").write_text(
+            "import lazy_example_counter\n"
+            "lazy_example_counter.count += 1\n"
+            "value = 42\n"
+        )
+        import lazy_example_counter
+
+        module = _lazy.lazy_import("lazy_example")
+
+        assert sys.modules["lazy_example"] is module
+        assert isinstance(module, _lazy._LazyModule)
+        assert lazy_example_counter.count == 0
+
+        assert module.value == 42
+        assert type(module) is type(sys)
+        assert lazy_example_counter.count == 1
+
+        with pytest.raises(AttributeError):
+            module.missing
+
+        assert _lazy.lazy_import("lazy_example") is module
+        assert lazy_example_counter.count == 1
+
+    def test_lazy_import_submodule(self, module_dir):
+        (module_dir / "lazy_example_pkg").mkdir()
+        (module_dir / "lazy_example_pkg" / "__init__.py").write_text("")
+        (module_dir / "lazy_example_pkg" / "sub.py").write_text("value = 1\n")
+
+        module = _lazy.lazy_import("lazy_example_pkg.sub")
+
+        import lazy_example_pkg
+        import lazy_example_pkg.sub
+
+        assert lazy_example_pkg.sub is module
+        assert isinstance(module, _lazy._LazyModule)
+        assert lazy_example_pkg.sub.value == 1
+
+    def test_lazy_import_missing(self):
+        with pytest.raises(ModuleNotFoundError):
+            _lazy.lazy_import("lazy_example_missing")
+
+    def test_lazy_import_partially_initialized(self, module_dir):
+        (module_dir / "lazy_example.py").write_text(
+            "import sys\n"
+            "try:\n"
+            "    sys.modules[__name__].later\n"
+            "except AttributeError as e:\n"
+            "    error = e\n"
+            "later = 1\n"
+        )
+
+        module = _lazy.lazy_import("lazy_example")
+
+        assert "partially initialized" in str(module.error)
+        assert module.later == 1
+
+    def test_lazy_import_failure(self, module_dir):
+        (module_dir / "lazy_example_counter.py").write_text("fail = True\n")
+        (module_dir / "lazy_example.py").write_text(
+            "import lazy_example_counter\n"
+            "if lazy_example_counter.fail:\n"
+            "    raise RuntimeError\n"
+            "value = 1\n"
+        )
+        import lazy_example_counter
+
+        module = _lazy.lazy_import("lazy_example")
+
+        with pytest.raises(RuntimeError):
+            module.value
+
+        # the next lookup tries again
+        lazy_example_counter.fail = False
+        assert module.value == 1
+
+    def test_lazy_import_threads(self, module_dir):
+        (module_dir / "lazy_example_counter.py").write_text("count = 0\n")
+        (module_dir / "lazy_example.py").write_text(
+            "import time\n"
+            "import lazy_example_counter\n"
+            "lazy_example_counter.count += 1\n"
+            "time.sleep(0.05)\n"
+            "value = 42\n"
+        )
+        import lazy_example_counter
+
+        module = _lazy.lazy_import("lazy_example")
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(module.value)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [42] * 8
+        assert lazy_example_counter.count == 1
+
+    def test_load(self, module_dir):
+        (module_dir / "lazy_example_counter.py").write_text("count = 0\n")
+        (module_dir / "lazy_example.py").write_text(
+            "import lazy_example_counter\n" "lazy_example_counter.count += 1\n"
+        )
+        import lazy_example_counter
+
+        module = _lazy.lazy_import("lazy_example")
+
+        _lazy.load(module)
+        assert type(module) is type(sys)
+        assert lazy_example_counter.count == 1
+
+        _lazy.load(module)
+        assert lazy_example_counter.count == 1
+
+    def test_parser_error(self):
+        assert arrow.ParserError is parser.ParserError
+
+        with pytest.raises(AttributeError):
+            arrow.NonExistentAttribute
+
+
+@pytest.fixture(scope="class")
+def import_arrow():
+    """Imports arrow in a new interpreter, returning the number of modules the import
+    executed and the names of all the modules loaded."""
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(arrow.__file__))
+
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    executed, loaded = output.split("\n", 1)
+    return int(executed), set(loaded.split())
+
+
+class TestImportArrow:
+    def test_deferred_modules(self, import_arrow):
+        _, loaded = import_arrow
+
+        assert "arrow.arrow" in loaded
+        assert not loaded & set(DEFERRED_MODULES)
+
+    def test_module_budget(self, import_arrow):
+        executed, loaded = import_arrow
+
+        assert "arrow.arrow" in loaded
+        assert 0 < executed <= IMPORT_MODULE_BUDGET
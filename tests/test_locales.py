@@ -1,6 +1,9 @@
+import sys
+
 import pytest
 
-from arrow import arrow, locales
+from arrow import arrow, caches, locales
+from arrow.constants import DEHUMANIZE_LOCALES
 
 
 @pytest.mark.usefixtures("lang_locales")
@@ -41,6 +44,27 @@ class TestLocaleValidation:
                 pattern = r"^[a-z]{2}(-[a-z]{2})?(?:-latn|-cyrl)?$"
                 assert re.match(pattern, locale_name)
 
+    def test_locale_registry(self):
+        # the registry matches the names the built-in locales actually register
+        registered = {
+            locale_name: locale_cls.__module__
+            for locale_name, locale_cls in self.locales.items()
+            if locale_cls.__module__.startswith("arrow._locales.")
+        }
+        assert registered == {
+            locale_name: f"arrow._locales.{module}"
+            for locale_name, module in locales._locale_modules.items()
+        }
+
+        for class_name, module in locales._locale_class_modules.items():
+            locale_cls = getattr(locales, class_name)
+            assert locale_cls.__module__ == f"arrow._locales.{module}"
+            assert tuple(locale_cls.names) == (
+                locales._locale_registry[module][class_name]
+            )
+
+        assert DEHUMANIZE_LOCALES <= self.locales.keys()
+
     def test_duplicated_locale_name(self):
         with pytest.raises(LookupError):
 
@@ -86,6 +110,86 @@ class TestModule:
         mock_locale_cls.assert_called_once_with()
         assert result == mock_locale_obj
 
+    def test_duplicated_builtin_locale_name(self):
+        # built-in names are reserved before their locale has been imported
+        with pytest.raises(LookupError):
+
+            class Locale1(locales.Locale):
+                names = ["sw"]
+
+    def test_lazy_import(self, mocker):
+        mocker.patch.dict(sys.modules)
+        for module in list(sys.modules):
+            if module.startswith("arrow._locales."):
+                del sys.modules[module]
+        mocker.patch.dict(
+            locales._locale_map, {"en": locales.EnglishLocale}, clear=True
+        )
+        mocker.patch.dict(locales._locale_instances)
+        mocker.patch.object(locales, "_locale_cache", caches.Cache(256))
+
+        assert locales.get_locale("en").__class__ is locales.EnglishLocale
+        assert not any(m.startswith("arrow._locales.") for m in sys.modules)
+
+        assert locales.get_locale("de_CH").__class__.__name__ == "SwissLocale"
+        assert "arrow._locales.german" in sys.modules
+        assert "arrow._locales.french" not in sys.modules
+
+        assert locales.get_locale_by_class_name("FrenchLocale").names == ["fr", "fr-fr"]
+        assert "arrow._locales.french" in sys.modules
+
+        with pytest.raises(AttributeError):
+            locales.NonExistentLocale
+
+    def test_get_locale_shared(self):
+        locale = locales.get_locale("en_US")
+
+        assert locales.get_locale("en-us") is locale
+        assert locales.get_locale("EN-GB") is locale
+        assert locales.get_locale_by_class_name("EnglishLocale") is locale
+        assert locales.get_locale("fr") is not locale
+
+    def test_get_locale_cached(self, mocker):
+        mocker.patch.object(locales, "_locale_cache", caches.Cache(1))
+
+        locale = locales.get_locale("en_US")
+        assert locales.get_locale("en_US") is locale
+        assert locales._locale_cache.info() == caches.CacheInfo(1, 1, 1, 1)
+
+        with pytest.raises(ValueError):
+            locales.get_locale("xx")
+        assert list(locales._locale_cache) == ["en_US"]
+
+    def test_get_locale_instance_concurrent(self, mocker):
+        mocker.patch.dict(locales._locale_instances, clear=True)
+        shared, created = object(), object()
+
+        def create() -> object:
+            # another thread stores its instance meanwhile
+            locales._locale_instances[locale_cls] = shared
+            return created
+
+        locale_cls = mocker.Mock(side_effect=create)
+
+        assert locales._get_locale_instance(locale_cls) is shared
+
+    def test_lookup_tables(self):
+        locale = locales.get_locale("en")
+
+        assert locale._month_name_to_ordinal["september"] == 9
+        assert locale._month_name_to_ordinal["sep"] == 9
+        assert locale._day_name_to_ordinal["tuesday"] == 2
+        assert locale._day_abbreviation_to_ordinal["tue"] == 2
+        assert locale._meridian_to_am_pm == {
+            "am": "am",
+            "AM": "am",
+            "pm": "pm",
+            "PM": "pm",
+        }
+
+        # the first of a repeated day abbreviation is used
+        assert locales.get_locale("mt")._day_abbreviation_to_ordinal["ħ"] == 4
+
     def test_locales(self):
         assert len(locales._locale_map) > 0
 
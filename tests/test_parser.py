@@ -12,7 +12,8 @@ except ImportError:
     from backports.zoneinfo import ZoneInfo
 
 import arrow
-from arrow import formatter, parser
+from arrow import formatter, locales, parser
+from arrow.caches import Cache, CacheInfo
 from arrow.constants import MAX_TIMESTAMP_US
 from arrow.parser import DateTimeParser, ParserError, ParserMatchError
 
@@ -93,7 +94,7 @@ class TestDateTimeParser:
         )
         self.parser = parser.DateTimeParser(cache_size=0)
         for _ in range(100):
-            self.parser._generate_pattern_re("fmt_a")
+            self.parser._get_pattern_re("fmt_a")
         assert mocked_parser.call_count == 100
 
     def test_parser_1_line_caching(self, mocker):
@@ -101,42 +102,42 @@ class TestDateTimeParser:
         self.parser = parser.DateTimeParser(cache_size=1)
 
         for _ in range(100):
-            self.parser._generate_pattern_re(fmt="fmt_a")
+            self.parser._get_pattern_re("fmt_a")
         assert mocked_parser.call_count == 1
-        assert mocked_parser.call_args_list[0] == mocker.call(fmt="fmt_a")
+        assert mocked_parser.call_args_list[0] == mocker.call("fmt_a")
 
         for _ in range(100):
-            self.parser._generate_pattern_re(fmt="fmt_b")
+            self.parser._get_pattern_re("fmt_b")
         assert mocked_parser.call_count == 2
-        assert mocked_parser.call_args_list[1] == mocker.call(fmt="fmt_b")
+        assert mocked_parser.call_args_list[1] == mocker.call("fmt_b")
 
         for _ in range(100):
-            self.parser._generate_pattern_re(fmt="fmt_a")
+            self.parser._get_pattern_re("fmt_a")
         assert mocked_parser.call_count == 3
-        assert mocked_parser.call_args_list[2] == mocker.call(fmt="fmt_a")
+        assert mocked_parser.call_args_list[2] == mocker.call("fmt_a")
 
     def test_parser_multiple_line_caching(self, mocker):
         mocked_parser = mocker.patch("arrow.parser.DateTimeParser._generate_pattern_re")
         self.parser = parser.DateTimeParser(cache_size=2)
 
         for _ in range(100):
-            self.parser._generate_pattern_re(fmt="fmt_a")
+            self.parser._get_pattern_re("fmt_a")
         assert mocked_parser.call_count == 1
-        assert mocked_parser.call_args_list[0] == mocker.call(fmt="fmt_a")
+        assert mocked_parser.call_args_list[0] == mocker.call("fmt_a")
 
         for _ in range(100):
-            self.parser._generate_pattern_re(fmt="fmt_b")
+            self.parser._get_pattern_re("fmt_b")
         assert mocked_parser.call_count == 2
-        assert mocked_parser.call_args_list[1] == mocker.call(fmt="fmt_b")
+        assert mocked_parser.call_args_list[1] == mocker.call("fmt_b")
 
         # fmt_a and fmt_b are in the cache, so no new calls should be made
         for _ in range(100):
-            self.parser._generate_pattern_re(fmt="fmt_a")
+            self.parser._get_pattern_re("fmt_a")
         for _ in range(100):
-            self.parser._generate_pattern_re(fmt="fmt_b")
+            self.parser._get_pattern_re("fmt_b")
         assert mocked_parser.call_count == 2
-        assert mocked_parser.call_args_list[0] == mocker.call(fmt="fmt_a")
-        assert mocked_parser.call_args_list[1] == mocker.call(fmt="fmt_b")
+        assert mocked_parser.call_args_list[0] == mocker.call("fmt_a")
+        assert mocked_parser.call_args_list[1] == mocker.call("fmt_b")
 
     def test_YY_and_YYYY_format_list(self):
         assert self.parser.parse("15/01/19", ["DD/MM/YY", "DD/MM/YYYY"]) == datetime(
@@ -642,6 +643,19 @@ class TestDateTimeParserParse:
             == expected
         )
 
+    def test_parse_ddd_repeated_abbreviation(self):
+        # Maltese uses "Ħ" for both Thursday and Sunday; the first one wins
+        mt_parser = parser.DateTimeParser("mt")
+
+        assert mt_parser.parse("Ħ 2020", "ddd YYYY") == datetime(2020, 1, 2)
+
+    def test_parse_dddd_case_mismatch(self):
+        # "SALI" matches "Salı" ignoring case, but does not lower() back onto it
+        tr_parser = parser.DateTimeParser("tr")
+
+        with pytest.raises(ParserMatchError):
+            tr_parser.parse("SALI", "dddd")
+
     def test_parse_ddd_and_dddd_then_format(self):
         # Regression test for issue #446
         arw_formatter = formatter.DateTimeFormatter()
@@ -845,6 +859,38 @@ class TestDateTimeParserRegex:
 
         assert result == calendar.month_abbr[1:]
 
+    def test_locale_input_re_map_cached(self, mocker):
+        mocker.patch.object(parser.DateTimeParser, "_locale_input_re_maps", Cache(8))
+        spy = mocker.spy(parser.DateTimeParser, "_generate_choice_re")
+
+        p1 = parser.DateTimeParser("en-us")
+        p2 = parser.DateTimeParser("en_GB")
+        assert spy.call_count == 6
+        assert p1._input_re_map["MMMM"] is p2._input_re_map["MMMM"]
+
+        parser.DateTimeParser("fr")
+        assert spy.call_count == 12
+
+    def test_get_shared(self, mocker):
+        mocker.patch.object(parser.DateTimeParser, "_shared_parsers", Cache(8))
+        mocker.patch.object(parser.DateTimeParser, "_shared_pattern_cache", Cache(8))
+
+        shared = parser.DateTimeParser._get_shared("fr")
+        assert parser.DateTimeParser._get_shared("fr") is shared
+        assert parser.DateTimeParser._get_shared() is not shared
+        assert shared.locale is locales.get_locale("fr")
+
+        # the patterns generated for its formats are cached
+        assert shared._pattern_cache is parser.DateTimeParser._shared_pattern_cache
+        fmt_tokens, fmt_pattern_re = shared._get_pattern_re("DD MMMM YYYY")
+        assert shared._get_pattern_re("DD MMMM YYYY")[1] is fmt_pattern_re
+        assert shared.parse("05 mai 2020", "DD MMMM YYYY") == datetime(2020, 5, 5)
+        assert shared._pattern_cache.info() == CacheInfo(2, 1, 1, 8)
+
+        with pytest.raises(ValueError):
+            parser.DateTimeParser._get_shared("xx")
+        assert "xx" not in parser.DateTimeParser._shared_parsers
+
     def test_digits(self):
         assert parser.DateTimeParser._ONE_OR_TWO_DIGIT_RE.findall("4-56") == ["4", "56"]
         assert parser.DateTimeParser._ONE_OR_TWO_OR_THREE_DIGIT_RE.findall(
@@ -1353,6 +1399,22 @@ class TestTzinfoParser:
         with pytest.raises(parser.ParserError):
             self.parser.parse("fail")
 
+    def test_parse_cached(self, mocker):
+        mocker.patch.object(parser.TzinfoParser, "_tzinfos", Cache(2))
+
+        tzinfo = self.parser.parse("+01:00")
+        assert self.parser.parse("+01:00") is tzinfo
+        assert self.parser.parse("US/Pacific") is ZoneInfo("US/Pacific")
+        assert list(parser.TzinfoParser._tzinfos) == ["+01:00", "US/Pacific"]
+
+        # the timezone looked up again since it was cached is kept
+        self.parser.parse("Europe/Paris")
+        assert list(parser.TzinfoParser._tzinfos) == ["+01:00", "Europe/Paris"]
+
+        # the local timezone can change
+        self.parser.parse("local")
+        assert "local" not in parser.TzinfoParser._tzinfos
+
 
 @pytest.mark.usefixtures("dt_parser")
 class TestDateTimeParserMonthName: